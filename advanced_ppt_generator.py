@@ -7,8 +7,13 @@ Reads data from CSV files and generates PowerPoint presentations with charts and
 import os
 import re
 import json
+import uuid
+import asyncio
+import contextlib
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Callable, List, Optional, Tuple, Iterable
 
 import pandas as pd
 import numpy as np
@@ -23,27 +28,106 @@ import openpyxl
 from openpyxl import load_workbook
 import xlrd
 
-import openai
 from dotenv import load_dotenv
 
+# Optional Arrow-backed reader engine
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN
 from pptx.dml.color import RGBColor
 
+from csv_detection import detect_csv_format, read_csv_kwargs
+from disk_cache import AnalysisStore, FrameCache, ProfileStore, ResponseCache, prefix_fingerprint
+from excel_reader import ExcelSession
+from streaming_profiler import StreamingProfile, RowHashSet, RowReservoir
+from sketches import CategoricalSketch
+from sample_estimates import estimate_intervals
+from stats_kernel import ColumnStatsCache, describe_stats
+from correlation_engine import CorrelationMatrix, correlation_matrix
+from column_analysis import ColumnProfiles, ColumnWorkerPool
+from analysis_graph import LazyAnalysis, PartialAnalysis
+from llm_client import DEFAULT_AI_CONCURRENCY, run_async, shared_async_client, shared_client
+from json_stream import JSONStreamExtractor
+
 # Load environment variables
 load_dotenv()
 
 class CSVPPTGenerator:
+    # Streaming mode reads the CSV in chunks of this many rows
+    STREAM_CHUNK_ROWS = 100_000
+    # Preview mode analyzes a uniform sample of this many rows
+    PREVIEW_SAMPLE_ROWS = 50_000
+    # 'full' analyzes every row, 'stream' profiles CSV files chunk by chunk, 'preview' analyzes a sample,
+    # 'incremental' folds only the rows appended since the last run into a saved streaming profile
+    ANALYSIS_MODES = ['full', 'stream', 'preview', 'incremental']
+    # Bump when the saved streaming profile or chunk cleaning changes so stale incremental state is rebuilt
+    ANALYSIS_STATE_VERSION = 2
+    # Strings treated as missing values during text cleaning
+    NULL_TOKENS = ['nan', 'NaN', 'NULL', 'null', 'None']
+    # Bump when loading/cleaning output changes so stale cached frames are not reused
+    FRAME_CACHE_VERSION = 2
+    # Bump when the analysis contents change so stale stored analyses are not reused
+    ANALYSIS_STORE_VERSION = 2
+    # Column dtypes treated as text: Python-object strings, Arrow-backed strings and categoricals
+    TEXT_DTYPES = ['object', 'string', 'category']
+    # Row rules applied by _clean_data_for_perfect_ppt, with their report labels
+    CLEANING_RULES = {
+        'hash_like_ids': "Removing rows with hash-like IDs",
+        'infinite_values': "Removing rows with infinite values",
+        'future_dates': "Removing rows with unrealistic future dates"
+    }
+    # Text columns with at most this ratio of distinct values are stored as categoricals
+    CATEGORY_MAX_UNIQUE_RATIO = 0.5
+    # Reader backends for CSV and Excel files
+    ENGINES = ['pandas', 'pyarrow']
+    # Rows probed before parsing a whole text column as numbers
+    NUMERIC_PROBE_ROWS = 1000
+    # Column count from which per-column analysis is spread over analysis_workers processes
+    PARALLEL_MIN_COLUMNS = 64
+    # Strongest correlations listed in the data summary sent to the AI
+    SUMMARY_CORRELATIONS = 3
+    # Options and caches a worker process copies from the generator that starts it
+    WORKER_SETTINGS = ['categorical_sketch', 'analysis_workers', 'STREAM_CHUNK_ROWS', 'PREVIEW_SAMPLE_ROWS',
+                       'PARALLEL_MIN_COLUMNS', 'NUMERIC_PROBE_ROWS', 'CATEGORY_MAX_UNIQUE_RATIO',
+                       'frame_cache', 'profile_store', 'analysis_store', 'response_cache']
+    # Chat completion settings for the insights request
+    AI_MODEL = "gpt-3.5-turbo"
+    AI_TEMPERATURE = 0.2
+    AI_MAX_TOKENS = 1500
+
     def __init__(self):
         """Initialize the CSV PPT Generator with OpenAI client"""
         api_key = os.getenv('OPENAI_API_KEY')
         if not api_key or api_key == 'your_openai_api_key_here':
             raise ValueError("Please set your OpenAI API key in the .env file")
-        self.openai_client = openai.OpenAI(api_key=api_key)
+        # Clients are shared per process, so generators reuse one connection pool
+        self.api_key = api_key
+        self.openai_client = shared_client(api_key)
+        self.async_openai_client = None  # None: the shared async client of the running event loop
+        self.ai_concurrency = DEFAULT_AI_CONCURRENCY  # Insight requests in flight at once in batch runs
+        self.stream_ai = False  # Stream the insights response and render each recommended chart as it arrives
+        self.speculative_charts = False  # Render the smart default charts while the insights request is in flight
         sns.set_palette("husl")
         self.data_analysis = {}
         self.charts_created = []
+        self.frame_cache = FrameCache()
+        self.profile_store = ProfileStore()
+        self.analysis_store = AnalysisStore()
+        self.response_cache = ResponseCache()
+        self.analysis_key = None  # Stored-analysis key of the current analysis, if it can be stored
+        self.cleaning_report = {}
+        self.column_stats = ColumnStatsCache()
+        self.categorical_sketch = False  # Approximate distinct counts and top values in bounded memory
+        self.analysis_workers = 1  # Processes for per-column analysis of wide tables
+
+    def worker_settings(self) -> Dict[str, Any]:
+        """This generator's analysis options and caches (directory, size cap, on/off), for a worker's generator"""
+        return {name: getattr(self, name) for name in self.WORKER_SETTINGS}
 
     def detect_file_type(self, file_path: str) -> str:
         """Detect if file is CSV or Excel"""
@@ -55,18 +139,15 @@ class CSVPPTGenerator:
         else:
             raise ValueError(f"Unsupported file format: {file_extension}. Supported formats: .csv, .xlsx, .xls")
     
-    def load_excel_info(self, file_path: str) -> Dict[str, Any]:
+    def load_excel_info(self, file_path: str, session: ExcelSession = None) -> Dict[str, Any]:
         """Get information about Excel file (sheets, named ranges)"""
+        own_session = session is None
+        session = session or ExcelSession(file_path)
         try:
-            # Load workbook to get sheet information
-            wb = load_workbook(file_path, read_only=True)
-            
             sheet_info = {}
-            for sheet_name in wb.sheetnames:
-                ws = wb[sheet_name]
+            for sheet_name in session.sheet_names:
                 # Get sheet dimensions
-                max_row = ws.max_row
-                max_col = ws.max_column
+                max_row, max_col = session.sheet_dimensions(sheet_name)
                 
                 # Check if sheet has data
                 has_data = max_row > 1 or max_col > 1
@@ -75,24 +156,17 @@ class CSVPPTGenerator:
                     'max_row': max_row,
                     'max_col': max_col,
                     'has_data': has_data,
-                    'estimated_records': max_row - 1 if has_data else 0  # Subtract header row
+                    'estimated_records': max_row - 1 if has_data else 0,  # Subtract header row
+                    'dimension_source': session.dimension_source(sheet_name)
                 }
             
             # Get named ranges
             named_ranges = []
             try:
-                for name, definition in wb.defined_names.definedName:
-                    if not definition.is_reserved:
-                        named_ranges.append({
-                            'name': name,
-                            'range': str(definition.value),
-                            'sheet': definition.destinations[0][0] if definition.destinations else 'Unknown'
-                        })
+                named_ranges = session.named_ranges()
             except Exception as e:
                 print(f"Warning: Could not read named ranges: {e}")
             
-            wb.close()
-            
             return {
                 'file_path': file_path,
                 'sheets': sheet_info,
@@ -103,23 +177,53 @@ class CSVPPTGenerator:
             
         except Exception as e:
             raise ValueError(f"Error reading Excel file information: {e}")
+        finally:
+            if own_session:
+                session.close()
     
-    def load_excel_sheet(self, file_path: str, sheet_name: str = None, named_range: str = None) -> pd.DataFrame:
-        """Load specific sheet or named range from Excel file"""
+    def load_excel_sheet(self, file_path: str, sheet_name: str = None, named_range: str = None,
+                         engine: str = 'pandas', session: ExcelSession = None) -> pd.DataFrame:
+        """Load specific sheet or named range from Excel file (cached by file content)"""
+        self._check_engine(engine)
+        cache_key = self._frame_cache_key(file_path, 'excel', sheet=sheet_name, named_range=named_range, engine=engine)
+        df = self._get_cached_frame(cache_key, engine)
+        if df is None:
+            own_session = session is None
+            session = session or ExcelSession(file_path)
+            try:
+                df = self._read_excel_sheet(session, sheet_name, named_range, engine)
+            finally:
+                if own_session:
+                    session.close()
+            self.frame_cache.put(cache_key, df)
+        return df
+    
+    def _read_excel_sheet(self, session: ExcelSession, sheet_name: str = None, named_range: str = None,
+                          engine: str = 'pandas') -> pd.DataFrame:
+        """Read and tidy a sheet or named range from an open Excel workbook"""
         try:
+            # The Arrow engine stores the parsed cells in Arrow-backed dtypes
+            read_kwargs = {'dtype_backend': 'pyarrow'} if engine == 'pyarrow' else {}
             if named_range:
-                # Load specific named range
-                df = pd.read_excel(file_path, sheet_name=sheet_name, usecols=named_range)
-                print(f"📊 Loaded named range '{named_range}' from sheet '{sheet_name}'")
+                # Load only the cells covered by the named range (or A1 range)
+                range_sheet, bounds = session.resolve_range(named_range, sheet_name)
+                df = session.read_range(range_sheet, bounds)
+                if engine == 'pyarrow':
+                    df = df.convert_dtypes(dtype_backend='pyarrow')
+                print(f"📊 Loaded named range '{named_range}' from sheet '{range_sheet}' "
+                      f"({len(df)} rows, {len(df.columns)} columns)")
             elif sheet_name:
                 # Load specific sheet
-                df = pd.read_excel(file_path, sheet_name=sheet_name)
+                df = session.parse(sheet_name, **read_kwargs)
                 print(f"📊 Loaded sheet '{sheet_name}' ({len(df)} rows, {len(df.columns)} columns)")
             else:
                 # Load first sheet by default
-                df = pd.read_excel(file_path, sheet_name=0)
+                df = session.parse(0, **read_kwargs)
                 print(f"📊 Loaded first sheet ({len(df)} rows, {len(df.columns)} columns)")
             
+            if engine == 'pyarrow':
+                df = self._adopt_arrow_dtypes(df)
+            
             # Basic validation
             if df.empty:
                 raise ValueError("The selected sheet/range is empty")
@@ -156,105 +260,700 @@ class CSVPPTGenerator:
         print(f"🎯 Auto-selected sheet: '{best_sheet}' ({sheets[best_sheet]['estimated_records']} estimated records)")
         return best_sheet
     
-    def load_and_analyze_data(self, file_path: str, sheet_name: str = None, named_range: str = None) -> Dict[str, Any]:
+    def load_and_analyze_data(self, file_path: str, sheet_name: str = None, named_range: str = None,
+                              analysis_mode: str = 'full', chunksize: int = None, engine: str = 'pandas',
+                              sample_size: int = None, excel_session: ExcelSession = None) -> Dict[str, Any]:
         """Load and analyze data from CSV or Excel file"""
+        if analysis_mode not in self.ANALYSIS_MODES:
+            raise ValueError(f"Unknown analysis mode '{analysis_mode}'. Choose one of: {', '.join(self.ANALYSIS_MODES)}")
         file_type = self.detect_file_type(file_path)
         
+        # An analysis stored for the same bytes and options replaces the whole load and analysis
+        analysis = self.stored_analysis(file_path, sheet_name, named_range, analysis_mode, chunksize, engine, sample_size)
+        if analysis is not None:
+            return analysis
+        
         if file_type == 'excel':
-            return self.load_and_analyze_excel(file_path, sheet_name, named_range)
+            return self.load_and_analyze_excel(file_path, sheet_name, named_range, engine, analysis_mode, sample_size,
+                                               excel_session, chunksize)
+        else:
+            return self.load_and_analyze_csv(file_path, analysis_mode, chunksize, engine, sample_size)
+    
+    def stored_analysis(self, file_path: str, sheet_name: str = None, named_range: str = None,
+                        analysis_mode: str = 'full', chunksize: int = None, engine: str = 'pandas',
+                        sample_size: int = None) -> Optional[Dict[str, Any]]:
+        """Analysis and chart data saved by an earlier run on the same file content and options, or None.
+        
+        Sets analysis_key, so store_analysis can save the analysis once it has been used.
+        """
+        self.analysis_key = None
+        # Incremental runs keep their own state; hashing a growing file each run would cost more than it saves
+        if analysis_mode == 'incremental' or not (self.analysis_store.enabled and self.frame_cache.enabled):
+            return None
+        self.analysis_key = self.analysis_store.analysis_key(file_path, sheet_name, {
+            'named_range': named_range,
+            'analysis_mode': analysis_mode,
+            'chunksize': chunksize,
+            'engine': engine,
+            'sample_size': sample_size,
+            'categorical_sketch': self.categorical_sketch,
+            'frame_version': self.FRAME_CACHE_VERSION,
+            'version': self.ANALYSIS_STORE_VERSION
+        })
+        stored = self.analysis_store.get(self.analysis_key)
+        if stored is None:
+            return None
+        df = self.frame_cache.get(self._chart_data_key(self.analysis_key), arrow_strings=(engine == 'pyarrow'))
+        if df is None:
+            return None
+        
+        if isinstance(stored, PartialAnalysis):
+            # Metrics the earlier run never read are computed from the saved rows when first read
+            # (the summary's metrics were read by that run's deck, so they are among the saved ones)
+            analysis = self._perform_data_analysis(df, file_path, stored['source_metadata'], evaluate_summary=False)
+            analysis.fill(stored)
         else:
-            return self.load_and_analyze_csv(file_path)
+            analysis = stored
+            self.df = df
+            self.data_analysis = analysis
+        analysis['file_name'] = os.path.basename(file_path)
+        print(f"⚡ Reusing stored analysis: {analysis['shape'][0]:,} rows × {analysis['shape'][1]} columns")
+        return analysis
     
-    def load_and_analyze_excel(self, file_path: str, sheet_name: str = None, named_range: str = None) -> Dict[str, Any]:
+    def store_analysis(self, analysis: Dict[str, Any]):
+        """Save the metrics computed so far and the chart data under analysis_key, for later runs to reuse"""
+        if self.analysis_key is None:
+            return
+        chart_key = self._chart_data_key(self.analysis_key)
+        if self.frame_cache.lookup(chart_key) is not None or self.frame_cache.put(chart_key, self.df):
+            self.analysis_store.put(self.analysis_key, analysis)
+    
+    def _chart_data_key(self, analysis_key: str) -> str:
+        """Frame-cache key of the rows charts are drawn from (the frame or row sample the analysis ran on)"""
+        return self.frame_cache.make_key(analysis_key, 'chart_data')
+    
+    def load_and_analyze_excel(self, file_path: str, sheet_name: str = None, named_range: str = None,
+                               engine: str = 'pandas', analysis_mode: str = 'full', sample_size: int = None,
+                               session: ExcelSession = None, chunksize: int = None) -> Dict[str, Any]:
         """Load Excel file and perform comprehensive analysis"""
+        own_session = session is None
+        session = session or ExcelSession(file_path)
         try:
             # Get Excel file information
-            excel_info = self.load_excel_info(file_path)
+            excel_info = self.load_excel_info(file_path, session)
             print(f"📁 Excel file info: {excel_info['total_sheets']} sheets, {excel_info['sheets_with_data']} with data")
             
-            # If no sheet specified, choose the best one
+            # If no sheet specified, choose the best one; a named range on another sheet takes precedence
             if not sheet_name:
                 sheet_name = self.choose_best_sheet(excel_info)
-            
-            # Load the data
-            df = self.load_excel_sheet(file_path, sheet_name, named_range)
+            if named_range:
+                sheet_name, _ = session.resolve_range(named_range, sheet_name)
             
             # Store Excel-specific metadata
             excel_metadata = {
                 'source_type': 'excel',
                 'source_sheet': sheet_name,
                 'source_named_range': named_range,
-                'excel_info': excel_info
+                'excel_info': excel_info,
+                'analysis_mode': 'full'
             }
             
-            # Perform standard analysis
+            if analysis_mode == 'incremental':
+                print("⚠️  Workbooks are rewritten as a whole, so incremental mode streams the sheet in full")
+                analysis_mode = 'stream'
+            
+            # Stream and preview read the sheet row by row in bounded chunks
+            if analysis_mode in ('stream', 'preview') and named_range:
+                print("⚠️  Named ranges are loaded whole - chunked reading only covers entire sheets")
+            elif analysis_mode == 'stream':
+                return self.stream_and_analyze_excel(session, sheet_name, excel_metadata, chunksize)
+            elif analysis_mode == 'preview':
+                chunks = session.iter_chunks(sheet_name, chunksize or self.STREAM_CHUNK_ROWS)
+                reservoir, population_rows = self._sample_chunks(chunks, sample_size or self.PREVIEW_SAMPLE_ROWS)
+                return self._analyze_preview_sample(reservoir.to_frame(), population_rows, file_path, excel_metadata)
+            
+            # Load the data
+            df = self.load_excel_sheet(file_path, sheet_name, named_range, engine, session)
+            
+            if analysis_mode == 'preview':
+                population_rows = len(df)
+                sample = self._sample_rows(df, sample_size or self.PREVIEW_SAMPLE_ROWS)
+                return self._analyze_preview_sample(sample, population_rows, file_path, excel_metadata)
+            
+            # Perform standard analysis on the compact frame
+            df, compaction = self._compact_dtypes(df)
             analysis = self._perform_data_analysis(df, file_path, excel_metadata)
+            analysis['dtype_compaction'] = compaction
             return analysis
             
         except Exception as e:
             raise ValueError(f"Error loading Excel file: {e}")
-    def load_and_analyze_csv(self, csv_file_path: str) -> Dict[str, Any]:
+        finally:
+            if own_session:
+                session.close()
+    def load_and_analyze_csv(self, csv_file_path: str, analysis_mode: str = 'full', chunksize: int = None,
+                             engine: str = 'pandas', sample_size: int = None) -> Dict[str, Any]:
         """Load CSV file and perform comprehensive analysis with data cleaning"""
+        if analysis_mode == 'stream':
+            return self.stream_and_analyze_csv(csv_file_path, chunksize or self.STREAM_CHUNK_ROWS)
+        if analysis_mode == 'preview':
+            return self.preview_and_analyze_csv(csv_file_path, sample_size, chunksize)
+        if analysis_mode == 'incremental':
+            return self.incremental_analyze_csv(csv_file_path, chunksize)
         try:
             # Load and clean CSV data
-            df = self._load_csv_with_cleaning(csv_file_path)
+            df = self._load_csv_with_cleaning(csv_file_path, engine)
             
             # CSV-specific metadata
             csv_metadata = {
                 'source_type': 'csv',
                 'source_sheet': None,
                 'source_named_range': None,
-                'excel_info': None
+                'excel_info': None,
+                'analysis_mode': 'full'
             }
             
-            # Perform standard analysis
+            # Perform standard analysis on the compact frame
+            df, compaction = self._compact_dtypes(df)
             analysis = self._perform_data_analysis(df, csv_file_path, csv_metadata)
+            analysis['dtype_compaction'] = compaction
             return analysis
             
         except Exception as e:
             raise ValueError(f"Error loading CSV file: {e}")
-    def _clean_data_for_perfect_ppt(self, df: pd.DataFrame) -> pd.DataFrame:
+
+    def stream_and_analyze_csv(self, csv_file_path: str, chunksize: int = None) -> Dict[str, Any]:
+        """Analyze a CSV file chunk by chunk so peak memory depends on the chunk size, not the file size"""
+        chunksize = chunksize or self.STREAM_CHUNK_ROWS
+        try:
+            print(f"🌊 Streaming CSV file in chunks of {chunksize:,} rows: {csv_file_path}")
+            
+            csv_format = self.detect_csv_format(csv_file_path)
+            try:
+                profile = self._profile_csv_chunks(csv_file_path, csv_format, chunksize)
+            except UnicodeDecodeError:
+                # The sample looked like UTF-8 but a later byte was not; latin1 decodes anything
+                print("⚠️  Non-UTF-8 bytes found after the sample - restarting with latin1")
+                csv_format['encoding'] = 'latin1'
+                profile = self._profile_csv_chunks(csv_file_path, csv_format, chunksize)
+            print(f"✅ Successfully streamed with {csv_format['encoding']} encoding")
+            
+            csv_metadata = {
+                'source_type': 'csv',
+                'source_sheet': None,
+                'source_named_range': None,
+                'excel_info': None,
+                'analysis_mode': 'stream',
+                'chunk_size': chunksize
+            }
+            return self._analyze_stream_profile(profile, csv_file_path, csv_metadata)
+            
+        except Exception as e:
+            raise ValueError(f"Error streaming CSV file: {e}")
+    
+    def incremental_analyze_csv(self, csv_file_path: str, chunksize: int = None) -> Dict[str, Any]:
+        """Analyze a CSV that only grows by appended rows, folding just the new bytes into the saved profile.
+
+        Duplicate rows are dropped across the whole file, including between runs, through row hashes kept in
+        the state; stream mode only drops them within a chunk, so the two agree for files of up to one chunk.
+        """
+        chunksize = chunksize or self.STREAM_CHUNK_ROWS
+        try:
+            state_key = self.profile_store.state_key(csv_file_path, {
+                'categorical_sketch': self.categorical_sketch,
+                'version': self.ANALYSIS_STATE_VERSION
+            })
+            file_size = os.path.getsize(csv_file_path)
+            state = self.profile_store.get(state_key)
+            if state is not None and not self.profile_store.covers_prefix(state, csv_file_path):
+                print("🔄 File changed beyond appended rows - rebuilding the saved analysis state")
+                state = None
+            
+            if state is not None:
+                print(f"♻️  Resuming saved analysis of {state['profile'].rows:,} rows; "
+                      f"reading {file_size - state['offset']:,} appended bytes")
+                try:
+                    rows_before = state['profile'].rows
+                    self._fold_appended_rows(csv_file_path, state, chunksize)
+                except UnicodeDecodeError:
+                    print("⚠️  Appended rows are not in the saved encoding - rebuilding the saved analysis state")
+                    state = None
+            if state is None:
+                print(f"🌊 Building analysis state in chunks of {chunksize:,} rows: {csv_file_path}")
+                rows_before = 0
+                state = self._build_csv_state(csv_file_path, chunksize)
+            
+            profile = state['profile']
+            state.update(offset=file_size, fingerprint=prefix_fingerprint(csv_file_path, file_size))
+            self.profile_store.put(state_key, state)
+            
+            csv_metadata = {
+                'source_type': 'csv',
+                'source_sheet': None,
+                'source_named_range': None,
+                'excel_info': None,
+                'analysis_mode': 'incremental',
+                'chunk_size': chunksize,
+                'rows_added': profile.rows - rows_before
+            }
+            return self._analyze_stream_profile(profile, csv_file_path, csv_metadata)
+            
+        except Exception as e:
+            raise ValueError(f"Error analyzing CSV file incrementally: {e}")
+    
+    def _build_csv_state(self, csv_file_path: str, chunksize: int) -> Dict[str, Any]:
+        """Profile the whole CSV as in stream mode, keeping what later runs need to continue"""
+        csv_format = self.detect_csv_format(csv_file_path)
+        for attempt in range(2):
+            profile = StreamingProfile(categorical_sketch=self.categorical_sketch)
+            row_hashes = RowHashSet()
+            try:
+                with pd.read_csv(csv_file_path, chunksize=chunksize, **read_csv_kwargs(csv_format)) as reader:
+                    plan = self._fold_chunks(profile, reader, seen=row_hashes)
+                break
+            except UnicodeDecodeError:
+                if attempt:
+                    raise
+                print("⚠️  Non-UTF-8 bytes found after the sample - restarting with latin1")
+                csv_format['encoding'] = 'latin1'
+        return {'profile': profile, 'plan': plan, 'csv_format': csv_format, 'row_hashes': row_hashes}
+    
+    def _fold_appended_rows(self, csv_file_path: str, state: Dict[str, Any], chunksize: int):
+        """Clean and profile the rows after the saved byte offset with the saved cleaning plan"""
+        if os.path.getsize(csv_file_path) <= state['offset'] or state['plan'] is None:
+            return
+        with open(csv_file_path, 'rb') as f:
+            f.seek(state['offset'])
+            # The header was consumed on the first run; a blank line left by a missing final newline is skipped
+            with pd.read_csv(f, header=None, names=state['plan']['columns'], chunksize=chunksize,
+                             **read_csv_kwargs(state['csv_format'])) as reader:
+                self._fold_chunks(state['profile'], reader, state['plan'], state['row_hashes'])
+    
+    def stream_and_analyze_excel(self, session: ExcelSession, sheet_name: str, metadata: Dict[str, Any],
+                                 chunksize: int = None) -> Dict[str, Any]:
+        """Analyze an Excel sheet chunk by chunk from the read-only row iterator instead of loading it whole"""
+        chunksize = chunksize or self.STREAM_CHUNK_ROWS
+        try:
+            print(f"🌊 Streaming sheet '{sheet_name}' in chunks of {chunksize:,} rows")
+            profile = self._profile_chunks(session.iter_chunks(sheet_name, chunksize))
+            metadata = dict(metadata, analysis_mode='stream', chunk_size=chunksize)
+            return self._analyze_stream_profile(profile, session.file_path, metadata)
+            
+        except Exception as e:
+            raise ValueError(f"Error streaming Excel sheet: {e}")
+    
+    def _analyze_stream_profile(self, profile: StreamingProfile, file_path: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """Check a finished streaming profile and build the analysis from it"""
+        min_rows = 5  # Same minimum as batch cleaning
+        if profile.rows < min_rows:
+            raise ValueError(f"Insufficient data after cleaning. Need at least {min_rows} rows, got {profile.rows}")
+        
+        print(f"📊 Streamed {profile.rows:,} cleaned rows × {len(profile.non_empty_columns())} columns")
+        return self._build_analysis_from_profile(profile, file_path, metadata)
+    
+    def preview_and_analyze_csv(self, csv_file_path: str, sample_size: int = None, chunksize: int = None) -> Dict[str, Any]:
+        """Analyze a uniform reservoir sample of the CSV rows and report confidence intervals for the estimates"""
+        sample_size = sample_size or self.PREVIEW_SAMPLE_ROWS
+        chunksize = chunksize or self.STREAM_CHUNK_ROWS
+        try:
+            print(f"🔭 Previewing CSV file from a {sample_size:,}-row sample: {csv_file_path}")
+            
+            csv_format = self.detect_csv_format(csv_file_path)
+            try:
+                reservoir, population_rows = self._sample_csv_chunks(csv_file_path, csv_format, chunksize, sample_size)
+            except UnicodeDecodeError:
+                print("⚠️  Non-UTF-8 bytes found after the sample - restarting with latin1")
+                csv_format['encoding'] = 'latin1'
+                reservoir, population_rows = self._sample_csv_chunks(csv_file_path, csv_format, chunksize, sample_size)
+            
+            csv_metadata = {
+                'source_type': 'csv',
+                'source_sheet': None,
+                'source_named_range': None,
+                'excel_info': None,
+                'analysis_mode': 'preview'
+            }
+            return self._analyze_preview_sample(reservoir.to_frame(), population_rows, csv_file_path, csv_metadata)
+            
+        except Exception as e:
+            raise ValueError(f"Error previewing CSV file: {e}")
+    
+    def _sample_csv_chunks(self, csv_file_path: str, csv_format: Dict[str, Any], chunksize: int,
+                           sample_size: int) -> Tuple[RowReservoir, int]:
+        """Clean the CSV chunk by chunk (same rules as streaming mode), keeping only a row reservoir"""
+        with pd.read_csv(csv_file_path, chunksize=chunksize, **read_csv_kwargs(csv_format)) as reader:
+            return self._sample_chunks(reader, sample_size)
+    
+    def _sample_chunks(self, chunks: Iterable[pd.DataFrame], sample_size: int) -> Tuple[RowReservoir, int]:
+        """Clean raw chunks (same rules as streaming mode), keeping only a row reservoir and the row count"""
+        reservoir = RowReservoir(sample_size, seed=0)
+        population_rows = 0
+        plan = None
+        for chunk in chunks:
+            if plan is None:
+                plan = self._plan_chunk_cleaning(chunk)
+            chunk = self._clean_csv_chunk(chunk, plan)
+            population_rows += len(chunk)
+            reservoir.update(chunk)
+        return reservoir, population_rows
+    
+    def _sample_rows(self, df: pd.DataFrame, sample_size: int) -> pd.DataFrame:
+        """Uniform sample of rows without replacement, kept in file order"""
+        if len(df) <= sample_size:
+            return df
+        return df.sample(n=sample_size, random_state=0).sort_index()
+    
+    def _analyze_preview_sample(self, sample: pd.DataFrame, population_rows: int, file_path: str,
+                                metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """Run the standard analysis on a row sample and attach confidence intervals for its estimates"""
+        min_rows = 5  # Same minimum as batch cleaning
+        if len(sample) < min_rows:
+            raise ValueError(f"Insufficient data after cleaning. Need at least {min_rows} rows, got {len(sample)}")
+        print(f"📊 Analyzing {len(sample):,} sampled rows of {population_rows:,}")
+        
+        metadata = dict(metadata, analysis_mode='preview', sample_rows=len(sample), population_rows=population_rows)
+        sample, compaction = self._compact_dtypes(sample)
+        analysis = self._perform_data_analysis(sample, file_path, metadata)
+        analysis['dtype_compaction'] = compaction
+        analysis['estimates'] = estimate_intervals(sample, analysis['numeric_columns'], analysis['categorical_columns'],
+                                                   population_rows)
+        return analysis
+    
+    def replace_preview_analysis(self, preview: Dict[str, Any], exact: Dict[str, Any]) -> Dict[str, Any]:
+        """Overwrite a preview analysis in place with the values of a later exact run"""
+        preview.pop('estimates', None)
+        preview.update(exact)
+        self.data_analysis = preview
+        return preview
+    
+    def _profile_csv_chunks(self, csv_file_path: str, csv_format: Dict[str, Any], chunksize: int) -> StreamingProfile:
+        """Read, clean and profile the CSV one chunk at a time"""
+        with pd.read_csv(csv_file_path, chunksize=chunksize, **read_csv_kwargs(csv_format)) as reader:
+            return self._profile_chunks(reader)
+    
+    def _profile_chunks(self, chunks: Iterable[pd.DataFrame]) -> StreamingProfile:
+        """Clean and profile raw chunks one at a time"""
+        profile = StreamingProfile(categorical_sketch=self.categorical_sketch)
+        self._fold_chunks(profile, chunks)
+        return profile
+    
+    def _fold_chunks(self, profile: StreamingProfile, chunks: Iterable[pd.DataFrame],
+                     plan: Dict[str, Any] = None, seen: RowHashSet = None) -> Optional[Dict[str, Any]]:
+        """Clean raw chunks and fold them into a profile, planning from the first chunk unless a plan is given;
+        with seen, rows equal to any row seen before (in this or an earlier chunk) are dropped too"""
+        for chunk in chunks:
+            if plan is None:
+                plan = self._plan_chunk_cleaning(chunk)
+            chunk = self._clean_csv_chunk(chunk, plan)
+            if seen is not None:
+                # Hashed as floats: a column parsed as integers in one chunk may hold floats in another
+                chunk = chunk[seen.add_new(chunk.astype({col: 'float64' for col in plan['numeric_columns']}))]
+            profile.update(chunk)
+        return plan
+    
+    def _plan_chunk_cleaning(self, first_chunk: pd.DataFrame) -> Dict[str, Any]:
+        """Fix column names and types from the first chunk so every chunk is cleaned the same way"""
+        columns = [str(col).strip().replace('\ufeff', '') for col in first_chunk.columns]
+        chunk = first_chunk.copy()
+        chunk.columns = columns
+        
+        date_columns = [col for col in columns if 'date' in col.lower()]
+        numeric_columns = [col for col in chunk.select_dtypes(include=[np.number]).columns if col not in date_columns]
+        text_columns = []
+        for col in chunk.select_dtypes(include=self.TEXT_DTYPES).columns:
+            if col in date_columns:
+                continue
+            # Same rule as batch cleaning: convert if >50% of the values parse as numbers
+            numeric_series = pd.to_numeric(chunk[col].astype(str).str.strip(), errors='coerce')
+            if len(chunk) and numeric_series.notna().sum() / len(chunk) > 0.5:
+                numeric_columns.append(col)
+                print(f"🔢 Streaming {col} as numeric")
+            else:
+                text_columns.append(col)
+        
+        return {
+            'columns': columns,
+            'key_columns': columns[:3],
+            'date_columns': date_columns,
+            'numeric_columns': numeric_columns,
+            'text_columns': text_columns
+        }
+    
+    def _clean_csv_chunk(self, chunk: pd.DataFrame, plan: Dict[str, Any]) -> pd.DataFrame:
+        """Apply the row-local cleaning rules to one chunk"""
+        chunk.columns = plan['columns']
+        
+        # Normalize text and turn empty / null-like strings into missing values
+        for col in plan['text_columns']:
+            present = chunk[col].notna()
+            text = chunk[col].astype(str).str.strip().str.replace(r'\s+', ' ', regex=True)
+            chunk[col] = text.where(present & ~text.isin(['', *self.NULL_TOKENS])).astype(object)
+        
+        chunk = chunk.dropna(how='all')
+        chunk = chunk.dropna(subset=plan['key_columns'])
+        # Duplicates can only be detected within a chunk without holding the whole file
+        chunk = chunk.drop_duplicates()
+        
+        for col in plan['date_columns']:
+            chunk[col] = pd.to_datetime(chunk[col], errors='coerce')
+        for col in plan['numeric_columns']:
+            chunk[col] = pd.to_numeric(chunk[col], errors='coerce')
+        
+        # Row rules from _clean_data_for_perfect_ppt: hash-like IDs, infinities, unrealistic future dates
+        drop = pd.Series(False, index=chunk.index)
+        for col in plan['text_columns']:
+            drop |= chunk[col].str.contains(r'^[0-9a-f]{32}$', regex=True, na=False)
+        if plan['numeric_columns']:
+            drop |= np.isinf(chunk[plan['numeric_columns']].to_numpy(dtype=float)).any(axis=1)
+        future_threshold = pd.Timestamp.now() + pd.DateOffset(years=5)
+        for col in plan['date_columns']:
+            drop |= chunk[col] > future_threshold
+        
+        return chunk[~drop]
+    
+    def _build_analysis_from_profile(self, profile: StreamingProfile, file_path: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the same analysis dict as _perform_data_analysis from a streaming profile"""
+        try:
+            columns = profile.non_empty_columns()
+            numeric_cols = [col for col in profile.numeric_columns if col in columns]
+            categorical_cols = [col for col in profile.categorical_columns if col in columns]
+            datetime_cols = [col for col in profile.datetime_columns if col in columns]
+            rows = profile.rows
+            
+            missing_info = {col: profile.null_counts[col] for col in columns}
+            data_quality = {
+                "total_missing": sum(missing_info.values()),
+                "missing_percentage_by_column": {col: round(count / rows * 100, 2) for col, count in missing_info.items()},
+                "columns_with_missing": [col for col, count in missing_info.items() if count > 0],
+                "complete_rows": profile.complete_rows,
+                "duplicate_rows": 0  # Duplicates are removed chunk by chunk while streaming
+            }
+            
+            numeric_insights = {}
+            summary_stats = {}
+            for col in numeric_cols:
+                acc = profile.numeric[col]
+                summary_stats[col] = profile.numeric_summary(col)
+                if acc.count > 0:
+                    numeric_insights[col] = {
+                        "mean": acc.mean,
+                        "median": summary_stats[col]['50%'],
+                        "std": acc.std(),
+                        "min": acc.min,
+                        "max": acc.max,
+                        "range": acc.max - acc.min,
+                        "skewness": acc.skew(),
+                        "outliers_count": acc.outlier_count()
+                    }
+            
+            categorical_insights = {}
+            for col in categorical_cols:
+                acc = profile.categorical[col]
+                if acc.count > 0:
+                    categorical_insights[col] = self._categorical_summary(acc)
+            
+            correlations = CorrelationMatrix.empty()
+            strong_correlations = []
+            strong_correlation_count = 0
+            corr_frame = profile.correlation_frame()
+            if corr_frame is not None and len(numeric_cols) >= 2:
+                corr_frame = corr_frame.loc[numeric_cols, numeric_cols]
+                correlations = CorrelationMatrix(numeric_cols, corr_frame.to_numpy())
+                strong_correlations = correlations.strong_pairs()
+                strong_correlation_count = correlations.strong_pair_count()
+            
+            skewness = {col: profile.numeric[col].skew() for col in numeric_cols if profile.numeric[col].count > 3}
+            unique_counts = {col: profile.categorical[col].unique_count() for col in categorical_cols}
+            patterns = self._build_data_patterns(columns, numeric_cols, categorical_cols, skewness, unique_counts, rows)
+            
+            analysis = {
+                "file_name": os.path.basename(file_path),
+                "shape": (rows, len(columns)),
+                "columns": columns,
+                "dtypes": {col: profile.dtypes[col] for col in columns},
+                "missing_values": missing_info,
+                "numeric_columns": numeric_cols,
+                "categorical_columns": categorical_cols,
+                "datetime_columns": datetime_cols,
+                "data_quality": data_quality,
+                "numeric_insights": numeric_insights,
+                "categorical_insights": categorical_insights,
+                "summary_stats": summary_stats,
+                "correlations": correlations,
+                "strong_correlations": strong_correlations,
+                "strong_correlation_count": strong_correlation_count,
+                "data_patterns": patterns,
+                "sample_data": [{col: row[col] for col in columns} for row in profile.head_rows[:3]],
+                "source_metadata": metadata
+            }
+            
+            # Charts are rendered from a bounded uniform sample of the rows
+            self.df = profile.row_sample.to_frame()[columns]
+            self.data_analysis = analysis
+            return analysis
+            
+        except Exception as e:
+            raise ValueError(f"Error building streaming analysis: {e}")
+    
+    def detect_csv_format(self, csv_file_path: str) -> Dict[str, Any]:
+        """Detect encoding, BOM, delimiter and quoting from a bounded byte sample"""
+        csv_format = detect_csv_format(csv_file_path)
+        bom_note = " (with BOM)" if csv_format['has_bom'] else ""
+        print(f"🔎 Detected {csv_format['encoding']}{bom_note}, delimiter {csv_format['delimiter']!r}")
+        return csv_format
+    
+    def _read_csv_once(self, csv_file_path: str, csv_format: Dict[str, Any], engine: str = 'pandas', **kwargs) -> pd.DataFrame:
+        """Parse the CSV with a detected format, falling back to latin1 only if the sample misled us"""
+        if engine == 'pyarrow':
+            # Multi-threaded Arrow parser straight into Arrow-backed columns
+            kwargs.update(engine='pyarrow', dtype_backend='pyarrow')
+        try:
+            df = pd.read_csv(csv_file_path, **read_csv_kwargs(csv_format), **kwargs)
+            # Arrow does not raise on bytes invalid in the encoding: it reads those columns as binary
+            decoded = engine != 'pyarrow' or not any(
+                pa.types.is_binary(dtype.pyarrow_dtype) or pa.types.is_large_binary(dtype.pyarrow_dtype)
+                for dtype in df.dtypes if isinstance(dtype, pd.ArrowDtype))
+        except UnicodeDecodeError:
+            decoded = False
+        if not decoded:
+            print("⚠️  Non-UTF-8 bytes found after the sample - re-reading with latin1")
+            csv_format['encoding'] = 'latin1'
+            df = pd.read_csv(csv_file_path, **read_csv_kwargs(csv_format), **kwargs)
+        print(f"✅ Successfully loaded with {csv_format['encoding']} encoding")
+        if engine == 'pyarrow':
+            df = self._adopt_arrow_dtypes(df)
+        return df
+    
+    def _check_engine(self, engine: str):
+        """Validate a reader engine name and its optional dependency"""
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unsupported engine: {engine}. Supported engines: {', '.join(self.ENGINES)}")
+        if engine == 'pyarrow' and pa is None:
+            raise ValueError("engine='pyarrow' requires the pyarrow package (pip install pyarrow)")
+    
+    def _adopt_arrow_dtypes(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Keep strings Arrow-backed and hand numbers/dates to the NumPy-based analysis as NumPy arrays"""
+        for col in df.columns:
+            dtype = df[col].dtype
+            if not isinstance(dtype, pd.ArrowDtype):
+                continue
+            pa_type = dtype.pyarrow_dtype
+            if pa.types.is_string(pa_type) or pa.types.is_large_string(pa_type):
+                df[col] = df[col].astype(pd.StringDtype('pyarrow'))
+            elif pa.types.is_integer(pa_type) or pa.types.is_floating(pa_type):
+                # Zero-copy for null-free columns; integers with nulls become float like the pandas engine
+                numpy_dtype = dtype.numpy_dtype if not df[col].hasnans else np.float64
+                df[col] = pd.Series(df[col].to_numpy(dtype=numpy_dtype, na_value=np.nan), index=df.index, name=col)
+            elif pa.types.is_timestamp(pa_type) or pa.types.is_date(pa_type):
+                df[col] = pd.to_datetime(df[col].astype('datetime64[ns]'))
+            elif pa.types.is_boolean(pa_type) and not df[col].hasnans:
+                df[col] = df[col].astype(bool)
+            else:
+                df[col] = df[col].astype(object)
+        return df
+    
+    def _text_columns(self, df: pd.DataFrame) -> List[str]:
+        """Columns holding text, whether stored as Python objects or Arrow-backed strings"""
+        return df.select_dtypes(include=self.TEXT_DTYPES).columns.tolist()
+    
+    def _is_text_column(self, series: pd.Series) -> bool:
+        return series.dtype == 'object' or isinstance(series.dtype, (pd.StringDtype, pd.CategoricalDtype))
+    
+    def _as_text(self, series: pd.Series) -> pd.Series:
+        """String values of a text column; Arrow-backed strings skip the per-cell astype(str)"""
+        if isinstance(series.dtype, pd.StringDtype):
+            # Same values astype(str) produces for object columns, where missing becomes 'nan'
+            return series.fillna('nan')
+        return series.astype(str)
+    
+    def _normalize_text(self, series: pd.Series) -> pd.Series:
+        """Remove extra whitespace and replace 'nan'-like strings with actual NaN"""
+        return (self._as_text(series).str.strip().str.replace(r'\s+', ' ', regex=True)
+                .replace(self.NULL_TOKENS, pd.NA))
+    
+    def _evaluate_cleaning_rules(self, df: pd.DataFrame, string_columns: List[str]) -> Dict[str, np.ndarray]:
+        """Evaluate each row-removal rule over all its columns without copying the frame"""
+        masks = {rule: np.zeros(len(df), dtype=bool) for rule in self.CLEANING_RULES}
+        
+        # Placeholder rows with hash-like IDs
+        for col in string_columns:
+            masks['hash_like_ids'] |= df[col].str.contains(r'^[0-9a-f]{32}$', regex=True, na=False).to_numpy(dtype=bool)
+        
+        # Infinite values, checked over the whole float block at once
+        float_cols = df.select_dtypes(include=['floating']).columns
+        if len(float_cols) > 0:
+            masks['infinite_values'] = np.isinf(df[float_cols].to_numpy(dtype=float, na_value=np.nan)).any(axis=1)
+        
+        # Unrealistic future dates
+        future_threshold = pd.Timestamp.now() + pd.DateOffset(years=5)
+        for col in df.select_dtypes(include=['datetime']).columns:
+            masks['future_dates'] |= (df[col] > future_threshold).to_numpy(dtype=bool)
+        
+        return masks
+    
+    def _cap_extreme_values(self, df: pd.DataFrame) -> Dict[str, int]:
+        """Clip numeric columns to mean ± 3 std, computing the bounds for all columns together"""
+        numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
+        if len(numeric_cols) == 0:
+            return {}
+        profiles = self.column_stats.profiles(df, numeric_cols)
+        bounds = {}
+        for col, profile in profiles.items():
+            lower = profile['mean'] - 3 * profile['std']
+            upper = profile['mean'] + 3 * profile['std']
+            # The cached extremes rule out most columns without scanning them
+            if profile['std'] > 0 and (profile['min'] < lower or profile['max'] > upper):
+                bounds[col] = (lower, upper)
+        if not bounds:
+            return {}
+        numeric = df[list(bounds)]
+        lower = pd.Series({col: low for col, (low, _) in bounds.items()})
+        upper = pd.Series({col: high for col, (_, high) in bounds.items()})
+        extreme_counts = ((numeric < lower) | (numeric > upper)).sum()
+        
+        capped = {}
+        for col in bounds:
+            if extreme_counts[col] > 0:
+                print(f"  ⚠️ Capping {extreme_counts[col]} extreme values in {col}")
+                df[col] = df[col].clip(lower=lower[col], upper=upper[col])
+                capped[col] = int(extreme_counts[col])
+        self.column_stats.invalidate(list(capped))
+        return capped
+    
+    def _clean_data_for_perfect_ppt(self, df: pd.DataFrame, text_normalized: bool = False) -> pd.DataFrame:
         """Advanced data cleaning for perfect PPT generation"""
         print("\n🔧 Advanced Data Cleaning for Perfect PPT...")
         
-        # 1. Handle text data quality
+        # 1. Handle text data quality (already done when the loader normalized the columns)
         print("📝 Cleaning text data...")
-        string_columns = df.select_dtypes(include=['object']).columns
-        for col in string_columns:
-            # Remove extra whitespace and normalize case
-            df[col] = df[col].astype(str).str.strip().str.replace(r'\s+', ' ', regex=True)
-            # Replace 'nan' strings with actual NaN
-            df[col] = df[col].replace(['nan', 'NaN', 'NULL', 'null', 'None'], pd.NA)
-            # Remove rows with placeholder values
-            df = df[~df[col].str.contains(r'^[0-9a-f]{32}$', regex=True, na=False)]  # Remove hash-like IDs
-        
-        # 2. Handle numeric data quality
+        string_columns = self._text_columns(df)
+        if not text_normalized:
+            for col in string_columns:
+                df[col] = self._normalize_text(df[col])
+        
+        # 2-3. Evaluate every row rule into one mask and filter the frame once
+        print("🧮 Evaluating row cleaning rules...")
+        rule_masks = self._evaluate_cleaning_rules(df, string_columns)
+        drop_mask = np.zeros(len(df), dtype=bool)
+        for rule, mask in rule_masks.items():
+            drop_mask |= mask
+            if mask.any():
+                print(f"  ⚠️ {self.CLEANING_RULES[rule]}: {int(mask.sum())} rows")
+        rows_before = len(df)
+        if drop_mask.any():
+            # An owned frame, so capping below writes to it rather than to a view of the unfiltered rows
+            df = df[~drop_mask].copy()
+        
+        # Cap extreme values (beyond 3 standard deviations) on the filtered rows
         print("🔢 Cleaning numeric data...")
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
-        for col in numeric_cols:
-            # Remove infinite values
-            df = df[~np.isinf(df[col])]
-            # Cap extreme values (beyond 3 standard deviations)
-            mean_val = df[col].mean()
-            std_val = df[col].std()
-            if std_val > 0:
-                lower_bound = mean_val - 3 * std_val
-                upper_bound = mean_val + 3 * std_val
-                extreme_count = len(df[(df[col] < lower_bound) | (df[col] > upper_bound)])
-                if extreme_count > 0:
-                    print(f"  ⚠️ Capping {extreme_count} extreme values in {col}")
-                    df[col] = df[col].clip(lower=lower_bound, upper=upper_bound)
-        
-        # 3. Handle date/time data quality
-        print("📅 Cleaning date/time data...")
-        datetime_cols = df.select_dtypes(include=['datetime']).columns
-        for col in datetime_cols:
-            # Remove future dates if they seem unrealistic
-            future_threshold = pd.Timestamp.now() + pd.DateOffset(years=5)
-            future_dates = df[col] > future_threshold
-            if future_dates.any():
-                print(f"  ⚠️ Removing {future_dates.sum()} unrealistic future dates in {col}")
-                df = df[~future_dates]
+        capped_values = self._cap_extreme_values(df)
+        
+        self.cleaning_report = {
+            "rows_before": rows_before,
+            "rows_dropped": int(drop_mask.sum()),
+            "rows_dropped_by_rule": {rule: int(mask.sum()) for rule, mask in rule_masks.items()},
+            "capped_values": capped_values
+        }
         
         # 4. Ensure data consistency
         print("🔄 Ensuring data consistency...")
@@ -281,95 +980,165 @@ class CSVPPTGenerator:
         
         return df
     
-    def _load_csv_with_cleaning(self, csv_file_path: str) -> pd.DataFrame:
-        """Load CSV data with comprehensive cleaning for analysis"""
-        try:
-            print(f"🧹 Loading and cleaning CSV file: {csv_file_path}")
+    def _frame_cache_key(self, file_path: str, loader: str, sheet: str = None, **options) -> str:
+        """Cache key for a cleaned frame: file content, sheet/range and cleaning options"""
+        options.update(loader=loader, version=self.FRAME_CACHE_VERSION)
+        return self.frame_cache.frame_key(file_path, sheet, options)
+    
+    def _get_cached_frame(self, cache_key: str, engine: str = 'pandas') -> Optional[pd.DataFrame]:
+        """Memory-map a previously cleaned frame, or None on a cache miss"""
+        df = self.frame_cache.get(cache_key, arrow_strings=(engine == 'pyarrow'))
+        if df is not None:
+            print(f"⚡ Reusing cached cleaned data: {len(df):,} rows × {len(df.columns)} columns")
+        return df
+    
+    def load_cleaned_frame(self, csv_file_path: str, engine: str = 'pandas') -> pd.DataFrame:
+        """Cleaned rows of a CSV file, as the analysis sees them; fills the frame cache for later loads"""
+        return self._load_csv_with_cleaning(csv_file_path, engine)
+    
+    def _load_csv_with_cleaning(self, csv_file_path: str, engine: str = 'pandas') -> pd.DataFrame:
+        """Load cleaned CSV data, reusing the cached frame when the same bytes were cleaned before"""
+        self._check_engine(engine)
+        cache_key = self._frame_cache_key(csv_file_path, 'csv', engine=engine)
+        df = self._get_cached_frame(cache_key, engine)
+        if df is None:
+            df = self._parse_and_clean_csv(csv_file_path, engine)
+            self.frame_cache.put(cache_key, df)
+        return df
+    
+    def _normalize_csv_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Single column-normalization stage: trimming, null tokens, row rules, date and numeric detection.
+        
+        Text columns are factorized once and every string operation runs on their distinct values
+        only; rows are filtered by position and the cleaned frame is assembled once at the end.
+        """
+        text_columns = set(self._text_columns(df))
+        codes, stripped, missing = {}, {}, {}
+        for col in df.columns:
+            if col in text_columns:
+                # Trimmed text with empty strings as NaN, computed per distinct value
+                col_codes, uniques = pd.factorize(df[col], use_na_sentinel=False)
+                values = self._as_text(pd.Series(uniques, dtype=df[col].dtype)).str.strip().replace('', pd.NA)
+                codes[col], stripped[col] = col_codes, values
+                missing[col] = values.isna().to_numpy()[col_codes]
+            else:
+                missing[col] = df[col].isna().to_numpy()
+        
+        # Handle missing values more intelligently
+        print(f"🔍 Missing values before cleaning: {sum(int(m.sum()) for m in missing.values())}")
+        
+        # Drop rows where all values are missing
+        keep = np.zeros(len(df), dtype=bool)
+        for mask in missing.values():
+            keep |= ~mask
+        
+        # Drop columns where all values are missing
+        columns = [col for col in df.columns if not missing[col][keep].all()]
+        
+        # Remove rows with missing values in key columns (keep rows with data in first 3 columns)
+        initial_rows = int(keep.sum())
+        for col in columns[:3]:
+            keep &= ~missing[col]
+        print(f"📉 Rows removed due to missing key data: {initial_rows - int(keep.sum())}")
+        
+        # Remove duplicates, comparing text columns by the codes of their trimmed values
+        positions = np.flatnonzero(keep)
+        row_keys = {}
+        for i, col in enumerate(columns):
+            if col in codes:
+                trimmed_codes, _ = pd.factorize(stripped[col])
+                row_keys[i] = trimmed_codes[codes[col][positions]]
+            else:
+                row_keys[i] = df[col].array.take(positions)
+        duplicates = pd.DataFrame(row_keys).duplicated().to_numpy()
+        positions = positions[~duplicates]
+        print(f"🔄 Duplicate rows removed: {int(duplicates.sum())}")
+        
+        cleaned = {}
+        for col in columns:
+            if col not in codes:
+                values = df[col].array.take(positions)
+                if 'date' in col.lower():
+                    try:
+                        values = pd.to_datetime(pd.Series(values), errors='coerce').array
+                        print(f"📅 Converted {col} to datetime")
+                    except:
+                        pass
+                cleaned[col] = values
+                continue
             
-            # Try different encodings if utf-8 fails
-            encodings = ['utf-8', 'utf-8-sig', 'latin1', 'iso-8859-1']
-            df = None
+            row_codes = codes[col][positions]
+            # Distinct values present in the kept rows, in order of first appearance
+            present = pd.unique(row_codes)
+            lookup = np.empty(len(stripped[col]), dtype=np.intp)
+            lookup[present] = np.arange(len(present))
+            row_positions = lookup[row_codes]
+            values = stripped[col].iloc[present].reset_index(drop=True)
             
-            for encoding in encodings:
+            # Convert date columns if detected
+            if 'date' in col.lower():
                 try:
-                    df = pd.read_csv(csv_file_path, encoding=encoding)
-                    print(f"✅ Successfully loaded with {encoding} encoding")
-                    break
-                except UnicodeDecodeError:
+                    cleaned[col] = pd.to_datetime(pd.Series(values.array.take(row_positions)), errors='coerce').array
+                    print(f"📅 Converted {col} to datetime")
                     continue
+                except:
+                    pass
+            
+            # Try to convert to numeric if it looks like numbers (>50% can be converted)
+            numeric_values = self._detect_numeric_text(values, row_positions)
+            if numeric_values is not None:
+                cleaned[col] = numeric_values.array.take(row_positions)
+                print(f"🔢 Converted {col} to numeric ({int(numeric_values.notna().to_numpy()[row_positions].sum())}/{len(positions)} values)")
+            else:
+                cleaned[col] = self._normalize_text(values).array.take(row_positions)
+        
+        return pd.DataFrame(cleaned, index=df.index[positions], columns=columns)
+    
+    def _detect_numeric_text(self, values: pd.Series, row_positions: np.ndarray) -> Optional[pd.Series]:
+        """Numeric parse of a text column's distinct values if more than half its rows convert, else None"""
+        # Probe a sample of rows first; text columns almost never survive it
+        if len(row_positions) > self.NUMERIC_PROBE_ROWS:
+            probe = np.random.default_rng(0).choice(row_positions, self.NUMERIC_PROBE_ROWS, replace=False)
+            if pd.to_numeric(values.iloc[np.unique(probe)], errors='coerce').isna().all():
+                return None
+        
+        numeric_values = pd.to_numeric(values, errors='coerce')
+        non_na_count = int(numeric_values.notna().to_numpy()[row_positions].sum())
+        if non_na_count == 0 or non_na_count / len(row_positions) <= 0.5:
+            return None
+        return numeric_values
+    
+    def _parse_and_clean_csv(self, csv_file_path: str, engine: str = 'pandas') -> pd.DataFrame:
+        """Load CSV data with comprehensive cleaning for analysis"""
+        try:
+            print(f"🧹 Loading and cleaning CSV file: {csv_file_path}")
             
-            if df is None:
-                raise ValueError("Could not load CSV file with any supported encoding")
+            # Detect encoding and dialect from a byte sample, then parse once
+            csv_format = self.detect_csv_format(csv_file_path)
+            df = self._read_csv_once(csv_file_path, csv_format, engine)
             
             print(f"📊 Original data shape: {df.shape}")
             
             # Clean column names - remove leading/trailing whitespace and BOM
             df.columns = df.columns.str.strip().str.replace('\ufeff', '')
             
-            # Clean string data - remove leading/trailing whitespace
-            string_columns = df.select_dtypes(include=['object']).columns
-            for col in string_columns:
-                df[col] = df[col].astype(str).str.strip()
-                # Replace empty strings with NaN
-                df[col] = df[col].replace('', pd.NA)
-            
-            # Handle missing values more intelligently
-            print(f"🔍 Missing values before cleaning: {df.isnull().sum().sum()}")
-            
-            # Drop rows where all values are missing
-            df = df.dropna(how='all')
-            
-            # Drop columns where all values are missing
-            df = df.dropna(axis=1, how='all')
-            
-            # For critical columns, fill missing values or drop rows
-            # This can be customized based on your data requirements
-            initial_rows = len(df)
-            
-            # Remove rows with missing values in key columns (if any)
-            df = df.dropna(subset=df.columns[:3])  # Keep rows with data in first 3 columns
-            
-            print(f"📉 Rows removed due to missing key data: {initial_rows - len(df)}")
-            
-            # Remove duplicates
-            initial_rows = len(df)
-            df = df.drop_duplicates()
-            duplicates_removed = initial_rows - len(df)
-            print(f"🔄 Duplicate rows removed: {duplicates_removed}")
-            
-            # Convert date columns if detected
-            for col in df.columns:
-                if 'date' in col.lower():
-                    try:
-                        df[col] = pd.to_datetime(df[col], errors='coerce')
-                        print(f"📅 Converted {col} to datetime")
-                    except:
-                        pass
-            
-            # Handle numeric columns
-            for col in df.columns:
-                if df[col].dtype == 'object':
-                    # Try to convert to numeric if it looks like numbers
-                    numeric_series = pd.to_numeric(df[col], errors='coerce')
-                    if not numeric_series.isna().all():
-                        non_na_count = numeric_series.notna().sum()
-                        total_count = len(df)
-                        if non_na_count / total_count > 0.5:  # If >50% can be converted
-                            df[col] = numeric_series
-                            print(f"🔢 Converted {col} to numeric ({non_na_count}/{total_count} values)")
+            # Trim text, drop empty / incomplete / duplicate rows, detect dates and numbers
+            df = self._normalize_csv_columns(df)
             
             # Identify and handle outliers using IQR method
             print("\n🔍 Detecting outliers...")
             outlier_summary = {}
-            for col in df.select_dtypes(include=[np.number]).columns:
-                Q1 = df[col].quantile(0.25)
-                Q3 = df[col].quantile(0.75)
+            numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
+            for i, col in enumerate(numeric_cols):
+                # Quartiles come from the shared cache; removing rows invalidates it for later columns
+                profile = self.column_stats.profiles(df, numeric_cols[i:])[col]
+                Q1 = profile['25%']
+                Q3 = profile['75%']
                 IQR = Q3 - Q1
                 
                 if IQR > 0:  # Only process if there's variation
                     # Count outliers but don't remove them yet
-                    outlier_condition = (df[col] < (Q1 - 1.5 * IQR)) | (df[col] > (Q3 + 1.5 * IQR))
-                    outlier_count = outlier_condition.sum()
+                    outlier_count = profile['outliers_count']
                     outlier_summary[col] = outlier_count
                     
                     if outlier_count > 0:
@@ -377,12 +1146,13 @@ class CSVPPTGenerator:
                         # Only remove outliers if they're excessive (>10% of data)
                         if outlier_count / len(df) > 0.1:
                             print(f"    🗑️  Removing {outlier_count} outliers (>10% of data)")
+                            outlier_condition = (df[col] < (Q1 - 1.5 * IQR)) | (df[col] > (Q3 + 1.5 * IQR))
                             df = df[~outlier_condition]
                         else:
                             print(f"    ✅ Keeping outliers (≤10% of data)")
             
             # Apply advanced cleaning for perfect PPT
-            df = self._clean_data_for_perfect_ppt(df)
+            df = self._clean_data_for_perfect_ppt(df, text_normalized=True)
             
             print(f"\n✅ Final cleaned data shape: {df.shape}")
             
@@ -395,7 +1165,7 @@ class CSVPPTGenerator:
             print(f"  - Total columns: {len(df.columns)}")
             print(f"  - Missing values: {df.isnull().sum().sum()}")
             print(f"  - Numeric columns: {len(df.select_dtypes(include=[np.number]).columns)}")
-            print(f"  - Text columns: {len(df.select_dtypes(include=['object']).columns)}")
+            print(f"  - Text columns: {len(self._text_columns(df))}")
             print(f"  - DateTime columns: {len(df.select_dtypes(include=['datetime']).columns)}")
             
             # Data completeness percentage
@@ -414,101 +1184,107 @@ class CSVPPTGenerator:
         except Exception as e:
             raise ValueError(f"Error cleaning CSV file: {e}")
     
-    def _perform_data_analysis(self, df: pd.DataFrame, file_path: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
-        """Perform comprehensive analysis on loaded data"""
+    def _compact_dtypes(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, Dict[str, Any]]]:
+        """Downcast numbers without losing precision and store low-cardinality text as categoricals"""
+        print("\n🗜️  Compacting column dtypes...")
+        compaction = {}
+        compacted = {}
+        for col in df.columns:
+            series = df[col]
+            candidate = None
+            if pd.api.types.is_integer_dtype(series.dtype) and not isinstance(series.dtype, pd.ArrowDtype):
+                candidate = pd.to_numeric(series, downcast='integer')
+            elif series.dtype == np.float64:
+                as_float32 = series.astype(np.float32)
+                # Only keep float32 when every value survives the round trip exactly
+                if np.array_equal(as_float32.to_numpy(dtype=np.float64), series.to_numpy(), equal_nan=True):
+                    candidate = as_float32
+            elif self._is_text_column(series) and not isinstance(series.dtype, pd.CategoricalDtype):
+                non_null = series.count()
+                if non_null and series.nunique() <= non_null * self.CATEGORY_MAX_UNIQUE_RATIO:
+                    candidate = series.astype('category')
+            
+            if candidate is None or candidate.dtype == series.dtype:
+                continue
+            bytes_before = int(series.memory_usage(deep=True, index=False))
+            bytes_after = int(candidate.memory_usage(deep=True, index=False))
+            if bytes_after >= bytes_before:
+                continue
+            compacted[col] = candidate
+            compaction[col] = {
+                "from": str(series.dtype),
+                "to": str(candidate.dtype),
+                "bytes_before": bytes_before,
+                "bytes_after": bytes_after,
+                "bytes_saved": bytes_before - bytes_after
+            }
+            print(f"  • {col}: {series.dtype} → {candidate.dtype} (saved {(bytes_before - bytes_after) / 1024:,.1f} KB)")
+        
+        if compacted:
+            df = df.copy(deep=False)
+            for col, values in compacted.items():
+                df[col] = values
+        total_saved = sum(info['bytes_saved'] for info in compaction.values())
+        print(f"✅ Compacted {len(compaction)} columns, saved {total_saved / (1024 * 1024):,.2f} MB")
+        return df, compaction
+    
+    def _perform_data_analysis(self, df: pd.DataFrame, file_path: str, metadata: Dict[str, Any],
+                               evaluate_summary: bool = True) -> Dict[str, Any]:
+        """Set up the analysis of loaded data; each metric is computed when first read and then kept.
+
+        The metrics the AI data summary reads are computed here unless evaluate_summary is False: every deck
+        needs them, and a metric that fails should fail the analysis step rather than surface mid-deck.
+        """
         try:
             # Basic information
             numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
-            categorical_cols = df.select_dtypes(include=['object']).columns.tolist()
+            categorical_cols = self._text_columns(df)
             datetime_cols = df.select_dtypes(include=['datetime']).columns.tolist()
             
-            # Advanced analysis
-            missing_info = df.isnull().sum()
-            missing_percentage = (missing_info / len(df) * 100).round(2)
-            
-            # Data quality assessment
-            data_quality = {
-                "total_missing": missing_info.sum(),
-                "missing_percentage_by_column": missing_percentage.to_dict(),
-                "columns_with_missing": missing_info[missing_info > 0].index.tolist(),
-                "complete_rows": len(df.dropna()),
-                "duplicate_rows": df.duplicated().sum()
-            }
-            
-            # Statistical insights for numeric columns
-            numeric_insights = {}
-            if numeric_cols:
-                for col in numeric_cols:
-                    col_data = df[col].dropna()
-                    if len(col_data) > 0:
-                        numeric_insights[col] = {
-                            "mean": col_data.mean(),
-                            "median": col_data.median(),
-                            "std": col_data.std(),
-                            "min": col_data.min(),
-                            "max": col_data.max(),
-                            "range": col_data.max() - col_data.min(),
-                            "skewness": col_data.skew(),
-                            "outliers_count": self._count_outliers(col_data)
-                        }
-            
-            # Categorical insights
-            categorical_insights = {}
-            if categorical_cols:
-                for col in categorical_cols:
-                    col_data = df[col].dropna()
-                    if len(col_data) > 0:
-                        value_counts = col_data.value_counts()
-                        categorical_insights[col] = {
-                            "unique_count": col_data.nunique(),
-                            "most_frequent": value_counts.index[0] if len(value_counts) > 0 else None,
-                            "most_frequent_count": value_counts.iloc[0] if len(value_counts) > 0 else 0,
-                            "distribution": value_counts.head(5).to_dict(),
-                            "concentration": (value_counts.iloc[0] / len(col_data) * 100).round(2) if len(value_counts) > 0 else 0
-                        }
-            
-            # Correlation analysis (enhanced)
-            correlations = {}
-            strong_correlations = []
-            if len(numeric_cols) >= 2:
-                corr_matrix = df[numeric_cols].corr()
-                correlations = corr_matrix.to_dict()
-                
-                # Find strong correlations (>0.7 or <-0.7)
-                for i in range(len(numeric_cols)):
-                    for j in range(i+1, len(numeric_cols)):
-                        corr_val = corr_matrix.iloc[i, j]
-                        if abs(corr_val) > 0.7:
-                            strong_correlations.append({
-                                "var1": numeric_cols[i],
-                                "var2": numeric_cols[j],
-                                "correlation": round(corr_val, 3),
-                                "strength": "strong positive" if corr_val > 0.7 else "strong negative"
-                            })
-            
-            # Data patterns and trends
-            patterns = self._identify_data_patterns(df, numeric_cols, categorical_cols)
+            # Per-column profiling on demand, spread over worker processes for wide tables;
+            # a cache of its own keeps this frame's profiles apart from later frames
+            sketch_rows = self.STREAM_CHUNK_ROWS if self.categorical_sketch else None
+            profiles = ColumnProfiles(df, numeric_cols, categorical_cols, self.column_stats.detach(df),
+                                      sketch_rows, self._column_pool)
             
-            # Create analysis with source metadata
-            analysis = {
+            analysis = LazyAnalysis({
                 "file_name": os.path.basename(file_path),
                 "shape": df.shape,
-                "columns": df.columns.tolist(),
-                "dtypes": df.dtypes.astype(str).to_dict(),
-                "missing_values": missing_info.to_dict(),
+                "columns": df.columns.tolist()
+            })
+            analysis.define("dtypes", lambda a: df.dtypes.astype(str).to_dict())
+            analysis.define("missing_values", lambda a: df.isnull().sum().to_dict())
+            analysis.update({
                 "numeric_columns": numeric_cols,
                 "categorical_columns": categorical_cols,
-                "datetime_columns": datetime_cols,
-                "data_quality": data_quality,
-                "numeric_insights": numeric_insights,
-                "categorical_insights": categorical_insights,
-                "summary_stats": df.describe().to_dict() if numeric_cols else {},
-                "correlations": correlations,
-                "strong_correlations": strong_correlations,
-                "data_patterns": patterns,
-                "sample_data": df.head(3).to_dict('records'),
-                "source_metadata": metadata  # Include Excel/CSV metadata
-            }
+                "datetime_columns": datetime_cols
+            })
+            
+            # Data quality assessment
+            analysis.define("data_quality", lambda a: self._assess_data_quality(df, a))
+            
+            # Statistical insights for columns with values (bounded-memory sketches when categorical_sketch is on)
+            analysis.define("numeric_insights", lambda a: self._column_insights(
+                a, numeric_cols, lambda col: self._numeric_summary(profiles.numeric(col))))
+            analysis.define("categorical_insights", lambda a: self._column_insights(
+                a, categorical_cols, lambda col: self._categorical_summary(profiles.text(col))))
+            analysis.define("summary_stats", lambda a: describe_stats(profiles.all_numeric()))
+            
+            # Correlation analysis (enhanced): one labelled array, strongest pairs first
+            analysis.define("correlations",
+                            lambda a: correlation_matrix(df, numeric_cols) if len(numeric_cols) >= 2
+                            else CorrelationMatrix.empty())
+            analysis.define("strong_correlations", lambda a: a['correlations'].strong_pairs())
+            analysis.define("strong_correlation_count", lambda a: a['correlations'].strong_pair_count())
+            
+            # Data patterns and trends
+            analysis.define("data_patterns", lambda a: self._identify_data_patterns(
+                df, numeric_cols, categorical_cols, profiles, a.subgraph()))
+            analysis.define("sample_data", lambda a: df.head(3).to_dict('records'))
+            analysis["source_metadata"] = metadata  # Include Excel/CSV metadata
+            
+            if evaluate_summary:
+                self._build_comprehensive_data_summary(analysis)
             
             self.df = df
             self.data_analysis = analysis
@@ -517,62 +1293,135 @@ class CSVPPTGenerator:
         except Exception as e:
             raise ValueError(f"Error performing data analysis: {e}")
     
-    def _count_outliers(self, data: pd.Series) -> int:
-        """Count outliers using IQR method"""
-        Q1 = data.quantile(0.25)
-        Q3 = data.quantile(0.75)
-        IQR = Q3 - Q1
-        lower_bound = Q1 - 1.5 * IQR
-        upper_bound = Q3 + 1.5 * IQR
-        outliers = data[(data < lower_bound) | (data > upper_bound)]
-        return len(outliers)
-    
-    def _identify_data_patterns(self, df: pd.DataFrame, numeric_cols: List[str], categorical_cols: List[str]) -> Dict[str, Any]:
-        """Identify interesting patterns in the data"""
-        patterns = {
-            "data_skewness": {},
-            "potential_time_series": [],
-            "high_cardinality_categories": [],
-            "potential_ids": [],
-            "suggested_groupings": []
+    def _assess_data_quality(self, df: pd.DataFrame, analysis: LazyAnalysis) -> LazyAnalysis:
+        """Lazy data quality section; the row-wise scans run only for the entries that are read"""
+        quality = analysis.subgraph()
+        quality.define("total_missing", lambda q: sum(analysis['missing_values'].values()))
+        quality.define("missing_percentage_by_column", lambda q: {
+            col: round(count / len(df) * 100, 2) for col, count in analysis['missing_values'].items()})
+        quality.define("columns_with_missing", lambda q: [
+            col for col, count in analysis['missing_values'].items() if count > 0])
+        # Only columns with missing values can make a row incomplete
+        quality.define("complete_rows", lambda q: int(df[q['columns_with_missing']].notna().all(axis=1).sum()))
+        quality.define("duplicate_rows", lambda q: df.duplicated().sum())
+        return quality
+    
+    def _column_insights(self, analysis: LazyAnalysis, columns: List[str], summarize) -> LazyAnalysis:
+        """Lazy insights section with an entry for each column that has values"""
+        insights = analysis.subgraph()
+        rows = analysis['shape'][0]
+        for col in columns:
+            if analysis['missing_values'][col] < rows:
+                insights.define(col, lambda _, col=col: summarize(col))
+        return insights
+    
+    def _numeric_summary(self, profile: Dict[str, Any]) -> Dict[str, Any]:
+        """numeric_insights entry from a column profile"""
+        return {
+            "mean": profile['mean'],
+            "median": profile['50%'],
+            "std": profile['std'],
+            "min": profile['min'],
+            "max": profile['max'],
+            "range": profile['max'] - profile['min'],
+            "skewness": profile['skewness'],
+            "outliers_count": profile['outliers_count']
         }
-        
-        # Check for skewness in numeric data
-        for col in numeric_cols:
-            col_data = df[col].dropna()
-            if len(col_data) > 3:
-                skew_val = col_data.skew()
-                if abs(skew_val) > 1:
-                    patterns["data_skewness"][col] = {
-                        "skewness": round(skew_val, 3),
-                        "interpretation": "highly skewed" if abs(skew_val) > 2 else "moderately skewed"
-                    }
-        
-        # Check for potential time series columns
-        for col in df.columns:
-            col_lower = col.lower()
-            if any(keyword in col_lower for keyword in ['date', 'time', 'year', 'month', 'day']):
-                patterns["potential_time_series"].append(col)
-        
-        # Check for high cardinality categorical columns (potential IDs)
+    
+    def _identify_data_patterns(self, df: pd.DataFrame, numeric_cols: List[str], categorical_cols: List[str],
+                                profiles: ColumnProfiles, patterns: LazyAnalysis) -> LazyAnalysis:
+        """Identify interesting patterns in the data, each kind computed when first read"""
+        def skewness(p):
+            numeric_profiles = profiles.all_numeric()
+            return self._skewness_patterns({col: profile['skewness'] for col, profile in numeric_profiles.items()
+                                            if profile['count'] > 3})
+        
+        def cardinality(p):
+            unique_counts = {col: summary.unique_count() for col, summary in profiles.all_text().items()}
+            return self._cardinality_patterns(categorical_cols, unique_counts, len(df))
+        
+        patterns.define("data_skewness", skewness)
+        patterns.define("potential_time_series", lambda p: self._time_series_columns(df.columns.tolist()))
+        patterns.define("high_cardinality_categories", lambda p: cardinality(p)[1])
+        patterns.define("potential_ids", lambda p: cardinality(p)[0])
+        patterns.define("suggested_groupings", lambda p: self._suggested_groupings(numeric_cols, categorical_cols))
+        return patterns
+    
+    def _column_pool(self, column_count: int):
+        """Worker pool for per-column analysis, or a null context when the table is narrow or workers is 1"""
+        if self.analysis_workers > 1 and column_count >= self.PARALLEL_MIN_COLUMNS:
+            print(f"⚙️  Profiling {column_count} columns in {self.analysis_workers} worker processes")
+            return ColumnWorkerPool(self.analysis_workers)
+        return contextlib.nullcontext()
+    
+    def _categorical_summary(self, acc) -> Dict[str, Any]:
+        """categorical_insights entry from exact column counts, a streaming frequency table or a sketch"""
+        top_values = acc.top(5)
+        insight = {
+            "unique_count": acc.unique_count(),
+            "most_frequent": top_values.index[0],
+            "most_frequent_count": top_values.iloc[0],
+            "distribution": top_values.to_dict(),
+            "concentration": round(top_values.iloc[0] / acc.count * 100, 2)
+        }
+        if isinstance(acc, CategoricalSketch):
+            bounds = acc.error_bounds(5)
+            insight["approximate"] = not bounds["exact"]
+            insight["error_bounds"] = bounds
+        return insight
+    
+    def _build_data_patterns(self, columns: List[str], numeric_cols: List[str], categorical_cols: List[str],
+                             skewness: Dict[str, float], unique_counts: Dict[str, int], row_count: int) -> Dict[str, Any]:
+        """Turn per-column skewness and cardinality into data patterns"""
+        potential_ids, high_cardinality = self._cardinality_patterns(categorical_cols, unique_counts, row_count)
+        return {
+            "data_skewness": self._skewness_patterns(skewness),
+            "potential_time_series": self._time_series_columns(columns),
+            "high_cardinality_categories": high_cardinality,
+            "potential_ids": potential_ids,
+            "suggested_groupings": self._suggested_groupings(numeric_cols, categorical_cols)
+        }
+    
+    def _skewness_patterns(self, skewness: Dict[str, float]) -> Dict[str, Dict[str, Any]]:
+        """Check for skewness in numeric data"""
+        data_skewness = {}
+        for col, skew_val in skewness.items():
+            if abs(skew_val) > 1:
+                data_skewness[col] = {
+                    "skewness": round(skew_val, 3),
+                    "interpretation": "highly skewed" if abs(skew_val) > 2 else "moderately skewed"
+                }
+        return data_skewness
+    
+    def _time_series_columns(self, columns: List[str]) -> List[str]:
+        """Check for potential time series columns"""
+        return [col for col in columns
+                if any(keyword in col.lower() for keyword in ['date', 'time', 'year', 'month', 'day'])]
+    
+    def _cardinality_patterns(self, categorical_cols: List[str], unique_counts: Dict[str, int],
+                              row_count: int) -> Tuple[List[str], List[str]]:
+        """Check for high cardinality categorical columns (potential IDs first, then other high-cardinality ones)"""
+        potential_ids, high_cardinality = [], []
         for col in categorical_cols:
-            unique_ratio = df[col].nunique() / len(df)
+            unique_ratio = unique_counts[col] / row_count
             if unique_ratio > 0.8:
-                patterns["potential_ids"].append(col)
-            elif df[col].nunique() > 20:
-                patterns["high_cardinality_categories"].append(col)
-        
-        # Suggest meaningful groupings
+                potential_ids.append(col)
+            elif unique_counts[col] > 20:
+                high_cardinality.append(col)
+        return potential_ids, high_cardinality
+    
+    def _suggested_groupings(self, numeric_cols: List[str], categorical_cols: List[str]) -> List[Dict[str, Any]]:
+        """Suggest meaningful groupings"""
+        groupings = []
         if categorical_cols and numeric_cols:
             for cat_col in categorical_cols[:2]:  # Limit to first 2 categorical columns
                 for num_col in numeric_cols[:2]:  # Limit to first 2 numeric columns
-                    patterns["suggested_groupings"].append({
+                    groupings.append({
                         "group_by": cat_col,
                         "analyze": num_col,
                         "chart_type": "bar"
                     })
-        
-        return patterns
+        return groupings
     
     def _build_comprehensive_data_summary(self, analysis: Dict[str, Any]) -> str:
         """Build comprehensive data summary for AI to provide better context"""
@@ -582,6 +1431,10 @@ class CSVPPTGenerator:
         summary_parts.append(f"📊 DATASET OVERVIEW:")
         summary_parts.append(f"• File: {analysis['file_name']}")
         summary_parts.append(f"• Size: {analysis['shape'][0]:,} rows × {analysis['shape'][1]} columns")
+        if analysis.get('estimates'):
+            estimates = analysis['estimates']
+            summary_parts.append(f"• Preview: statistics estimated from {estimates['sample_rows']:,} sampled rows "
+                                 f"of {estimates['population_rows']:,} ({estimates['confidence_level']:.0%} confidence intervals)")
         summary_parts.append(f"• Data Quality: {analysis['data_quality']['complete_rows']:,} complete rows ({(analysis['data_quality']['complete_rows']/analysis['shape'][0]*100):.1f}%)")
         
         if analysis['data_quality']['duplicate_rows'] > 0:
@@ -598,7 +1451,7 @@ class CSVPPTGenerator:
         # Statistical insights for numeric data
         if analysis['numeric_insights']:
             summary_parts.append(f"\n📈 STATISTICAL INSIGHTS:")
-            for col, stats in list(analysis['numeric_insights'].items())[:3]:  # Limit to 3 columns
+            for col, stats in islice(analysis['numeric_insights'].items(), 3):  # Limit to 3 columns
                 summary_parts.append(
                     f"• {col}: mean={stats['mean']:.2f}, range=[{stats['min']:.2f}, {stats['max']:.2f}], "
                     f"std={stats['std']:.2f}, outliers={stats['outliers_count']}"
@@ -609,7 +1462,7 @@ class CSVPPTGenerator:
         # Categorical insights
         if analysis['categorical_insights']:
             summary_parts.append(f"\n📝 CATEGORICAL INSIGHTS:")
-            for col, stats in list(analysis['categorical_insights'].items())[:3]:  # Limit to 3 columns
+            for col, stats in islice(analysis['categorical_insights'].items(), 3):  # Limit to 3 columns
                 summary_parts.append(
                     f"• {col}: {stats['unique_count']} unique values, "
                     f"most frequent='{stats['most_frequent']}' ({stats['concentration']:.1f}%)"
@@ -617,8 +1470,10 @@ class CSVPPTGenerator:
         
         # Correlation insights
         if analysis['strong_correlations']:
-            summary_parts.append(f"\n🔗 CORRELATION INSIGHTS:")
-            for corr in analysis['strong_correlations'][:3]:  # Show top 3 correlations
+            strong = analysis['strong_correlations']
+            shown = strong[:self.SUMMARY_CORRELATIONS]  # Strongest first
+            summary_parts.append(f"\n🔗 CORRELATION INSIGHTS (strongest {len(shown)} of {len(strong)}):")
+            for corr in shown:
                 summary_parts.append(
                     f"• {corr['var1']} ↔ {corr['var2']}: {corr['correlation']} ({corr['strength']})"
                 )
@@ -658,7 +1513,125 @@ class CSVPPTGenerator:
 
     def generate_insights_with_ai(self, analysis: Dict[str, Any]) -> Dict[str, Any]:
         """Generate insights and presentation structure using AI with enhanced context"""
+        request = self._insights_request(analysis)
+        try:
+            # Regenerating a deck for unchanged data sends the same prompt, so its parsed answer is reused
+            cache_key = self.response_cache.request_key(**request)
+            ai_result = self.response_cache.get(cache_key)
+            if ai_result is not None:
+                print("⚡ Reusing cached AI response")
+            else:
+                resp = self.openai_client.chat.completions.create(**request)
+                ai_result = self._parse_ai_response(resp.choices[0].message.content, cache_key)
+                if ai_result is None:
+                    return self._get_fallback_structure(analysis)
+            return self._complete_insights(ai_result, analysis)
+        except Exception as e:
+            print(f"Error getting AI insights: {e}")
+            return self._get_fallback_structure(analysis)
+    
+    def generate_insights_streaming(self, analysis: Dict[str, Any],
+                                    on_chart: Callable[[Dict[str, Any]], None]) -> Dict[str, Any]:
+        """generate_insights_with_ai over a streamed completion: on_chart gets each recommended chart as soon as its JSON object is complete"""
+        request = self._insights_request(analysis)
+        try:
+            cache_key = self.response_cache.request_key(**request)
+            ai_result = self.response_cache.get(cache_key)
+            if ai_result is not None:
+                print("⚡ Reusing cached AI response")
+            else:
+                extractor = JSONStreamExtractor('recommended_charts')
+                for chunk in self.openai_client.chat.completions.create(**request, stream=True):
+                    text = chunk.choices[0].delta.content if chunk.choices else None
+                    if text:
+                        for chart in extractor.feed(text):
+                            on_chart(chart)
+                print("🔍 RAW AI RESPONSE:\n", extractor.text)
+                ai_result = extractor.document()
+                if ai_result is None:
+                    return self._get_fallback_structure(analysis)
+                self.response_cache.put(cache_key, ai_result)
+            return self._complete_insights(ai_result, analysis)
+        except Exception as e:
+            print(f"Error getting AI insights: {e}")
+            return self._get_fallback_structure(analysis)
+    
+    def _generate_insights_and_charts(self, analysis: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[tuple, str]]:
+        """Insights with charts rendered while the AI request is in flight: the smart defaults speculatively,
+        streamed recommendations as they arrive. Returns the structure and the images it can use by chart key.
+
+        An image is reused for a recommended chart of the same type and columns; the title is drawn into
+        the image, so a chart drawn under another title is drawn again with the recommended one.
+        """
+        rendered = {}  # Chart key -> (title drawn, future image path)
+        # pyplot is not thread-safe, so a single thread draws every chart while this one waits on the AI
+        renderer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='chart-render')
+        
+        def render(rec):
+            config = self._recommended_chart_config(rec)
+            key = self._chart_key(config)
+            drawn = rendered.get(key)
+            if drawn is None or drawn[0] != config['title']:
+                if drawn is not None:
+                    drawn[1].cancel()  # Still queued under the old title: skipped
+                rendered[key] = (config['title'], renderer.submit(self.create_chart_from_data, config))
         
+        try:
+            if self.speculative_charts:
+                # They depend only on the analysis, and the structure falls back to them when the AI gives too few
+                for rec in self._get_smart_chart_recommendations(analysis):
+                    render(rec)
+            if self.stream_ai:
+                structure = self.generate_insights_streaming(analysis, render)
+            else:
+                structure = self.generate_insights_with_ai(analysis)
+            wanted = set()
+            for rec in structure.get("recommended_charts", []):
+                render(rec)  # Drawn already unless new or titled differently
+                wanted.add(self._chart_key(self._recommended_chart_config(rec)))
+            for key, (_, future) in rendered.items():
+                if key not in wanted:
+                    future.cancel()  # Not started yet and not asked for: skipped
+        finally:
+            renderer.shutdown(wait=True)
+        # Unused images already drawn are removed with the rest at cleanup
+        return structure, {key: future.result() for key, (_, future) in rendered.items() if key in wanted}
+    
+    async def generate_insights_with_ai_async(self, analysis: Dict[str, Any]) -> Dict[str, Any]:
+        """Async generate_insights_with_ai on the event loop's shared client, so concurrent calls share connections"""
+        # Building the summary may compute lazy metrics, which would stall the event loop
+        request = await asyncio.to_thread(self._insights_request, analysis)
+        try:
+            cache_key = self.response_cache.request_key(**request)
+            ai_result = self.response_cache.get(cache_key)
+            if ai_result is not None:
+                print("⚡ Reusing cached AI response")
+            else:
+                client = self.async_openai_client or shared_async_client(self.api_key)
+                resp = await client.chat.completions.create(**request)
+                ai_result = self._parse_ai_response(resp.choices[0].message.content, cache_key)
+                if ai_result is None:
+                    return self._get_fallback_structure(analysis)
+            return self._complete_insights(ai_result, analysis)
+        except Exception as e:
+            print(f"Error getting AI insights: {e}")
+            return self._get_fallback_structure(analysis)
+    
+    def generate_insights_batch(self, analyses: List[Dict[str, Any]], max_concurrency: int = None) -> List[Dict[str, Any]]:
+        """Insights for many analyses, with at most max_concurrency requests in flight on the shared async client"""
+        return run_async(self._generate_insights_batch(analyses, max_concurrency or self.ai_concurrency))
+    
+    async def _generate_insights_batch(self, analyses: List[Dict[str, Any]], max_concurrency: int) -> List[Dict[str, Any]]:
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def limited(analysis):
+            async with semaphore:
+                return await self.generate_insights_with_ai_async(analysis)
+        
+        return await asyncio.gather(*(limited(analysis) for analysis in analyses))
+    
+    def _insights_request(self, analysis: Dict[str, Any]) -> Dict[str, Any]:
+        """Chat completion request for the insights prompt built from the data summary"""
         # Build comprehensive data summary for AI
         data_summary = self._build_comprehensive_data_summary(analysis)
         print("\n Build comprehensive data summary for AI:\n", data_summary)
@@ -752,43 +1725,45 @@ class CSVPPTGenerator:
             "6. Ensure each chart serves a specific analytical purpose\n"
             "7. Prioritize actionable business insights over basic descriptions"
         )
-        try:
-            resp = self.openai_client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": "You are a data-analyst assistant. Output ONLY valid JSON."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.2,
-                max_tokens=1500
-            )
-            raw = resp.choices[0].message.content
-            print("🔍 RAW AI RESPONSE:\n", raw)
-            match = re.search(r'\{.*\}', raw, re.DOTALL)
-            if not match:
-                return self._get_fallback_structure(analysis)
-            
-            ai_result = json.loads(match.group(0))
-            
-            # Ensure we have multiple chart recommendations
-            if 'recommended_charts' not in ai_result or len(ai_result['recommended_charts']) < 3:
-                print("🔧 AI provided insufficient chart recommendations. Adding smart defaults.")
-                smart_charts = self._get_smart_chart_recommendations(analysis)
-                ai_result['recommended_charts'] = smart_charts
-            
-            # Also ensure we have enough insights
-            if 'insights' not in ai_result or len(ai_result['insights']) < 3:
-                ai_result['insights'] = [
-                    f"Dataset contains {analysis['shape'][0]:,} records across {analysis['shape'][1]} columns",
-                    f"Found {len(analysis['numeric_columns'])} numeric and {len(analysis['categorical_columns'])} categorical variables",
-                    f"Generated {len(ai_result['recommended_charts'])} comprehensive visualizations",
-                    "Analysis reveals key patterns and relationships in the data"
-                ]
-            
-            return ai_result
-        except Exception as e:
-            print(f"Error getting AI insights: {e}")
-            return self._get_fallback_structure(analysis)
+        return {
+            "model": self.AI_MODEL,
+            "messages": [
+                {"role": "system", "content": "You are a data-analyst assistant. Output ONLY valid JSON."},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": self.AI_TEMPERATURE,
+            "max_tokens": self.AI_MAX_TOKENS
+        }
+    
+    def _parse_ai_response(self, raw: str, cache_key: str) -> Optional[Dict[str, Any]]:
+        """JSON object from the response text, cached under cache_key; None if the text holds none"""
+        print("🔍 RAW AI RESPONSE:\n", raw)
+        match = re.search(r'\{.*\}', raw, re.DOTALL)
+        if not match:
+            return None
+        
+        ai_result = json.loads(match.group(0))
+        self.response_cache.put(cache_key, ai_result)
+        return ai_result
+    
+    def _complete_insights(self, ai_result: Dict[str, Any], analysis: Dict[str, Any]) -> Dict[str, Any]:
+        """Top up a parsed AI structure that has too few charts or insights"""
+        # Ensure we have multiple chart recommendations
+        if 'recommended_charts' not in ai_result or len(ai_result['recommended_charts']) < 3:
+            print("🔧 AI provided insufficient chart recommendations. Adding smart defaults.")
+            smart_charts = self._get_smart_chart_recommendations(analysis)
+            ai_result['recommended_charts'] = smart_charts
+        
+        # Also ensure we have enough insights
+        if 'insights' not in ai_result or len(ai_result['insights']) < 3:
+            ai_result['insights'] = [
+                f"Dataset contains {analysis['shape'][0]:,} records across {analysis['shape'][1]} columns",
+                f"Found {len(analysis['numeric_columns'])} numeric and {len(analysis['categorical_columns'])} categorical variables",
+                f"Generated {len(ai_result['recommended_charts'])} comprehensive visualizations",
+                "Analysis reveals key patterns and relationships in the data"
+            ]
+        
+        return ai_result
 
     def _get_smart_chart_recommendations(self, analysis: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Generate smart chart recommendations based on data characteristics"""
@@ -915,7 +1890,7 @@ class CSVPPTGenerator:
                     f"💡 Ready for comprehensive business intelligence and decision support"
                 ], "slide_type": "overview"},
                 {"title": "Key Findings & Insights", "content": [
-                    f"📊 Statistical analysis reveals {len(analysis.get('strong_correlations', []))} significant correlations",
+                    f"📊 Statistical analysis reveals {analysis.get('strong_correlation_count', len(analysis.get('strong_correlations', [])))} significant correlations",
                     f"🔍 Data distribution shows patterns across {len(analysis['categorical_insights'])} key categories",
                     f"📈 Quantitative metrics span from {min([analysis['numeric_insights'][col]['min'] for col in nums[:3]]) if nums else 'N/A'} to {max([analysis['numeric_insights'][col]['max'] for col in nums[:3]]) if nums else 'N/A'}",
                     f"⚠️ Data quality considerations: {sum(analysis['missing_values'].values())} missing values identified",
@@ -977,8 +1952,8 @@ class CSVPPTGenerator:
         
         if x_col and y_col and x_col in self.df.columns and y_col in self.df.columns:
             # Group and aggregate data if needed
-            if self.df[x_col].dtype == 'object':
-                data = self.df.groupby(x_col)[y_col].sum().head(10)
+            if self._is_text_column(self.df[x_col]):
+                data = self.df.groupby(x_col, observed=True)[y_col].sum().head(10)
                 plt.bar(range(len(data)), data.values, color=plt.cm.Set3(range(len(data))))
                 plt.xticks(range(len(data)), data.index, rotation=45)
                 plt.ylabel(y_col)
@@ -1000,8 +1975,9 @@ class CSVPPTGenerator:
         x_col = config.get('x_column')
         
         if x_col and x_col in self.df.columns:
-            if self.df[x_col].dtype == 'object':
-                value_counts = self.df[x_col].value_counts().head(8)
+            if self._is_text_column(self.df[x_col]):
+                value_counts = self.df[x_col].value_counts()
+                value_counts = value_counts[value_counts > 0].head(8)  # Unused categories have zero counts
                 plt.pie(value_counts.values, labels=value_counts.index, autopct='%1.1f%%', startangle=90)
             else:
                 # Create bins for numeric data
@@ -1053,11 +2029,14 @@ class CSVPPTGenerator:
     
     def _create_heatmap_chart(self, config: Dict[str, Any]):
         """Create heatmap from data"""
-        numeric_data = self.df.select_dtypes(include=[np.number])
-        
-        if len(numeric_data.columns) > 1:
-            correlation_matrix = numeric_data.corr()
-            sns.heatmap(correlation_matrix, annot=True, cmap='coolwarm', center=0, square=True)
+        numeric_cols = self.df.select_dtypes(include=[np.number]).columns.tolist()
+        
+        if len(numeric_cols) > 1:
+            # Reuse the matrix computed during analysis when it covers the same columns
+            correlations = self.data_analysis.get('correlations')
+            if not isinstance(correlations, CorrelationMatrix) or correlations.columns != numeric_cols:
+                correlations = correlation_matrix(self.df, numeric_cols)
+            sns.heatmap(correlations.to_frame(), annot=True, cmap='coolwarm', center=0, square=True)
         else:
             # Create a simple heatmap with data summary
             summary_data = self.df.describe().T
@@ -1116,13 +2095,13 @@ class CSVPPTGenerator:
         
         # Set axis limits if needed to prevent overcrowding
         if x_col and x_col in self.df.select_dtypes(include=[np.number]).columns:
-            x_data = self.df[x_col].dropna()
+            x_data = self.df[x_col].dropna().astype(float)  # Downcast integers would overflow in the subtraction
             x_range = x_data.max() - x_data.min()
             if x_range > 0:
                 plt.xlim(x_data.min() - x_range * 0.05, x_data.max() + x_range * 0.05)
         
         if y_col and y_col in self.df.select_dtypes(include=[np.number]).columns:
-            y_data = self.df[y_col].dropna()
+            y_data = self.df[y_col].dropna().astype(float)  # Downcast integers would overflow in the subtraction
             y_range = y_data.max() - y_data.min()
             if y_range > 0:
                 plt.ylim(y_data.min() - y_range * 0.05, y_data.max() + y_range * 0.05)
@@ -1210,37 +2189,141 @@ class CSVPPTGenerator:
         self.charts_created.append(chart_path)
         return chart_path
 
-    def create_presentation_from_csv(self, file_path: str, output_filename: str = None, sheet_name: str = None, named_range: str = None) -> str:
+    def create_presentation_from_csv(self, file_path: str, output_filename: str = None, sheet_name: str = None, named_range: str = None,
+                                     analysis_mode: str = 'full', chunksize: int = None, engine: str = 'pandas',
+                                     sample_size: int = None) -> str:
         """Complete workflow: analyze CSV/Excel and create presentation"""
         file_type = self.detect_file_type(file_path)
         print(f"📊 Loading and analyzing {file_type.upper()} file: {file_path}")
         
-        # For Excel files, show helpful information
-        if file_type == 'excel' and not sheet_name:
-            try:
-                excel_info = self.load_excel_info(file_path)
-                print(f"📋 Excel file contains {excel_info['total_sheets']} sheets:")
-                for name, info in excel_info['sheets'].items():
-                    status = "✅" if info['has_data'] else "❌"
-                    print(f"  {status} {name}: {info['estimated_records']} rows")
-            except Exception as e:
-                print(f"⚠️  Could not read Excel info: {e}")
-        
-        # Load and analyze data (supports both CSV and Excel)
-        analysis = self.load_and_analyze_data(file_path, sheet_name, named_range)
+        # Excel workbooks are opened once for sheet info, sheet selection and loading
+        excel_session = ExcelSession(file_path) if file_type == 'excel' else None
+        try:
+            # For Excel files, show helpful information
+            if file_type == 'excel' and not sheet_name:
+                try:
+                    excel_info = self.load_excel_info(file_path, excel_session)
+                    print(f"📋 Excel file contains {excel_info['total_sheets']} sheets:")
+                    for name, info in excel_info['sheets'].items():
+                        status = "✅" if info['has_data'] else "❌"
+                        print(f"  {status} {name}: {info['estimated_records']} rows")
+                except Exception as e:
+                    print(f"⚠️  Could not read Excel info: {e}")
+            
+            # Load and analyze data (supports both CSV and Excel)
+            analysis = self.load_and_analyze_data(file_path, sheet_name, named_range, analysis_mode, chunksize, engine,
+                                                  sample_size, excel_session)
+        finally:
+            if excel_session is not None:
+                excel_session.close()
         
 
         print(f"🤖 Generating insights with AI...")
-        structure = self.generate_insights_with_ai(analysis)
+        if self.stream_ai or self.speculative_charts:
+            structure, rendered_charts = self._generate_insights_and_charts(analysis)
+        else:
+            structure, rendered_charts = self.generate_insights_with_ai(analysis), {}
 
         if output_filename is None:
             base = os.path.splitext(analysis["file_name"])[0]
             output_filename = f"{base}_analysis_presentation.pptx"
 
+        prs = self._new_presentation()
+        self._add_structure_slides(prs, structure, rendered_charts)
+
+        prs.save(output_filename)
+        self._cleanup_chart_files()
+        print(f"✅ Presentation saved as: {output_filename}")
+        # Saved after the deck is built, so it holds every metric this run read
+        self.store_analysis(analysis)
+        return output_filename
+
+    def analyze_all_sheets(self, file_path: str, engine: str = 'pandas', analysis_mode: str = 'full',
+                           chunksize: int = None, sample_size: int = None,
+                           max_workers: int = None) -> Dict[str, Tuple[Dict[str, Any], pd.DataFrame]]:
+        """Analyze every sheet with data concurrently; returns {sheet: (analysis, chart data)} in workbook order"""
+        excel_info = self.load_excel_info(file_path)
+        sheets = [name for name, info in excel_info['sheets'].items() if info['has_data']]
+        if not sheets:
+            raise ValueError("No sheets with data found in the workbook")
+        
+        workers = min(max_workers or os.cpu_count() or 1, len(sheets))
+        print(f"🗂️  Analyzing {len(sheets)} sheets with {workers} worker process(es)")
+        
+        results = {}
+        if workers == 1:
+            # One process: share a single opened workbook across all sheets
+            with ExcelSession(file_path) as session:
+                for sheet in sheets:
+                    try:
+                        analysis = self.load_and_analyze_excel(file_path, sheet, None, engine, analysis_mode, sample_size,
+                                                               session, chunksize)
+                        results[sheet] = (analysis, self.df)
+                    except ValueError as e:
+                        print(f"⚠️  Skipping sheet '{sheet}': {e}")
+        else:
+            # Largest sheets start first so the wall time tracks the slowest sheet
+            by_size = sorted(sheets, key=lambda name: excel_info['sheets'][name]['estimated_records'], reverse=True)
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                settings = self.worker_settings()
+                futures = {pool.submit(_analyze_sheet_in_worker, file_path, sheet, engine, analysis_mode, chunksize,
+                                       sample_size, settings): sheet
+                           for sheet in by_size}
+                for future in as_completed(futures):
+                    sheet = futures[future]
+                    try:
+                        results[sheet] = future.result()
+                        print(f"✅ Analyzed sheet '{sheet}'")
+                    except Exception as e:
+                        print(f"⚠️  Skipping sheet '{sheet}': {e}")
+        
+        if not results:
+            raise ValueError("None of the sheets could be analyzed")
+        return {sheet: results[sheet] for sheet in sheets if sheet in results}
+
+    def create_presentation_from_all_sheets(self, file_path: str, output_filename: str = None, engine: str = 'pandas',
+                                            analysis_mode: str = 'full', chunksize: int = None, sample_size: int = None,
+                                            max_workers: int = None) -> str:
+        """Analyze every sheet of a workbook and build one presentation with a section per sheet"""
+        if self.detect_file_type(file_path) != 'excel':
+            raise ValueError("All-sheets mode needs an Excel workbook")
+        print(f"📊 Loading and analyzing every sheet of: {file_path}")
+        sheet_results = self.analyze_all_sheets(file_path, engine, analysis_mode, chunksize, sample_size, max_workers)
+        
+        # AI calls are network-bound, so the sheets' requests run concurrently over the shared async client
+        print(f"🤖 Generating insights with AI for {len(sheet_results)} sheets...")
+        structures = dict(zip(sheet_results, self.generate_insights_batch(
+            [analysis for analysis, _ in sheet_results.values()])))
+        
+        if output_filename is None:
+            base = os.path.splitext(os.path.basename(file_path))[0]
+            output_filename = f"{base}_all_sheets_presentation.pptx"
+        
+        prs = self._new_presentation()
+        sections = []
+        for sheet, (analysis, df) in sheet_results.items():
+            # Slide builders read the current sheet's data and analysis
+            self.df = df
+            self.data_analysis = analysis
+            first_slide = len(prs.slides)
+            self._create_section_slide(prs, sheet, analysis)
+            self._add_structure_slides(prs, structures[sheet])
+            sections.append((sheet, list(prs.slides)[first_slide:]))
+        self._add_slide_sections(prs, sections)
+        
+        prs.save(output_filename)
+        self._cleanup_chart_files()
+        print(f"✅ Presentation with {len(sections)} sheet sections saved as: {output_filename}")
+        return output_filename
+
+    def _new_presentation(self) -> Presentation:
         prs = Presentation()
         prs.slide_width  = Inches(13.33)
         prs.slide_height = Inches(7.5)
+        return prs
 
+    def _add_structure_slides(self, prs: Presentation, structure: Dict[str, Any], rendered_charts: Dict[tuple, str] = None):
+        """Add the slides of an AI presentation structure for the current data; rendered_charts maps chart keys to images drawn earlier"""
         # 1. Core slides (title, overview, chart, insights, etc.)
         for slide in structure.get("slides", []):
             stype = slide.get("slide_type", "content")
@@ -1254,22 +2337,70 @@ class CSVPPTGenerator:
         # 2. If AI succeeded, structure["recommended_charts"] holds multiple specs.
         #    Generate one slide per recommended chart (bar, pie, line, scatter, heatmap, …)
         for rec in structure.get("recommended_charts", []):
+            chart_config = self._recommended_chart_config(rec)
             slide_data = {
                 "title": rec.get("title", ""),
                 "slide_type": "chart",
-                "chart_config": {
-                    "chart_type": rec.get("type", ""),
-                    "x_column": rec.get("x_column"),
-                    "y_column": rec.get("y_column"),
-                    "title": rec.get("title", "")
-                }
+                "chart_config": chart_config
             }
-            self._create_chart_slide(prs, slide_data)
+            chart_path = (rendered_charts or {}).get(self._chart_key(chart_config))
+            self._create_chart_slide(prs, slide_data, chart_path)
 
-        prs.save(output_filename)
-        self._cleanup_chart_files()
-        print(f"✅ Presentation saved as: {output_filename}")
-        return output_filename
+    def _recommended_chart_config(self, rec: Dict[str, Any]) -> Dict[str, Any]:
+        """Chart config for one entry of recommended_charts"""
+        return {
+            "chart_type": rec.get("type", ""),
+            "x_column": rec.get("x_column"),
+            "y_column": rec.get("y_column"),
+            "title": rec.get("title", "")
+        }
+
+    def _chart_key(self, chart_config: Dict[str, Any]) -> tuple:
+        """Identity of a rendered chart: its type and columns"""
+        return chart_config.get('chart_type'), chart_config.get('x_column'), chart_config.get('y_column')
+
+    def _create_section_slide(self, prs: Presentation, sheet_name: str, analysis: Dict[str, Any]):
+        """Divider slide introducing one sheet's section"""
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        
+        title_frame = slide.shapes.add_textbox(Inches(1), Inches(2.5), Inches(11.33), Inches(1.5)).text_frame
+        title_frame.text = f"Sheet: {sheet_name}"
+        title_paragraph = title_frame.paragraphs[0]
+        title_paragraph.font.size = Pt(40)
+        title_paragraph.font.bold = True
+        title_paragraph.font.color.rgb = RGBColor(44, 62, 80)
+        title_paragraph.alignment = PP_ALIGN.CENTER
+        
+        subtitle_frame = slide.shapes.add_textbox(Inches(1), Inches(4.2), Inches(11.33), Inches(1)).text_frame
+        subtitle_frame.text = f"📊 {analysis['shape'][0]:,} rows × {analysis['shape'][1]} columns"
+        subtitle_paragraph = subtitle_frame.paragraphs[0]
+        subtitle_paragraph.font.size = Pt(18)
+        subtitle_paragraph.font.color.rgb = RGBColor(127, 140, 141)
+        subtitle_paragraph.alignment = PP_ALIGN.CENTER
+
+    def _add_slide_sections(self, prs: Presentation, sections: List[Tuple[str, List[Any]]]):
+        """Group slides into named PowerPoint sections (PowerPoint 2010+ section list extension)"""
+        p_ns = 'http://schemas.openxmlformats.org/presentationml/2006/main'
+        p14_ns = 'http://schemas.microsoft.com/office/powerpoint/2010/main'
+        presentation = prs.part._element
+        
+        ext_list = presentation.find(f'{{{p_ns}}}extLst')
+        if ext_list is None:
+            ext_list = presentation.makeelement(f'{{{p_ns}}}extLst', {})
+            presentation.append(ext_list)  # extLst is always the last child of p:presentation
+        ext = presentation.makeelement(f'{{{p_ns}}}ext', {'uri': '{521415D9-36F7-43E2-AB2F-B90AF26B5E84}'})
+        ext_list.append(ext)
+        section_list = ext.makeelement(f'{{{p14_ns}}}sectionLst', {}, nsmap={'p14': p14_ns})
+        ext.append(section_list)
+        
+        for name, slides in sections:
+            section = section_list.makeelement(f'{{{p14_ns}}}section',
+                                               {'name': name, 'id': f'{{{str(uuid.uuid4()).upper()}}}'})
+            section_list.append(section)
+            slide_ids = section.makeelement(f'{{{p14_ns}}}sldIdLst', {})
+            section.append(slide_ids)
+            for slide in slides:
+                slide_ids.append(slide_ids.makeelement(f'{{{p14_ns}}}sldId', {'id': str(slide.slide_id)}))
 
     # ... [the rest of your helper methods: _create_title_slide,
     #      _create_chart_slide, _create_content_slide, _cleanup_chart_files] ...
@@ -1317,8 +2448,8 @@ class CSVPPTGenerator:
             paragraph.alignment = PP_ALIGN.CENTER
             paragraph.space_after = Pt(6)
     
-    def _create_chart_slide(self, prs: Presentation, slide_data: Dict[str, Any]):
-        """Create slide with chart using blank layout to avoid overlaps"""
+    def _create_chart_slide(self, prs: Presentation, slide_data: Dict[str, Any], chart_path: str = None):
+        """Create slide with chart using blank layout to avoid overlaps; chart_path reuses an image already rendered"""
         slide_layout = prs.slide_layouts[6]  # Use blank layout for full control
         slide = prs.slides.add_slide(slide_layout)
         
@@ -1339,8 +2470,8 @@ class CSVPPTGenerator:
         title_paragraph.alignment = PP_ALIGN.CENTER
         
         # Create and add chart with proper spacing from title
-        chart_config = slide_data.get('chart_config', {})
-        chart_path = self.create_chart_from_data(chart_config)
+        if chart_path is None:
+            chart_path = self.create_chart_from_data(slide_data.get('chart_config', {}))
         
         # Add chart image to slide with proper positioning
         slide.shapes.add_picture(chart_path, Inches(0.8), Inches(1.5), Inches(11.73), Inches(5.5))
@@ -1432,18 +2563,63 @@ class CSVPPTGenerator:
         
         self.charts_created = []
 
+def _analyze_sheet_in_worker(file_path: str, sheet_name: str, engine: str, analysis_mode: str,
+                             chunksize: int, sample_size: int,
+                             settings: Dict[str, Any]) -> Tuple[Dict[str, Any], pd.DataFrame]:
+    """Process-pool entry point: analyze one sheet with the parent's settings and return its analysis and chart data"""
+    generator = CSVPPTGenerator()
+    for name, value in settings.items():
+        setattr(generator, name, value)
+    analysis = generator.load_and_analyze_excel(file_path, sheet_name, None, engine, analysis_mode, sample_size,
+                                                chunksize=chunksize)
+    return analysis, generator.df
+
 def main():
     import argparse
     parser = argparse.ArgumentParser(description="Generate PPT from CSV or Excel files")
     parser.add_argument('file', help="Path to the CSV or Excel file")
     parser.add_argument('-o', '--output', help="Output .pptx filename")
     parser.add_argument('-s', '--sheet', help="Excel sheet name (if not specified, auto-selects best sheet)")
-    parser.add_argument('-r', '--range', help="Named range in Excel file (optional)")
+    parser.add_argument('-r', '--range', help="Named range or cell range in Excel file, e.g. Summary or A1:D10 (optional)")
     parser.add_argument('--list-sheets', action='store_true', help="List all sheets in Excel file and exit")
+    parser.add_argument('--all-sheets', action='store_true',
+                        help="Analyze every Excel sheet with data in parallel and build one deck with a section per sheet")
+    parser.add_argument('--workers', type=int, help="Worker processes for --all-sheets (default: CPU count)")
+    parser.add_argument('--mode', choices=CSVPPTGenerator.ANALYSIS_MODES, default='full',
+                        help="Analysis mode: 'full' loads the whole file, 'stream' profiles large CSV files and Excel sheets in bounded chunks, "
+                             "'preview' analyzes a row sample and reports confidence intervals, "
+                             "'incremental' folds only rows appended to a CSV since the last run into saved state "
+                             "(duplicates are dropped across the whole file, not just within a chunk)")
+    parser.add_argument('--chunksize', type=int, help="Rows per chunk in stream and preview mode (default: 100000)")
+    parser.add_argument('--sample-size', type=int, help="Rows sampled in preview mode (default: 50000)")
+    parser.add_argument('--no-cache', action='store_true', help="Do not read or write the cleaned-data, analysis and AI response caches")
+    parser.add_argument('--column-workers', type=int, default=1,
+                        help=f"Worker processes for per-column analysis of tables with at least "
+                             f"{CSVPPTGenerator.PARALLEL_MIN_COLUMNS} columns (default: 1, in-process)")
+    parser.add_argument('--sketch', action='store_true',
+                        help="Profile text columns with bounded-memory sketches (HyperLogLog distinct counts, "
+                             "Space-Saving top values) and report their error bounds")
+    parser.add_argument('--ai-concurrency', type=int, default=DEFAULT_AI_CONCURRENCY,
+                        help=f"AI insight requests in flight at once for --all-sheets (default: {DEFAULT_AI_CONCURRENCY})")
+    parser.add_argument('--stream-ai', action='store_true',
+                        help="Stream the AI response and render each recommended chart while the rest is still generating")
+    parser.add_argument('--speculative-charts', action='store_true',
+                        help="Render the default chart set while waiting for the AI and reuse the charts it also recommends")
+    parser.add_argument('--engine', choices=['pandas', 'pyarrow'], default='pandas',
+                        help="Reader backend: 'pyarrow' parses with multiple threads into Arrow-backed columns")
     args = parser.parse_args()
 
     try:
         gen = CSVPPTGenerator()
+        if args.no_cache:
+            gen.frame_cache.enabled = False
+            gen.analysis_store.enabled = False
+            gen.response_cache.enabled = False
+        gen.categorical_sketch = args.sketch
+        gen.analysis_workers = max(1, args.column_workers)
+        gen.ai_concurrency = max(1, args.ai_concurrency)
+        gen.stream_ai = args.stream_ai
+        gen.speculative_charts = args.speculative_charts
         
         # Special case: just list sheets and exit
         if args.list_sheets:
@@ -1456,7 +2632,8 @@ def main():
                 print("\n📋 Sheet Details:")
                 for sheet_name, info in excel_info['sheets'].items():
                     status = "✅ Has data" if info['has_data'] else "❌ Empty"
-                    print(f"  • {sheet_name}: {info['estimated_records']} rows - {status}")
+                    approx = "~" if info['dimension_source'] == 'estimate' else ""
+                    print(f"  • {sheet_name}: {approx}{info['estimated_records']} rows - {status}")
                 
                 if excel_info['named_ranges']:
                     print("\n🎯 Named Ranges:")
@@ -1469,7 +2646,12 @@ def main():
             return
         
         # Generate presentation
-        gen.create_presentation_from_csv(args.file, args.output, args.sheet, args.range)
+        if args.all_sheets:
+            gen.create_presentation_from_all_sheets(args.file, args.output, args.engine, args.mode, args.chunksize,
+                                                    args.sample_size, args.workers)
+            return
+        gen.create_presentation_from_csv(args.file, args.output, args.sheet, args.range, args.mode, args.chunksize, args.engine,
+                                     args.sample_size)
         
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -0,0 +1,120 @@
+"""
+Analysis Graph
+Lazily evaluated analysis results: named metrics computed on first access and
+memoized, behind the same mapping interface as the analysis dict
+"""
+
+import threading
+from collections.abc import MutableMapping
+from typing import Dict, Any, Callable, Iterator, List
+
+Producer = Callable[['LazyAnalysis'], Any]
+
+
+class PartialAnalysis(dict):
+    """The metrics a LazyAnalysis had computed when it was saved; the others were still pending"""
+
+
+class LazyAnalysis(MutableMapping):
+    """Mapping of metric names to values, where a metric may be a producer run once on first access.
+
+    Producers receive the analysis they belong to, so a metric pulls the other metrics it depends on.
+    Nested graphs made with subgraph() share one lock with their parent, so concurrent readers never
+    compute a metric twice and never wait on each other's locks in opposite orders.
+    """
+
+    def __init__(self, values: Dict[str, Any] = None, lock: threading.RLock = None):
+        self._lock = lock or threading.RLock()
+        self._keys: Dict[str, None] = {}  # Definition order of all metrics, computed or not
+        self._values: Dict[str, Any] = {}
+        self._producers: Dict[str, Producer] = {}
+        for key, value in (values or {}).items():
+            self[key] = value
+
+    def define(self, key: str, producer: Producer):
+        """Add a metric computed by producer(analysis) the first time it is read"""
+        with self._lock:
+            self._values.pop(key, None)
+            self._producers[key] = producer
+            self._keys[key] = None
+
+    def subgraph(self) -> 'LazyAnalysis':
+        """Empty nested graph sharing this graph's lock, for sections whose entries are lazy too"""
+        return LazyAnalysis(lock=self._lock)
+
+    def is_computed(self, key: str) -> bool:
+        return key in self._values
+
+    def pending(self) -> List[str]:
+        """Metrics not computed yet"""
+        return [key for key in self._keys if key not in self._values]
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+        with self._lock:
+            if key in self._values:  # Computed by another thread while this one waited
+                return self._values[key]
+            producer = self._producers[key]
+            try:
+                value = producer(self)
+            except Exception as e:
+                # Re-raised as ValueError so a KeyError inside a producer does not read as a missing metric
+                raise ValueError(f"Error computing analysis metric '{key}': {e}") from e
+            self._values[key] = value
+            del self._producers[key]
+            return value
+
+    def __setitem__(self, key: str, value: Any):
+        with self._lock:
+            self._producers.pop(key, None)
+            self._values[key] = value
+            self._keys[key] = None
+
+    def __delitem__(self, key: str):
+        with self._lock:
+            del self._keys[key]
+            self._values.pop(key, None)
+            self._producers.pop(key, None)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._keys))
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def update(self, other=(), **kwargs):
+        """Like dict.update; metrics still pending in another LazyAnalysis stay lazy and are computed there"""
+        if isinstance(other, LazyAnalysis):
+            for key in other:
+                if other.is_computed(key):
+                    self[key] = other[key]
+                else:
+                    self.define(key, lambda _, key=key, source=other: source[key])
+            other = ()
+        super().update(other, **kwargs)
+
+    def fill(self, values: Dict[str, Any]):
+        """Set metrics known from an earlier run; nested sections saved half-computed keep the rest lazy"""
+        for key, value in values.items():
+            if isinstance(value, PartialAnalysis) and key in self:
+                self[key].fill(value)
+            else:
+                self[key] = value
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain nested dict with every metric computed"""
+        return {key: value.to_dict() if isinstance(value, LazyAnalysis) else value for key, value in self.items()}
+
+    def __reduce__(self):
+        # Producers close over frames and generators, so pickling (e.g. from a worker process) computes everything
+        return LazyAnalysis, (dict(self.items()),)
+
+    def __repr__(self) -> str:
+        computed = {key: self._values[key] for key in self._keys if key in self._values}
+        return f"LazyAnalysis({computed!r}, pending={self.pending()!r})"
@@ -8,9 +8,11 @@ import os
 import tempfile
 import uuid
 from datetime import datetime
+import pandas as pd
 from flask import Flask, request, render_template, send_file, flash, redirect, url_for, jsonify
 from werkzeug.utils import secure_filename
 from advanced_ppt_generator import CSVPPTGenerator
+from csv_detection import detect_csv_format, read_csv_kwargs
 
 app = Flask(__name__, static_url_path='/static', static_folder='static')
 app.secret_key = 'your-secret-key-change-this-in-production'
@@ -43,14 +45,31 @@ def get_file_info(file_path):
                 'sheets_with_data': excel_info['sheets_with_data']
             }
         else:
-            # For CSV files, just return basic info
-            import pandas as pd
-            df = pd.read_csv(file_path)
+            # Counts are those of the cleaned data the presentation is built from ('cleaned': True);
+            # a stored analysis of the same content answers without reading the file
+            analysis = generator.stored_analysis(file_path)
+            if analysis is not None:
+                return {
+                    'type': 'csv',
+                    'rows': analysis['shape'][0],
+                    'columns': analysis['shape'][1],
+                    'column_names': analysis['columns'],
+                    'cleaned': True
+                }
+            # Otherwise clean once so /generate can reuse the cached frame
+            try:
+                df = generator.load_cleaned_frame(file_path)
+                cleaned = True
+            except ValueError:
+                # Data cleaning rejects (e.g. too few rows): report the raw file
+                df = pd.read_csv(file_path, **read_csv_kwargs(detect_csv_format(file_path)))
+                cleaned = False
             return {
                 'type': 'csv',
                 'rows': len(df),
                 'columns': len(df.columns),
-                'column_names': df.columns.tolist()
+                'column_names': df.columns.tolist(),
+                'cleaned': cleaned
             }
     except Exception as e:
         return {'error': str(e)}
@@ -97,10 +116,20 @@ def generate_presentation():
         file_path = request.form.get('file_path')
         sheet_name = request.form.get('sheet_name', None)
         output_filename = request.form.get('output_filename', None)
+        analysis_mode = request.form.get('analysis_mode') or 'full'
+        sample_size = request.form.get('sample_size', None)
         
         if not file_path:
             return jsonify({'error': 'No file specified'}), 400
         
+        if analysis_mode not in CSVPPTGenerator.ANALYSIS_MODES:
+            return jsonify({'error': f'Unknown analysis mode: {analysis_mode}'}), 400
+        
+        try:
+            sample_size = int(sample_size) if sample_size else None
+        except ValueError:
+            return jsonify({'error': 'Sample size must be a whole number'}), 400
+        
         full_file_path = os.path.join(UPLOAD_FOLDER, file_path)
         
         if not os.path.exists(full_file_path):
@@ -122,7 +151,9 @@ def generate_presentation():
         result_path = generator.create_presentation_from_csv(
             full_file_path, 
             output_filename=output_path,
-            sheet_name=sheet_name if sheet_name else None
+            sheet_name=sheet_name if sheet_name else None,
+            analysis_mode=analysis_mode,
+            sample_size=sample_size
         )
         
         return jsonify({
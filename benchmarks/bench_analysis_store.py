@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Benchmark: loading, cleaning and analyzing a CSV vs. reusing the analysis and
+chart data stored by an earlier run on the same file
+"""
+
+import os
+import sys
+import io
+import time
+import tempfile
+import argparse
+import contextlib
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('OPENAI_API_KEY', 'benchmark-key-not-used')
+from advanced_ppt_generator import CSVPPTGenerator
+import disk_cache
+from disk_cache import AnalysisStore, FrameCache
+
+
+def make_frame(rows: int, numeric_cols: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    data = {
+        'order_date': pd.date_range('2020-01-01', periods=rows, freq='min').astype(str),
+        'region': rng.choice(['north', 'south', 'east', 'west'], rows),
+        'product': rng.choice([f"product {i}" for i in range(500)], rows)
+    }
+    for i in range(numeric_cols):
+        data[f"metric_{i}"] = rng.lognormal(0, 1, rows).round(3)
+    return pd.DataFrame(data)
+
+
+def timed_run(cache_dir: str, path: str) -> float:
+    """Analysis plus the AI data summary, as create_presentation_from_csv runs them"""
+    disk_cache._digest_memo.clear()  # Hash the file as a fresh process would
+    generator = CSVPPTGenerator()
+    generator.frame_cache = FrameCache(cache_dir)
+    generator.analysis_store = AnalysisStore(cache_dir)
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        analysis = generator.load_and_analyze_data(path)
+        generator._build_comprehensive_data_summary(analysis)
+        elapsed = time.perf_counter() - start
+        generator.store_analysis(analysis)
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the stored-analysis cache")
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--numeric-cols', type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'data.csv')
+        make_frame(args.rows, args.numeric_cols).to_csv(path, index=False)
+        print(f"CSV: {args.rows:,} rows × {args.numeric_cols + 3} columns, {os.path.getsize(path) / 1e6:.0f} MB")
+        print(f"{'first run (parse, clean, analyze)':<36} {timed_run(directory, path):>8.2f} s")
+        print(f"{'stored analysis':<36} {timed_run(directory, path):>8.2f} s")
+
+
+if __name__ == '__main__':
+    main()
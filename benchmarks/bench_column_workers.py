@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Benchmark: in-process vs. shared-memory worker processes for the per-column
+part of _perform_data_analysis on a wide table
+"""
+
+import os
+import sys
+import io
+import time
+import argparse
+import contextlib
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('OPENAI_API_KEY', 'benchmark-key-not-used')
+from advanced_ppt_generator import CSVPPTGenerator
+from column_analysis import ColumnWorkerPool, summarize_text_column
+
+
+def make_frame(rows: int, numeric_cols: int, text_cols: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    data = {f"num_{i}": rng.lognormal(0, 1, rows) for i in range(numeric_cols)}
+    words = np.array([f"value {i}" for i in range(2000)], dtype=object)
+    for i in range(text_cols):
+        data[f"text_{i}"] = words[rng.integers(0, len(words), rows)]
+    return pd.DataFrame(data)
+
+
+def profile_columns(df: pd.DataFrame, workers: int) -> float:
+    """Time the numeric profiles and text summaries, the work spread over the pool"""
+    generator = CSVPPTGenerator()
+    numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
+    text_cols = generator._text_columns(df)
+    start = time.perf_counter()
+    if workers == 1:
+        generator.column_stats.profiles(df, numeric_cols)
+        {col: summarize_text_column(df[col]) for col in text_cols}
+    else:
+        with ColumnWorkerPool(workers) as pool:
+            generator.column_stats.profiles(df, numeric_cols, pool.profile_numeric)
+            pool.summarize_text(df, text_cols)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark per-column analysis worker processes")
+    parser.add_argument('--rows', type=int, default=200_000)
+    parser.add_argument('--numeric-cols', type=int, default=400)
+    parser.add_argument('--text-cols', type=int, default=100)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    args = parser.parse_args()
+
+    df = make_frame(args.rows, args.numeric_cols, args.text_cols)
+    print(f"Frame: {args.rows:,} rows × {args.numeric_cols} numeric + {args.text_cols} text columns; "
+          f"{os.cpu_count()} CPU(s)")
+    print(f"{'workers':<8} {'seconds':>8}")
+    for workers in args.workers:
+        with contextlib.redirect_stdout(io.StringIO()):
+            elapsed = profile_columns(df, workers)
+        print(f"{workers:<8} {elapsed:>8.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Benchmark: pandas vs. pyarrow reader engine on a wide, text-heavy CSV
+Times the parse and the _clean_data_for_perfect_ppt pass for each engine and
+reports the in-memory size of the parsed frame
+"""
+
+import os
+import sys
+import io
+import time
+import tempfile
+import argparse
+import contextlib
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('OPENAI_API_KEY', 'benchmark-key-not-used')
+from advanced_ppt_generator import CSVPPTGenerator
+
+
+def make_file(path: str, rows: int, text_cols: int, numeric_cols: int):
+    rng = np.random.default_rng(0)
+    data = {}
+    words = np.array([f"  value {i} " for i in range(500)])
+    for i in range(text_cols):
+        data[f"text_{i}"] = words[rng.integers(0, len(words), rows)]
+    for i in range(numeric_cols):
+        data[f"num_{i}"] = rng.normal(100, 20, rows).round(3)
+    pd.DataFrame(data).to_csv(path, index=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark CSV reader engines")
+    parser.add_argument('--rows', type=int, default=200_000)
+    parser.add_argument('--text-cols', type=int, default=40)
+    parser.add_argument('--numeric-cols', type=int, default=10)
+    args = parser.parse_args()
+
+    generator = CSVPPTGenerator()
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'wide_text.csv')
+        make_file(path, args.rows, args.text_cols, args.numeric_cols)
+        print(f"File: {args.rows:,} rows × {args.text_cols} text + {args.numeric_cols} numeric columns, "
+              f"{os.path.getsize(path) / 1e6:.1f} MB")
+        print(f"{'engine':<8} {'parse s':>8} {'clean s':>8} {'frame MB':>9}")
+
+        for engine in CSVPPTGenerator.ENGINES:
+            with contextlib.redirect_stdout(io.StringIO()):
+                csv_format = generator.detect_csv_format(path)
+                start = time.perf_counter()
+                df = generator._read_csv_once(path, csv_format, engine)
+                parse_time = time.perf_counter() - start
+                frame_mb = df.memory_usage(deep=True).sum() / 1e6
+
+                start = time.perf_counter()
+                generator._clean_data_for_perfect_ppt(df)
+                clean_time = time.perf_counter() - start
+            print(f"{engine:<8} {parse_time:>8.3f} {clean_time:>8.3f} {frame_mb:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
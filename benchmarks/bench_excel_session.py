@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark: one shared ExcelSession vs. re-opening the workbook for every step
+Times sheet info (twice, as create_presentation_from_csv does) plus the sheet
+load on a text-heavy workbook, where opening the file means parsing every shared string
+"""
+
+import os
+import sys
+import io
+import time
+import tempfile
+import argparse
+import contextlib
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('OPENAI_API_KEY', 'benchmark-key-not-used')
+from advanced_ppt_generator import CSVPPTGenerator
+from excel_reader import ExcelSession
+
+
+def make_file(path: str, rows: int):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        'customer': [f"customer-{i:07d}" for i in range(rows)],
+        'note': [f"note {i * 7919 % 100003}" for i in range(rows)],
+        'amount': rng.normal(100, 20, rows).round(2)
+    })
+    with pd.ExcelWriter(path) as writer:
+        df.to_excel(writer, sheet_name='Data', index=False)
+        df.head(50).to_excel(writer, sheet_name='Summary', index=False)
+
+
+def reopen_each_step(generator: CSVPPTGenerator, path: str):
+    """Previous flow: every step opens and parses the workbook again"""
+    generator.load_excel_info(path)
+    generator.load_excel_info(path)
+    with ExcelSession(path) as session:
+        generator._read_excel_sheet(session, 'Data')
+
+
+def shared_session(generator: CSVPPTGenerator, path: str):
+    with ExcelSession(path) as session:
+        generator.load_excel_info(path, session)
+        generator.load_excel_info(path, session)
+        generator._read_excel_sheet(session, 'Data')
+
+
+def best_time(func, generator: CSVPPTGenerator, path: str, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            func(generator, path)
+            timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark single-open Excel sessions")
+    parser.add_argument('--rows', type=int, default=200_000)
+    parser.add_argument('--repeat', type=int, default=3, help="Timing repetitions (best is reported)")
+    args = parser.parse_args()
+
+    generator = CSVPPTGenerator()
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'text_heavy.xlsx')
+        make_file(path, args.rows)
+        print(f"Workbook: {args.rows:,} rows, {os.path.getsize(path) / 1e6:.1f} MB")
+        reopen = best_time(reopen_each_step, generator, path, args.repeat)
+        shared = best_time(shared_session, generator, path, args.repeat)
+        print(f"{'re-open per step':<18} {reopen:>8.3f} s")
+        print(f"{'shared session':<18} {shared:>8.3f} s")
+
+
+if __name__ == '__main__':
+    main()
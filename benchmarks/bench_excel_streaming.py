@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark: streaming XLSX reader vs. loading the whole sheet with pd.read_excel
+Runs each analysis path in a fresh process and reports wall time, rows/second
+and peak resident memory
+"""
+
+import os
+import sys
+import io
+import json
+import time
+import resource
+import tempfile
+import argparse
+import contextlib
+import subprocess
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('OPENAI_API_KEY', 'benchmark-key-not-used')
+
+
+def make_file(path: str, rows: int):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        'Order Date': pd.Timestamp('2020-01-01') + pd.to_timedelta(rng.integers(0, 1500, rows), unit='D'),
+        'Region': rng.choice(['North', 'South', 'East', 'West'], rows),
+        'Product': rng.choice([f"Product {i}" for i in range(200)], rows),
+        'Channel': rng.choice(['Online', 'Retail', 'Partner'], rows),
+        'Sales': rng.normal(100, 20, rows).round(2),
+        'Cost': rng.normal(60, 10, rows).round(2),
+        'Quantity': rng.integers(1, 50, rows),
+        'Discount': rng.random(rows).round(3)
+    })
+    df.to_excel(path, sheet_name='Data', index=False)
+
+
+def run_mode(path: str, mode: str, chunksize: int):
+    """Child process: analyze the sheet in one mode and print the measurements as JSON"""
+    from advanced_ppt_generator import CSVPPTGenerator
+    generator = CSVPPTGenerator()
+    generator.frame_cache.enabled = False
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        analysis = generator.load_and_analyze_excel(path, 'Data', analysis_mode=mode, chunksize=chunksize)
+        elapsed = time.perf_counter() - start
+    print(json.dumps({'seconds': elapsed, 'rows': analysis['shape'][0], 'peak_mb': peak_memory_mb()}))
+
+
+def peak_memory_mb() -> float:
+    """Peak resident memory of this process"""
+    # VmHWM is reset by exec; ru_maxrss can carry over the parent's peak on Linux
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark streaming XLSX analysis")
+    parser.add_argument('--rows', type=int, default=200_000)
+    parser.add_argument('--chunksize', type=int, default=100_000, help="Rows per chunk in stream mode")
+    parser.add_argument('--run', nargs=2, metavar=('PATH', 'MODE'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        run_mode(*args.run, args.chunksize)
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'large_sheet.xlsx')
+        make_file(path, args.rows)
+        print(f"Workbook: {args.rows:,} rows × 8 columns, {os.path.getsize(path) / 1e6:.1f} MB")
+        print(f"{'mode':<8} {'seconds':>8} {'rows/s':>10} {'peak MB':>8}")
+        for mode in ['full', 'stream']:
+            output = subprocess.run([sys.executable, os.path.abspath(__file__), '--run', path, mode,
+                                     '--chunksize', str(args.chunksize)],
+                                    capture_output=True, text=True, check=True).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            print(f"{mode:<8} {result['seconds']:>8.2f} {args.rows / result['seconds']:>10,.0f} {result['peak_mb']:>8.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Benchmark: re-streaming a grown CSV vs. folding only the appended rows into
+the saved analysis state (incremental mode)
+"""
+
+import os
+import sys
+import io
+import time
+import tempfile
+import argparse
+import contextlib
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('OPENAI_API_KEY', 'benchmark-key-not-used')
+from advanced_ppt_generator import CSVPPTGenerator
+
+
+def make_rows(rng: np.random.Generator, start: int, rows: int) -> pd.DataFrame:
+    return pd.DataFrame({
+        'order_id': [f"order-{i}" for i in range(start, start + rows)],
+        'region': rng.choice(['north', 'south', 'east', 'west'], rows),
+        'amount': rng.normal(100, 20, rows).round(2),
+        'quantity': rng.integers(1, 20, rows),
+        'discount': rng.uniform(0, 0.3, rows).round(3)
+    })
+
+
+def timed_analysis(generator: CSVPPTGenerator, path: str, mode: str) -> float:
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        generator.load_and_analyze_csv(path, analysis_mode=mode)
+        return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark incremental re-analysis of appended rows")
+    parser.add_argument('--rows', type=int, default=2_000_000, help="Rows in the existing history")
+    parser.add_argument('--appended', type=int, default=20_000, help="Rows appended before the second run")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as directory:
+        generator = CSVPPTGenerator()
+        generator.profile_store.cache_dir = os.path.join(directory, 'profiles')
+        os.makedirs(generator.profile_store.cache_dir)
+        path = os.path.join(directory, 'daily.csv')
+        make_rows(rng, 0, args.rows).to_csv(path, index=False)
+
+        first = timed_analysis(generator, path, 'incremental')
+        with open(path, 'a') as f:
+            make_rows(rng, args.rows, args.appended).to_csv(f, index=False, header=False)
+        print(f"History: {args.rows:,} rows + {args.appended:,} appended, {os.path.getsize(path) / 1e6:.0f} MB")
+        appended = timed_analysis(generator, path, 'incremental')
+        stream = timed_analysis(generator, path, 'stream')
+
+        print(f"{'first incremental run (builds state)':<38} {first:>8.2f} s")
+        print(f"{'stream mode over the grown file':<38} {stream:>8.2f} s")
+        print(f"{'incremental run over the appended rows':<38} {appended:>8.2f} s")
+
+
+if __name__ == '__main__':
+    main()
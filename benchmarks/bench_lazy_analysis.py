@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Benchmark: computing every analysis metric up front vs. pulling only the
+metrics the AI data summary reads from the lazy analysis graph
+"""
+
+import os
+import sys
+import io
+import time
+import argparse
+import contextlib
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('OPENAI_API_KEY', 'benchmark-key-not-used')
+from advanced_ppt_generator import CSVPPTGenerator
+
+
+def make_frame(rows: int, numeric_cols: int, text_cols: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    data = {f"num_{i}": np.where(rng.random(rows) < 0.02, np.nan, rng.lognormal(0, 1, rows))
+            for i in range(numeric_cols)}
+    words = np.array([f"value {i}" for i in range(5000)], dtype=object)
+    for i in range(text_cols):
+        data[f"text_{i}"] = words[rng.integers(0, len(words), rows)]
+    return pd.DataFrame(data)
+
+
+def timed(df: pd.DataFrame, everything: bool) -> float:
+    generator = CSVPPTGenerator()
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        analysis = generator._perform_data_analysis(df, 'bench.csv', {})
+        if everything:
+            analysis.to_dict()
+        generator._build_comprehensive_data_summary(analysis)
+        return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the lazy analysis graph")
+    parser.add_argument('--rows', type=int, default=500_000)
+    parser.add_argument('--numeric-cols', type=int, default=40)
+    parser.add_argument('--text-cols', type=int, default=40)
+    args = parser.parse_args()
+
+    df = make_frame(args.rows, args.numeric_cols, args.text_cols)
+    print(f"Frame: {args.rows:,} rows × {args.numeric_cols} numeric + {args.text_cols} text columns")
+    print(f"{'all metrics + summary':<24} {timed(df, True):>8.2f} s")
+    print(f"{'summary metrics only':<24} {timed(df, False):>8.2f} s")
+
+
+if __name__ == '__main__':
+    main()
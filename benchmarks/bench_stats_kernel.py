@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-column pandas reductions vs. the fused statistics kernel
+Times the numeric profiling behind numeric_insights, summary_stats and
+data_skewness on a wide numeric frame with some missing values
+"""
+
+import os
+import sys
+import time
+import argparse
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from stats_kernel import profile_numeric_columns, describe_stats
+
+
+def make_frame(rows: int, cols: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    data = {}
+    for i in range(cols):
+        values = rng.lognormal(0, 1, rows) if i % 2 else rng.normal(100, 20, rows)
+        if i % 4 == 0:
+            values[rng.random(rows) < 0.05] = np.nan
+        data[f"num_{i}"] = values
+    return pd.DataFrame(data)
+
+
+def per_column_profile(df: pd.DataFrame):
+    """Previous flow: separate reductions per column, then describe() and skew() again"""
+    numeric_cols = df.columns.tolist()
+    insights = {}
+    for col in numeric_cols:
+        col_data = df[col].dropna()
+        if len(col_data) > 0:
+            q1, q3 = col_data.quantile(0.25), col_data.quantile(0.75)
+            iqr = q3 - q1
+            insights[col] = {
+                "mean": col_data.mean(),
+                "median": col_data.median(),
+                "std": col_data.std(),
+                "min": col_data.min(),
+                "max": col_data.max(),
+                "range": col_data.max().item() - col_data.min().item(),
+                "skewness": col_data.skew(),
+                "outliers_count": len(col_data[(col_data < q1 - 1.5 * iqr) | (col_data > q3 + 1.5 * iqr)])
+            }
+    summary = df.describe().to_dict()
+    skewness = {col: df[col].dropna().skew() for col in numeric_cols if df[col].count() > 3}
+    return insights, summary, skewness
+
+
+def fused_profile(df: pd.DataFrame):
+    profiles = profile_numeric_columns(df, df.columns.tolist())
+    skewness = {col: profile['skewness'] for col, profile in profiles.items() if profile['count'] > 3}
+    return profiles, describe_stats(profiles), skewness
+
+
+def best_time(func, df: pd.DataFrame, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(df)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the fused numeric statistics kernel")
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--cols', type=int, default=100)
+    parser.add_argument('--repeat', type=int, default=3, help="Timing repetitions (best is reported)")
+    args = parser.parse_args()
+
+    df = make_frame(args.rows, args.cols)
+    print(f"Frame: {args.rows:,} rows × {args.cols} numeric columns, {df.memory_usage().sum() / 1e6:.0f} MB")
+    per_column = best_time(per_column_profile, df, args.repeat)
+    fused = best_time(fused_profile, df, args.repeat)
+    print(f"{'per-column pandas':<18} {per_column:>8.3f} s")
+    print(f"{'fused kernel':<18} {fused:>8.3f} s")
+
+
+if __name__ == '__main__':
+    main()
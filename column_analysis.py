@@ -0,0 +1,230 @@
+"""
+Column Analysis
+Per-column profiling computed on demand, either in-process or, for wide
+tables, partitioned across worker processes that read the column data from
+shared memory instead of receiving it pickled
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, Any, List, Optional, Tuple, Union, Callable, ContextManager
+
+import numpy as np
+import pandas as pd
+
+from sketches import CategoricalSketch, sketch_column
+from stats_kernel import BLOCK_COLUMNS, ColumnStatsCache, profile_numeric_array
+
+# Optional columnar encoding for text columns in shared memory
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+except ImportError:
+    pa = None
+
+TASKS_PER_WORKER = 2  # Column partitions per worker, so one slow partition does not idle the rest
+
+
+class TextColumnCounts:
+    """Exact non-null count, distinct count and top values of one text column"""
+
+    def __init__(self, values: pd.Series, top_n: int = 5):
+        counts = values.value_counts()
+        counts = counts[counts > 0]  # Categoricals list unused categories with zero counts
+        self.count = int(counts.sum())
+        self.distinct = len(counts)
+        self.top_counts = counts.head(top_n)
+
+    def unique_count(self) -> int:
+        return self.distinct
+
+    def top(self, n: int = 5) -> pd.Series:
+        return self.top_counts.head(n)
+
+
+def summarize_text_column(values: pd.Series,
+                          sketch_chunk_rows: Optional[int] = None) -> Union[TextColumnCounts, CategoricalSketch]:
+    """Exact counts, or a bounded-memory sketch built chunk by chunk when sketch_chunk_rows is set"""
+    if sketch_chunk_rows:
+        return sketch_column(values, sketch_chunk_rows)
+    return TextColumnCounts(values)
+
+
+def _partitions(items: List[Any], parts: int) -> List[List[Any]]:
+    """Split items into at most `parts` contiguous, nearly equal runs"""
+    parts = max(1, min(parts, len(items)))
+    bounds = np.linspace(0, len(items), parts + 1).astype(int)
+    return [items[start:stop] for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+
+
+def _profile_numeric_part(name: str, shape: Tuple[int, int], start: int, stop: int,
+                          columns: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Worker: profile a range of columns of the shared column-major float block"""
+    shm = SharedMemory(name=name)
+    try:
+        values = np.ndarray(shape, dtype=np.float64, buffer=shm.buf, order='F')
+        profiles = profile_numeric_array(values[:, start:stop], columns)
+        del values  # Release the view before the segment is closed
+        return profiles
+    finally:
+        shm.close()
+
+
+def _summarize_text_part(name: str, size: int, dtypes: Dict[str, Any], columns: List[str],
+                         pickled: Optional[pd.DataFrame], sketch_chunk_rows: Optional[int]) -> Dict[str, Any]:
+    """Worker: summarize text columns read from an Arrow IPC stream in shared memory"""
+    summaries = {}
+    if name is not None:
+        shm = SharedMemory(name=name)
+        try:
+            # Copied out: dictionary-encoded columns convert to categoricals that keep pointing into the
+            # IPC buffer, and a segment with exported pointers cannot be closed
+            encoded = pa.py_buffer(bytes(shm.buf[:size]))
+        finally:
+            shm.close()
+        frame = pa.ipc.open_stream(encoded).read_all().to_pandas()
+        for col in frame.columns:
+            # Restore pandas string dtypes, whose value_counts orders ties differently from object columns
+            values = frame[col].astype(dtypes[col]) if col in dtypes else frame[col]
+            summaries[col] = summarize_text_column(values, sketch_chunk_rows)
+    if pickled is not None:
+        for col in pickled.columns:
+            summaries[col] = summarize_text_column(pickled[col], sketch_chunk_rows)
+    return {col: summaries[col] for col in columns}
+
+
+class ColumnWorkerPool:
+    """Process pool for per-column analysis; segments it shares are unlinked when the pool closes"""
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        self.executor = ProcessPoolExecutor(max_workers=workers)
+        self.segments: List[SharedMemory] = []
+
+    def __enter__(self) -> 'ColumnWorkerPool':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.executor.shutdown()
+        for shm in self.segments:
+            shm.close()
+            shm.unlink()
+        self.segments = []
+
+    def _share(self, size: int) -> SharedMemory:
+        shm = SharedMemory(create=True, size=max(size, 1))
+        self.segments.append(shm)
+        return shm
+
+    def profile_numeric(self, df: pd.DataFrame, columns: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Numeric profiles (as stats_kernel computes them) with column ranges spread over the workers"""
+        shape = (len(df), len(columns))
+        shm = self._share(shape[0] * shape[1] * 8)
+        values = np.ndarray(shape, dtype=np.float64, buffer=shm.buf, order='F')
+        for start in range(0, len(columns), 64):
+            block_cols = columns[start:start + 64]
+            values[:, start:start + len(block_cols)] = df[block_cols].to_numpy(dtype=float, na_value=np.nan)
+        del values
+
+        futures = []
+        position = 0
+        for part in _partitions(columns, self.workers * TASKS_PER_WORKER):
+            futures.append(self.executor.submit(_profile_numeric_part, shm.name, shape,
+                                                position, position + len(part), part))
+            position += len(part)
+        profiles = {}
+        for future in futures:
+            profiles.update(future.result())
+        return {col: profiles[col] for col in columns}
+
+    def summarize_text(self, df: pd.DataFrame, columns: List[str],
+                       sketch_chunk_rows: Optional[int] = None) -> Dict[str, Any]:
+        """Text column summaries; columns Arrow can encode travel through shared memory, others are pickled"""
+        futures = []
+        for part in _partitions(columns, self.workers * TASKS_PER_WORKER):
+            shared, pickled = self._encode_text(df, part)
+            futures.append(self.executor.submit(_summarize_text_part, *shared, part, pickled, sketch_chunk_rows))
+        summaries = {}
+        for future in futures:
+            summaries.update(future.result())
+        return {col: summaries[col] for col in columns}
+
+    def _encode_text(self, df: pd.DataFrame,
+                     columns: List[str]) -> Tuple[Tuple[Optional[str], int, Dict[str, Any]], Optional[pd.DataFrame]]:
+        """Arrow IPC stream of the encodable columns in a new segment, plus a frame of the rest"""
+        arrays, fallback = {}, []
+        for col in columns:
+            try:
+                if pa is None:
+                    raise TypeError("pyarrow is not installed")
+                arrays[col] = pa.Array.from_pandas(df[col])
+            except (TypeError, ValueError, getattr(pa, 'ArrowException', TypeError)):
+                fallback.append(col)  # Mixed Python types: send these pickled
+        pickled = df[fallback] if fallback else None
+        if not arrays:
+            return (None, 0, {}), pickled
+        dtypes = {col: df[col].dtype for col in arrays if isinstance(df[col].dtype, pd.StringDtype)}
+
+        table = pa.table(arrays)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        encoded = sink.getvalue()
+        shm = self._share(encoded.size)
+        np.ndarray(encoded.size, dtype=np.uint8, buffer=shm.buf)[:] = np.frombuffer(encoded, dtype=np.uint8)
+        return (shm.name, encoded.size, dtypes), pickled
+
+
+class ColumnProfiles:
+    """Per-column profiles of one frame, computed when first asked for.
+
+    A numeric column is profiled together with the rest of its kernel block and a text column on its
+    own; asking for all columns profiles the remaining ones at once, through a worker pool when
+    open_pool provides one for a table this wide.
+    """
+
+    def __init__(self, df: pd.DataFrame, numeric_cols: List[str], text_cols: List[str], stats: ColumnStatsCache,
+                 sketch_chunk_rows: Optional[int] = None,
+                 open_pool: Callable[[int], ContextManager[Optional[ColumnWorkerPool]]] = None):
+        self.df = df
+        self.numeric_cols = numeric_cols
+        self.text_cols = text_cols
+        self.stats = stats
+        self.sketch_chunk_rows = sketch_chunk_rows
+        self.open_pool = open_pool
+        self._positions = {col: i for i, col in enumerate(numeric_cols)}
+        self._text: Dict[str, Union[TextColumnCounts, CategoricalSketch]] = {}
+        self._pool_used = False
+
+    def numeric(self, col: str) -> Dict[str, Any]:
+        start = self._positions[col] - self._positions[col] % BLOCK_COLUMNS
+        return self.stats.profiles(self.df, self.numeric_cols[start:start + BLOCK_COLUMNS])[col]
+
+    def text(self, col: str) -> Union[TextColumnCounts, CategoricalSketch]:
+        if col not in self._text:
+            self._text[col] = summarize_text_column(self.df[col], self.sketch_chunk_rows)
+        return self._text[col]
+
+    def all_numeric(self) -> Dict[str, Dict[str, Any]]:
+        self._profile_with_pool()
+        return self.stats.profiles(self.df, self.numeric_cols)
+
+    def all_text(self) -> Dict[str, Union[TextColumnCounts, CategoricalSketch]]:
+        self._profile_with_pool()
+        return {col: self.text(col) for col in self.text_cols}
+
+    def _profile_with_pool(self):
+        """Profile every column not profiled yet in one worker pool, if open_pool gives one"""
+        if self.open_pool is None or self._pool_used:
+            return
+        self._pool_used = True
+        text_cols = [col for col in self.text_cols if col not in self._text]
+        with self.open_pool(len(self.numeric_cols) + len(self.text_cols)) as pool:
+            if pool is None:
+                return
+            self.stats.profiles(self.df, self.numeric_cols, pool.profile_numeric)
+            if text_cols:
+                self._text.update(pool.summarize_text(self.df, text_cols, self.sketch_chunk_rows))
@@ -0,0 +1,153 @@
+"""
+Correlation Engine
+Pearson correlations for wide tables computed in column blocks with NumPy,
+kept as one labelled array with vectorized strong-pair extraction; it reads
+like the nested {column: {column: r}} dict the analysis used to hold
+"""
+
+from collections.abc import Mapping
+from typing import Dict, Any, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+STRONG_THRESHOLD = 0.7
+BLOCK_COLUMNS = 256  # Column block edge for the products and the pair scan
+
+
+class CorrelationMatrix(Mapping):
+    """Correlation matrix as a single float array with column labels.
+
+    As a read-only mapping it behaves like DataFrame.corr().to_dict(): matrix[col] is a
+    {column: r} dict, and a matrix of no columns is empty like the {} of a table without correlations.
+    """
+
+    def __init__(self, columns: List[str], values: np.ndarray):
+        self.columns = list(columns)
+        self.values = values
+        self._positions = {col: i for i, col in enumerate(self.columns)}
+
+    @classmethod
+    def empty(cls) -> 'CorrelationMatrix':
+        """Matrix of a table with fewer than two numeric columns"""
+        return cls([], np.empty((0, 0)))
+
+    def __getitem__(self, col: str) -> Dict[str, float]:
+        position = self._positions[col]
+        return dict(zip(self.columns, self.values[:, position].tolist()))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.columns)
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+    def __contains__(self, col: object) -> bool:
+        return col in self._positions
+
+    def __repr__(self) -> str:
+        return f"CorrelationMatrix({len(self.columns)} columns)"
+
+    def correlation(self, col1: str, col2: str) -> float:
+        """Correlation between two columns"""
+        return float(self.values[self._positions[col1], self._positions[col2]])
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(self.values, index=self.columns, columns=self.columns)
+
+    def to_dict(self) -> Dict[str, Dict[str, float]]:
+        """Nested {column: {column: r}} form, as DataFrame.corr().to_dict() returns"""
+        return {col: self[col] for col in self.columns}
+
+    def _pairs_above(self, threshold: float, block_columns: int):
+        """Row, column and value of every upper-triangle entry with |r| above the threshold"""
+        rows, cols, found = [], [], []
+        k = len(self.columns)
+        for start in range(0, k, block_columns):
+            block = self.values[start:start + block_columns]
+            row_ids = np.arange(start, start + len(block))[:, None]
+            # Strictly above the diagonal; NaN compares False and drops out
+            hits = (np.abs(block) > threshold) & (np.arange(k)[None, :] > row_ids)
+            i, j = np.nonzero(hits)
+            rows.append(i + start)
+            cols.append(j)
+            found.append(block[i, j])
+        if not found:
+            return np.empty(0, dtype=int), np.empty(0, dtype=int), np.empty(0)
+        return np.concatenate(rows), np.concatenate(cols), np.concatenate(found)
+
+    def strong_pair_count(self, threshold: float = STRONG_THRESHOLD, block_columns: int = BLOCK_COLUMNS) -> int:
+        return len(self._pairs_above(threshold, block_columns)[2])
+
+    def strong_pairs(self, threshold: float = STRONG_THRESHOLD, top_k: Optional[int] = None,
+                     block_columns: int = BLOCK_COLUMNS) -> List[Dict[str, Any]]:
+        """Pairs with |r| above the threshold, strongest first; only the top_k strongest when top_k is given"""
+        rows, cols, found = self._pairs_above(threshold, block_columns)
+        strength = np.abs(found)
+        if top_k is not None and len(found) > top_k:
+            keep = np.argpartition(-strength, top_k - 1)[:top_k]
+            rows, cols, found, strength = rows[keep], cols[keep], found[keep], strength[keep]
+        order = np.lexsort((cols, rows, -strength))
+        return [{
+            "var1": self.columns[rows[n]],
+            "var2": self.columns[cols[n]],
+            "correlation": round(float(found[n]), 3),
+            "strength": "strong positive" if found[n] > 0 else "strong negative"
+        } for n in order]
+
+
+def _dense_block_correlation(values: np.ndarray, block_columns: int) -> np.ndarray:
+    """Correlations of NaN-free columns from products of standardized column blocks"""
+    n, k = values.shape
+    with np.errstate(invalid='ignore', divide='ignore'):
+        centered = values - values.mean(axis=0)
+        scale = np.sqrt((centered * centered).sum(axis=0))
+        standardized = centered / np.where(scale > 0, scale, np.nan)
+    result = np.empty((k, k))
+    for start in range(0, k, block_columns):
+        stop = min(start + block_columns, k)
+        block = standardized[:, start:stop].T @ standardized[:, start:]
+        result[start:stop, start:] = block
+        result[start:, start:stop] = block.T
+    return result
+
+
+def _masked_block_correlation(values: np.ndarray, block_columns: int) -> np.ndarray:
+    """Pairwise-complete correlations (as DataFrame.corr) from masked co-moment sums per column block"""
+    n, k = values.shape
+    present = ~np.isnan(values)
+    # Shift by the column means to keep the raw sums well conditioned
+    shift = np.nansum(values, axis=0) / np.maximum(present.sum(axis=0), 1)
+    centered = np.where(present, values - shift, 0.0)
+    squared = centered * centered
+    mask = present.astype(float)
+    result = np.empty((k, k))
+    for start in range(0, k, block_columns):
+        stop = min(start + block_columns, k)
+        x, x2, m = centered[:, start:stop].T, squared[:, start:stop].T, mask[:, start:stop].T
+        pairs = m @ mask[:, start:]
+        sum_x = x @ mask[:, start:]
+        sum_y = m @ centered[:, start:]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            pairs = np.where(pairs > 1, pairs, np.nan)
+            cov = x @ centered[:, start:] - sum_x * sum_y / pairs
+            var_x = x2 @ mask[:, start:] - sum_x ** 2 / pairs
+            var_y = m @ squared[:, start:] - sum_y ** 2 / pairs
+            block = cov / np.sqrt(var_x * var_y)
+        result[start:stop, start:] = block
+        result[start:, start:stop] = block.T
+    return result
+
+
+def correlation_matrix(df: pd.DataFrame, columns: List[str],
+                       block_columns: int = BLOCK_COLUMNS) -> CorrelationMatrix:
+    """Pearson correlation matrix over the given numeric columns, skipping missing values pairwise"""
+    values = df[columns].to_numpy(dtype=float, na_value=np.nan)
+    if np.isnan(values).any():
+        result = _masked_block_correlation(values, block_columns)
+    else:
+        result = _dense_block_correlation(values, block_columns)
+    np.clip(result, -1.0, 1.0, out=result)
+    diagonal = np.diagonal(result)
+    np.fill_diagonal(result, np.where(np.isnan(diagonal), np.nan, 1.0))
+    return CorrelationMatrix(columns, result)
@@ -0,0 +1,99 @@
+"""
+CSV Format Detection
+Picks encoding, delimiter, quoting and BOM handling from a bounded byte sample
+so the real parse only has to happen once
+"""
+
+import codecs
+import csv
+import os
+from typing import Dict, Any, List
+
+# Bytes read from each sampled window of the file
+SAMPLE_BYTES = 64 * 1024
+# Delimiters the sniffer is allowed to pick
+CANDIDATE_DELIMITERS = ',;\t|'
+
+BOM_ENCODINGS = [
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+]
+
+
+def read_byte_windows(file_path: str, sample_bytes: int = SAMPLE_BYTES) -> List[bytes]:
+    """Read bounded windows from the head, middle and tail of a file"""
+    size = os.path.getsize(file_path)
+    with open(file_path, 'rb') as f:
+        head = f.read(sample_bytes)
+        if size <= sample_bytes:
+            return [head]
+        windows = [head]
+        for offset in (size // 2, max(size - sample_bytes, sample_bytes)):
+            f.seek(offset)
+            chunk = f.read(sample_bytes)
+            # Start and end on line boundaries so no multi-byte character is cut in half
+            start = chunk.find(b'\n') + 1
+            end = chunk.rfind(b'\n') + 1 if offset + len(chunk) < size else len(chunk)
+            if 0 < start < end:
+                windows.append(chunk[start:end])
+        return windows
+
+
+def _detect_encoding(windows: List[bytes]) -> Dict[str, Any]:
+    """Pick an encoding from the BOM, then by validating the sample as UTF-8"""
+    head = windows[0]
+    for bom, encoding in BOM_ENCODINGS:
+        if head.startswith(bom):
+            return {'encoding': encoding, 'has_bom': True}
+
+    try:
+        for i, window in enumerate(windows):
+            decoder = codecs.getincrementaldecoder('utf-8')()
+            # The head may end in the middle of a character; only the sample end is allowed to be partial
+            decoder.decode(window, final=(i > 0))
+        return {'encoding': 'utf-8', 'has_bom': False}
+    except UnicodeDecodeError:
+        # latin1 maps every byte, so it never fails (same last resort as the old retry loop)
+        return {'encoding': 'latin1', 'has_bom': False}
+
+
+def _detect_dialect(text: str) -> Dict[str, Any]:
+    """Sniff delimiter and quoting from the first lines of decoded text"""
+    lines = text.splitlines()
+    if len(lines) > 1 and not text.endswith(('\n', '\r')):
+        lines = lines[:-1]  # The last line of the sample is usually cut off
+    sample = '\n'.join(lines[:200])
+    header = lines[0] if lines else ''
+
+    delimiter, quotechar = ',', '"'
+    try:
+        dialect = csv.Sniffer().sniff(sample, delimiters=CANDIDATE_DELIMITERS)
+        if dialect.delimiter in header:
+            delimiter = dialect.delimiter
+        if dialect.quotechar in ('"', "'"):
+            quotechar = dialect.quotechar
+    except csv.Error:
+        pass
+    return {'delimiter': delimiter, 'quotechar': quotechar}
+
+
+def detect_csv_format(file_path: str, sample_bytes: int = SAMPLE_BYTES) -> Dict[str, Any]:
+    """Detect encoding, BOM, delimiter and quote character from a bounded byte sample"""
+    windows = read_byte_windows(file_path, sample_bytes)
+    detected = _detect_encoding(windows)
+    text = windows[0].decode(detected['encoding'], errors='replace')
+    detected.update(_detect_dialect(text.lstrip('\ufeff')))
+    detected['sample_bytes'] = sum(len(w) for w in windows)
+    return detected
+
+
+def read_csv_kwargs(detected: Dict[str, Any]) -> Dict[str, Any]:
+    """pandas.read_csv keyword arguments for a detected format"""
+    return {
+        'encoding': detected['encoding'],
+        'sep': detected['delimiter'],
+        'quotechar': detected['quotechar'],
+    }
@@ -0,0 +1,494 @@
+"""
+Disk Cache
+On-disk caches with a size cap and least-recently-used eviction: content-addressed
+cleaned frames and finished analyses, per-dataset analysis state for
+incremental runs, and parsed AI responses with a time-to-live. Nothing is
+stored in an executable format such as pickle: the cache directory may be
+shared, and loading an entry must not run code someone else planted there
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+import uuid
+from collections.abc import Mapping
+from datetime import date, datetime
+from typing import Dict, Any, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from analysis_graph import LazyAnalysis, PartialAnalysis
+from correlation_engine import CorrelationMatrix
+from sketches import CategoricalSketch, HyperLogLog, SpaceSaving
+from streaming_profiler import (CategoricalAccumulator, CorrelationAccumulator, NumericAccumulator, ReservoirSample,
+                                RowHashSet, RowReservoir, StreamingProfile)
+
+# Optional columnar storage backend
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+except ImportError:
+    pa = None
+
+DEFAULT_CACHE_DIR = os.getenv('INSIGHTDECK_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'insightdeck_cache'))
+DEFAULT_FRAME_CACHE_MB = int(os.getenv('INSIGHTDECK_FRAME_CACHE_MB', '2048'))
+DEFAULT_PROFILE_CACHE_MB = int(os.getenv('INSIGHTDECK_PROFILE_CACHE_MB', '512'))
+DEFAULT_ANALYSIS_CACHE_MB = int(os.getenv('INSIGHTDECK_ANALYSIS_CACHE_MB', '256'))
+DEFAULT_RESPONSE_CACHE_MB = int(os.getenv('INSIGHTDECK_RESPONSE_CACHE_MB', '64'))
+DEFAULT_RESPONSE_TTL_HOURS = float(os.getenv('INSIGHTDECK_RESPONSE_TTL_HOURS', '24'))
+FINGERPRINT_WINDOW = 1024 * 1024  # Bytes hashed at each end of an analyzed prefix
+
+# (absolute path, size, mtime) -> content digest, so unchanged files are hashed once per process
+_digest_memo: Dict[Tuple[str, int, int], str] = {}
+
+
+def file_digest(file_path: str) -> str:
+    """SHA-256 of a file's content, memoized on path, size and modification time"""
+    stat = os.stat(file_path)
+    memo_key = (os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns)
+    digest = _digest_memo.get(memo_key)
+    if digest is None:
+        sha = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                sha.update(block)
+        digest = sha.hexdigest()
+        _digest_memo[memo_key] = digest
+    return digest
+
+
+def prefix_fingerprint(file_path: str, length: int) -> str:
+    """SHA-256 of a prefix's length and its first and last FINGERPRINT_WINDOW bytes.
+    
+    Cheap enough to check on every run: an append-only file keeps the fingerprint of
+    every earlier prefix, while a rewritten one almost always changes it.
+    """
+    sha = hashlib.sha256(str(length).encode('ascii'))
+    with open(file_path, 'rb') as f:
+        sha.update(f.read(min(length, FINGERPRINT_WINDOW)))
+        tail_start = max(length - FINGERPRINT_WINDOW, FINGERPRINT_WINDOW)
+        if tail_start < length:
+            f.seek(tail_start)
+            sha.update(f.read(length - tail_start))
+    return sha.hexdigest()
+
+
+class DiskLRUCache:
+    """Directory of cache entries capped in total size, evicting the least recently used first"""
+
+    def __init__(self, cache_dir: str, max_bytes: int, suffix: str):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.suffix = suffix
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def make_key(self, *parts: Any) -> str:
+        """Hash arbitrary JSON-serializable parts into a cache key"""
+        payload = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def path_for(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}{self.suffix}")
+
+    def lookup(self, key: str) -> Optional[str]:
+        """Return the entry path on a hit and mark it as recently used"""
+        path = self.path_for(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            os.utime(path)  # Modification time doubles as the LRU clock
+        except OSError:
+            return None
+        return path
+
+    def temp_path(self) -> str:
+        """Scratch path in the cache directory for writing a new entry"""
+        return os.path.join(self.cache_dir, f".tmp-{uuid.uuid4().hex}{self.suffix}")
+
+    def commit(self, temp_path: str, key: str) -> str:
+        """Atomically publish a finished entry, then enforce the size cap"""
+        path = self.path_for(key)
+        os.replace(temp_path, path)
+        self.evict()
+        return path
+
+    def remove(self, key: str):
+        try:
+            os.remove(self.path_for(key))
+        except OSError:
+            pass
+
+    def evict(self):
+        """Delete least recently used entries until the cache fits in max_bytes"""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(self.suffix) or name.startswith('.tmp-'):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+
+class FrameCache(DiskLRUCache):
+    """Cleaned DataFrames stored as uncompressed Arrow IPC (Feather v2) files, read back memory-mapped
+    into ordinary writable frames"""
+
+    def __init__(self, cache_dir: str = None, max_mb: int = None):
+        super().__init__(os.path.join(cache_dir or DEFAULT_CACHE_DIR, 'frames'),
+                         (max_mb if max_mb is not None else DEFAULT_FRAME_CACHE_MB) * 1024 * 1024,
+                         '.feather')
+        self.enabled = pa is not None
+
+    def frame_key(self, file_path: str, sheet: str = None, options: Dict[str, Any] = None) -> str:
+        """Key a cleaned frame by file content, sheet / range and cleaning options"""
+        return self.make_key(file_digest(file_path), sheet, options or {})
+
+    def get(self, key: str, arrow_strings: bool = False) -> Optional[pd.DataFrame]:
+        """Load a cached frame through a memory map, or None on a miss; the frame owns its numeric data"""
+        if not self.enabled:
+            return None
+        path = self.lookup(key)
+        if path is None:
+            return None
+        try:
+            # The table's buffers keep the mapping alive for as long as the frame needs them
+            table = pa.ipc.open_file(pa.memory_map(path, 'r')).read_all()
+            # Numeric columns are copied into consolidated blocks: zero-copy views on the read-only mapping
+            # would make in-place edits fail on a cache hit but not on a miss
+            types_mapper = None
+            if arrow_strings:
+                arrow_string = pd.StringDtype('pyarrow')
+                types_mapper = {pa.string(): arrow_string, pa.large_string(): arrow_string}.get
+            return table.to_pandas(types_mapper=types_mapper)
+        except Exception as e:
+            print(f"Warning: Could not read cached frame {path}: {e}")
+            self.remove(key)
+            return None
+
+    def put(self, key: str, df: pd.DataFrame) -> bool:
+        """Store a frame; frames Arrow cannot represent are skipped"""
+        if not self.enabled:
+            return False
+        if not all(isinstance(col, str) for col in df.columns):
+            return False
+        temp_path = self.temp_path()
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=True)
+            with pa.OSFile(temp_path, 'wb') as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            self.commit(temp_path, key)
+            return True
+        except Exception as e:
+            print(f"Warning: Could not cache cleaned frame: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return False
+
+
+# The only classes a stored analysis state may rebuild; their fields are restored as plain data
+_STATE_CLASSES = {cls.__name__: cls for cls in (
+    StreamingProfile, NumericAccumulator, ReservoirSample, RowReservoir, CategoricalAccumulator,
+    CorrelationAccumulator, CategoricalSketch, HyperLogLog, SpaceSaving, RowHashSet
+)}
+
+
+def _frame_to_ipc(df: pd.DataFrame) -> bytes:
+    table = pa.Table.from_pandas(df, preserve_index=True)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+class _StateEncoder:
+    """JSON-ready copy of an analysis state; arrays and frames are moved into binary blobs"""
+
+    def __init__(self):
+        self.blobs = []
+
+    def _blob(self, data: bytes) -> int:
+        self.blobs.append(data)
+        return len(self.blobs) - 1
+
+    def encode(self, value: Any) -> Any:
+        if type(value).__name__ in _STATE_CLASSES and type(value) is _STATE_CLASSES[type(value).__name__]:
+            return {'$object': type(value).__name__, 'fields': self.encode(vars(value))}
+        if isinstance(value, np.random.Generator):
+            return {'$rng': value.bit_generator.state}
+        if isinstance(value, pd.Series):
+            return {'$series': self._blob(_frame_to_ipc(value.to_frame('values'))), 'name': self.encode(value.name)}
+        if isinstance(value, pd.DataFrame):
+            return {'$frame': self._blob(_frame_to_ipc(value))}
+        if isinstance(value, np.ndarray):
+            if value.dtype.hasobject:
+                raise TypeError("Object arrays cannot be stored in analysis state")
+            return {'$array': self._blob(np.ascontiguousarray(value).tobytes()),
+                    'dtype': value.dtype.str, 'shape': list(value.shape)}
+        if isinstance(value, Mapping):
+            if not all(isinstance(key, str) for key in value):
+                raise TypeError("Analysis state mappings must have string keys")
+            return {key: self.encode(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [self.encode(item) for item in value]
+        if value is pd.NaT:
+            return {'$datetime': None}
+        if isinstance(value, (datetime, date, np.datetime64)):
+            return {'$datetime': pd.Timestamp(value).isoformat()}
+        if isinstance(value, np.generic):
+            return value.item()
+        if value is None or isinstance(value, (str, int, float, bool)):
+            return value
+        raise TypeError(f"Cannot store {type(value).__name__} in analysis state")
+
+
+def _state_decoder(blobs: pa.ChunkedArray):
+    """json object_hook rebuilding what _StateEncoder wrote"""
+    def decode(obj: Dict[str, Any]) -> Any:
+        if '$object' in obj:
+            instance = _STATE_CLASSES[obj['$object']].__new__(_STATE_CLASSES[obj['$object']])
+            vars(instance).update(obj['fields'])
+            return instance
+        if '$rng' in obj:
+            rng = np.random.default_rng()
+            rng.bit_generator.state = obj['$rng']
+            return rng
+        if '$series' in obj:
+            frame = pa.ipc.open_stream(blobs[obj['$series']].as_py()).read_all().to_pandas()
+            return frame['values'].rename(obj['name'])
+        if '$frame' in obj:
+            return pa.ipc.open_stream(blobs[obj['$frame']].as_py()).read_all().to_pandas()
+        if '$array' in obj:
+            values = np.frombuffer(blobs[obj['$array']].as_py(), dtype=np.dtype(obj['dtype']))
+            return values.reshape(obj['shape']).copy()  # Writable, like the arrays the state was built with
+        if '$datetime' in obj:
+            return pd.NaT if obj['$datetime'] is None else pd.Timestamp(obj['$datetime'])
+        return obj
+    return decode
+
+
+class ProfileStore(DiskLRUCache):
+    """Mergeable analysis state per dataset, stored with the byte prefix of the file it covers.
+
+    States are Arrow IPC files: the accumulators' fields as JSON in the schema metadata, their
+    arrays and frames as binary blobs. Only the accumulator classes in _STATE_CLASSES are rebuilt.
+    """
+
+    def __init__(self, cache_dir: str = None, max_mb: int = None):
+        super().__init__(os.path.join(cache_dir or DEFAULT_CACHE_DIR, 'profiles'),
+                         (max_mb if max_mb is not None else DEFAULT_PROFILE_CACHE_MB) * 1024 * 1024,
+                         '.arrow')
+        self.enabled = pa is not None
+
+    def state_key(self, file_path: str, options: Dict[str, Any] = None) -> str:
+        """Key the state by dataset location (not content: the content is expected to grow)"""
+        return self.make_key(os.path.abspath(file_path), options or {})
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        if not self.enabled:
+            return None
+        path = self.lookup(key)
+        if path is None:
+            return None
+        try:
+            table = pa.ipc.open_file(pa.memory_map(path, 'r')).read_all()
+            return json.loads(table.schema.metadata[b'state'], object_hook=_state_decoder(table.column('blobs')))
+        except Exception as e:
+            print(f"Warning: Could not read saved analysis state {path}: {e}")
+            self.remove(key)
+            return None
+
+    def put(self, key: str, state: Dict[str, Any]) -> bool:
+        if not self.enabled:
+            return False
+        temp_path = self.temp_path()
+        try:
+            encoder = _StateEncoder()
+            metadata = json.dumps(encoder.encode(state))
+            table = pa.table({'blobs': pa.array(encoder.blobs, type=pa.large_binary())})
+            table = table.replace_schema_metadata({'state': metadata})
+            with pa.OSFile(temp_path, 'wb') as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            self.commit(temp_path, key)
+            return True
+        except Exception as e:
+            print(f"Warning: Could not save analysis state: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return False
+
+    def covers_prefix(self, state: Dict[str, Any], file_path: str) -> bool:
+        """True if the file still starts with the exact bytes the state was built from"""
+        offset = state.get('offset', 0)
+        if offset <= 0 or offset > os.path.getsize(file_path):
+            return False
+        return prefix_fingerprint(file_path, offset) == state.get('fingerprint')
+
+
+def _to_json_value(value: Any) -> Any:
+    """JSON-ready copy of an analysis value: NumPy scalars become Python numbers, timestamps are tagged,
+    and a LazyAnalysis keeps only its computed metrics, tagged as partial while any are pending"""
+    if isinstance(value, LazyAnalysis):
+        computed = {str(key): _to_json_value(value[key]) for key in value if value.is_computed(key)}
+        return {'$partial': computed} if value.pending() else computed
+    if isinstance(value, CorrelationMatrix):
+        return None  # Stored as the typed column
+    if isinstance(value, Mapping):
+        return {str(key): _to_json_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_json_value(item) for item in value]
+    if value is None or value is pd.NA or value is pd.NaT:
+        return None
+    if isinstance(value, (datetime, date, np.datetime64)):
+        return {'$datetime': pd.Timestamp(value).isoformat()}
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def _from_json_object(obj: Dict[str, Any]) -> Any:
+    if set(obj) == {'$datetime'}:
+        return pd.Timestamp(obj['$datetime'])
+    if set(obj) == {'$partial'}:
+        return PartialAnalysis(obj['$partial'])
+    return obj
+
+
+class AnalysisStore(DiskLRUCache):
+    """Analyses as Arrow IPC files: the correlation matrix as one typed float64 column (upper
+    triangle only, the matrix is symmetric) and everything else as JSON in the schema metadata"""
+
+    def __init__(self, cache_dir: str = None, max_mb: int = None):
+        super().__init__(os.path.join(cache_dir or DEFAULT_CACHE_DIR, 'analyses'),
+                         (max_mb if max_mb is not None else DEFAULT_ANALYSIS_CACHE_MB) * 1024 * 1024,
+                         '.arrow')
+        self.enabled = pa is not None
+
+    def analysis_key(self, file_path: str, sheet: str = None, options: Dict[str, Any] = None) -> str:
+        """Key an analysis by file content, sheet / range and analysis options"""
+        return self.make_key(file_digest(file_path), sheet, options or {})
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Load a stored analysis (a PartialAnalysis if it was saved half-computed), or None on a miss"""
+        if not self.enabled:
+            return None
+        path = self.lookup(key)
+        if path is None:
+            return None
+        try:
+            table = pa.ipc.open_file(pa.memory_map(path, 'r')).read_all()
+            metadata = table.schema.metadata
+            analysis = json.loads(metadata[b'analysis'], object_hook=_from_json_object)
+            if 'shape' in analysis:
+                analysis['shape'] = tuple(analysis['shape'])
+            columns = json.loads(metadata[b'correlation_columns'])
+            if columns is not None:
+                values = np.empty((len(columns), len(columns)))
+                rows, cols = np.triu_indices(len(columns))
+                triangle = table.column('correlations').to_numpy()
+                values[rows, cols] = triangle
+                values[cols, rows] = triangle
+                analysis['correlations'] = CorrelationMatrix(columns, values)
+            return analysis
+        except Exception as e:
+            print(f"Warning: Could not read stored analysis {path}: {e}")
+            self.remove(key)
+            return None
+
+    def put(self, key: str, analysis: Dict[str, Any]) -> bool:
+        """Store an analysis; metrics a LazyAnalysis has not computed are left out and load back as a PartialAnalysis"""
+        if not self.enabled:
+            return False
+        temp_path = self.temp_path()
+        try:
+            correlations = None
+            if 'correlations' in analysis and (not isinstance(analysis, LazyAnalysis) or analysis.is_computed('correlations')):
+                correlations = analysis['correlations']
+            columns, triangle = None, np.empty(0)
+            if correlations is not None:
+                columns = list(correlations.columns)
+                triangle = np.asarray(correlations.values, dtype=np.float64)[np.triu_indices(len(columns))]
+            table = pa.table({'correlations': pa.array(triangle, type=pa.float64())})
+            table = table.replace_schema_metadata({
+                'analysis': json.dumps(_to_json_value(analysis)),
+                'correlation_columns': json.dumps(columns)
+            })
+            with pa.OSFile(temp_path, 'wb') as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            self.commit(temp_path, key)
+            return True
+        except Exception as e:
+            print(f"Warning: Could not store analysis: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return False
+
+
+class ResponseCache(DiskLRUCache):
+    """Parsed AI responses as JSON files, keyed by the request and dropped once older than the TTL"""
+
+    def __init__(self, cache_dir: str = None, max_mb: int = None, ttl_hours: float = None):
+        super().__init__(os.path.join(cache_dir or DEFAULT_CACHE_DIR, 'responses'),
+                         (max_mb if max_mb is not None else DEFAULT_RESPONSE_CACHE_MB) * 1024 * 1024,
+                         '.json')
+        self.ttl_seconds = (ttl_hours if ttl_hours is not None else DEFAULT_RESPONSE_TTL_HOURS) * 3600
+        self.enabled = True
+
+    def request_key(self, model: str, temperature: float, messages: Any, **params) -> str:
+        """Key a response by model, temperature, the full prompt messages and any other request parameters"""
+        return self.make_key(model, temperature, messages, params)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """The parsed response, or None on a miss or when it has expired"""
+        if not self.enabled:
+            return None
+        path = self.lookup(key)
+        if path is None:
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except Exception as e:
+            print(f"Warning: Could not read cached AI response {path}: {e}")
+            self.remove(key)
+            return None
+        # The file's modification time is the LRU clock, so the age is kept inside the entry
+        if time.time() - entry['created'] > self.ttl_seconds:
+            self.remove(key)
+            return None
+        return entry['response']
+
+    def put(self, key: str, response: Dict[str, Any]) -> bool:
+        if not self.enabled:
+            return False
+        temp_path = self.temp_path()
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'created': time.time(), 'response': response}, f)
+            self.commit(temp_path, key)
+            return True
+        except Exception as e:
+            print(f"Warning: Could not cache AI response: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return False
@@ -0,0 +1,351 @@
+"""
+Excel Reader
+Opens a workbook once and serves sheet dimensions, named ranges and sheet
+DataFrames from that single parsed workbook
+"""
+
+import os
+import re
+import posixpath
+import zipfile
+import xml.etree.ElementTree as ET
+from typing import Dict, Any, List, Tuple, Optional, Iterator
+
+import pandas as pd
+import openpyxl
+import xlrd
+
+
+# Decompressed bytes read from a sheet part when it has no usable <dimension> tag
+DIMENSION_SCAN_BYTES = 8 * 1024 * 1024
+# Worksheet header bytes searched for the <dimension> tag, which precedes <sheetData>
+DIMENSION_HEADER_BYTES = 64 * 1024
+
+_DIMENSION_RE = re.compile(rb'<(?:\w+:)?dimension\b[^>]*?\bref="([^"]+)"')
+_SHEET_DATA_RE = re.compile(rb'<(?:\w+:)?sheetData\b')
+_ROW_RE = re.compile(rb'<(?:\w+:)?row\b[^>]*?\br="(\d+)"')
+_CELL_COLUMN_RE = re.compile(rb'<(?:\w+:)?c\b[^>]*?\br="([A-Z]+)\d+"')
+_CELL_REF_RE = re.compile(r'\$?([A-Z]+)\$?(\d+)$')
+_SHEET_REF_RE = re.compile(r"^(?:'((?:[^']|'')+)'|([^!]+))!")
+# A1-style area: cell range, whole columns (A:D) or whole rows (1:20), with optional $ anchors
+_AREA_RE = re.compile(r'^\$?([A-Z]*)\$?(\d*)(?::\$?([A-Z]*)\$?(\d*))?$')
+# Worksheet limits (XFD1048576); larger references are names, not cells
+MAX_EXCEL_ROWS = 1048576
+MAX_EXCEL_COLUMNS = 16384
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit('}', 1)[-1]
+
+
+def _column_number(letters: str) -> int:
+    number = 0
+    for letter in letters:
+        number = number * 26 + ord(letter) - ord('A') + 1
+    return number
+
+
+def _scan_sheet_part(stream, head: bytes, part_size: int, scan_bytes: int) -> Tuple[int, int, str]:
+    """Bounded scan of a sheet's XML: exact when the part ends within the budget, extrapolated otherwise"""
+    data, max_row, max_col, read = head, 0, 0, len(head)
+    while True:
+        # Only complete tags are matched; the unfinished tail is carried into the next block
+        cut = data.rfind(b'>') + 1
+        block, data = data[:cut], data[cut:]
+        rows = _ROW_RE.findall(block)
+        if rows:
+            max_row = max(max_row, int(rows[-1]))
+        for letters in set(_CELL_COLUMN_RE.findall(block)):
+            max_col = max(max_col, _column_number(letters.decode()))
+        if read >= scan_bytes:
+            break
+        chunk = stream.read(1024 * 1024)
+        if not chunk:
+            return max_row, max_col, 'scan'
+        data += chunk
+        read += len(chunk)
+    # Rows are written in order, so the row number reached grows with the bytes read
+    return int(max_row * part_size / read), max_col, 'estimate'
+
+
+def _probe_sheet_part(archive: zipfile.ZipFile, part: str, scan_bytes: int) -> Tuple[int, int, str]:
+    """(max_row, max_col, source) from the sheet's <dimension> tag, or a bounded scan without one"""
+    part_size = archive.getinfo(part).file_size
+    with archive.open(part) as stream:
+        head = b''
+        while len(head) < DIMENSION_HEADER_BYTES:
+            chunk = stream.read(16 * 1024)
+            if not chunk:
+                break
+            head += chunk
+            if _SHEET_DATA_RE.search(head):
+                break
+
+        match = _DIMENSION_RE.search(head)
+        if match:
+            last_cell = match.group(1).decode().split(':')[-1]
+            ref = _CELL_REF_RE.match(last_cell)
+            # A bare "A1" is what some writers emit for any size, so it only counts for tiny parts
+            if ref and (':' in match.group(1).decode() or part_size <= DIMENSION_HEADER_BYTES):
+                return int(ref.group(2)), _column_number(ref.group(1)), 'dimension'
+        return _scan_sheet_part(stream, head, part_size, scan_bytes)
+
+
+def probe_xlsx(file_path: str, scan_bytes: int = DIMENSION_SCAN_BYTES) -> Dict[str, Any]:
+    """Sheet names, dimensions and named ranges read from the workbook part and each sheet header only"""
+    with zipfile.ZipFile(file_path) as archive:
+        workbook = ET.fromstring(archive.read('xl/workbook.xml'))
+        relationships = ET.fromstring(archive.read('xl/_rels/workbook.xml.rels'))
+        targets = {}
+        for rel in relationships:
+            target = rel.get('Target', '')
+            targets[rel.get('Id')] = target.lstrip('/') if target.startswith('/') else posixpath.normpath(
+                posixpath.join('xl', target))
+
+        sheets = {}
+        for element in workbook.iter():
+            if _local_name(element.tag) != 'sheet':
+                continue
+            rel_id = next((value for key, value in element.attrib.items() if _local_name(key) == 'id'), None)
+            part = targets.get(rel_id)
+            if part and 'worksheets/' in part and part in archive.NameToInfo:
+                max_row, max_col, source = _probe_sheet_part(archive, part, scan_bytes)
+            else:
+                max_row, max_col, source = 0, 0, 'not a worksheet'  # Chartsheets and dialog sheets hold no cells
+            sheets[element.get('name')] = {'max_row': max_row, 'max_col': max_col, 'dimension_source': source}
+
+        named_ranges = []
+        for element in workbook.iter():
+            if _local_name(element.tag) != 'definedName':
+                continue
+            name = element.get('name', '')
+            # Reserved (_xlnm.*) names and sheet-scoped names are skipped, as openpyxl's workbook list does
+            if name.startswith('_xlnm') or element.get('localSheetId') is not None:
+                continue
+            value = (element.text or '').strip()
+            sheet, _ = _split_sheet_reference(value)
+            named_ranges.append({'name': name, 'range': value, 'sheet': sheet or 'Unknown'})
+
+    return {'sheets': sheets, 'named_ranges': named_ranges}
+
+
+def _split_sheet_reference(reference: str) -> Tuple[Optional[str], str]:
+    """Split "'My Sheet'!A1:B2" into the sheet name (or None) and the cell area"""
+    match = _SHEET_REF_RE.match(reference)
+    if match is None:
+        return None, reference
+    sheet = match.group(1).replace("''", "'") if match.group(1) is not None else match.group(2)
+    return sheet, reference[match.end():]
+
+
+def _parse_area(area: str) -> Optional[Tuple[int, int, Optional[int], Optional[int]]]:
+    """(min_row, min_col, max_row, max_col) of an A1 area, or None if it is not one"""
+    match = _AREA_RE.match(area.strip().upper())
+    if match is None:
+        return None
+    first_col, first_row, last_col, last_row = match.groups()
+    if last_col is None and last_row is None:
+        if not (first_col and first_row):
+            return None  # A lone column or row ("SALES", "12") is not a reference
+        last_col, last_row = first_col, first_row  # Single cell
+    corners = [(first_col, first_row), (last_col, last_row)]
+    # Both ends are cells (A1:C9), whole columns (A:C) or whole rows (1:9)
+    if not (all(col and row for col, row in corners) or all(col and not row for col, row in corners)
+            or all(row and not col for col, row in corners)):
+        return None
+    columns = [_column_number(col) for col in (first_col, last_col) if col]
+    rows = [int(row) for row in (first_row, last_row) if row]
+    if any(not 1 <= col <= MAX_EXCEL_COLUMNS for col in columns) or any(not 1 <= row <= MAX_EXCEL_ROWS for row in rows):
+        return None
+    return (
+        int(first_row) if first_row else 1,
+        _column_number(first_col) if first_col else 1,
+        int(last_row) if last_row else None,
+        _column_number(last_col) if last_col else None
+    )
+
+
+def _header_names(header: Tuple[Any, ...]) -> List[str]:
+    """Column names from a header row, with pandas' names for blank and repeated headers"""
+    names, seen = [], {}
+    for i, value in enumerate(header):
+        name = f"Unnamed: {i}" if value is None or str(value).strip() == '' else str(value)
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        names.append(name)
+    return names
+
+
+class ExcelSession:
+    """One opened workbook shared by sheet info, sheet selection and DataFrame loading"""
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.is_xls = os.path.splitext(file_path)[1].lower() == '.xls'
+        self._workbook = None
+        self._excel_file: Optional[pd.ExcelFile] = None
+        self._dimensions: Dict[str, Tuple[int, int]] = {}
+        self._probe: Optional[Dict[str, Any]] = None
+
+    @property
+    def workbook(self):
+        """The parsed workbook, opened on first use"""
+        if self._workbook is None:
+            if self.is_xls:
+                # on_demand loads each sheet only when it is first accessed
+                self._workbook = xlrd.open_workbook(self.file_path, on_demand=True)
+            else:
+                # Same options pandas uses, so the workbook can be handed straight to pd.ExcelFile
+                self._workbook = openpyxl.load_workbook(self.file_path, read_only=True, data_only=True, keep_links=False)
+        return self._workbook
+
+    @property
+    def excel_file(self) -> pd.ExcelFile:
+        """pandas view over the already-parsed workbook"""
+        if self._excel_file is None:
+            engine = 'xlrd' if self.is_xls else 'openpyxl'
+            self._excel_file = pd.ExcelFile(self.workbook, engine=engine)
+        return self._excel_file
+
+    @property
+    def probe(self) -> Dict[str, Any]:
+        """Sheet and named-range metadata of an .xlsx file, read without opening the workbook"""
+        if self._probe is None:
+            self._probe = probe_xlsx(self.file_path)
+        return self._probe
+
+    @property
+    def sheet_names(self) -> List[str]:
+        if self.is_xls:
+            return self.workbook.sheet_names()
+        return list(self.probe['sheets'])
+
+    def sheet_dimensions(self, sheet_name: str) -> Tuple[int, int]:
+        """(max_row, max_col) of a sheet, remembered for the life of the session"""
+        if sheet_name not in self._dimensions:
+            if self.is_xls:
+                sheet = self.workbook.sheet_by_name(sheet_name)
+                self._dimensions[sheet_name] = (sheet.nrows, sheet.ncols)
+            else:
+                sheet = self.probe['sheets'][sheet_name]
+                self._dimensions[sheet_name] = (sheet['max_row'], sheet['max_col'])
+        return self._dimensions[sheet_name]
+
+    def dimension_source(self, sheet_name: str) -> str:
+        """How a sheet's dimensions were found: 'dimension' tag, full 'scan' or bounded-scan 'estimate'"""
+        if self.is_xls:
+            return 'dimension'
+        return self.probe['sheets'][sheet_name]['dimension_source']
+
+    def named_ranges(self) -> List[Dict[str, Any]]:
+        """Workbook-level defined names that refer to cell ranges"""
+        if self.is_xls:
+            return self._xls_named_ranges()
+        return self.probe['named_ranges']
+
+    def _xls_named_ranges(self) -> List[Dict[str, Any]]:
+        named_ranges = []
+        for name in self.workbook.name_obj_list:
+            if name.builtin:
+                continue
+            try:
+                sheet, row_lo, row_hi, col_lo, col_hi = name.area2d()
+            except Exception:
+                continue  # Constants and formulas are not cell ranges
+            named_ranges.append({
+                'name': name.name,
+                'range': f"{sheet.name}!{xlrd.formula.rangename2d(row_lo, row_hi, col_lo, col_hi)}",
+                'sheet': sheet.name
+            })
+        return named_ranges
+
+    def resolve_range(self, reference: str, default_sheet: str = None) -> Tuple[str, Tuple[int, int, Optional[int], Optional[int]]]:
+        """Sheet and (min_row, min_col, max_row, max_col) of a defined name or an A1 range; None means open-ended"""
+        # Defined names are case-insensitive in Excel
+        defined = {named_range['name'].casefold(): named_range['range'] for named_range in self.named_ranges()}
+        is_name = reference.casefold() in defined
+        address = defined.get(reference.casefold(), reference).lstrip('=')
+        areas = address.split(',')
+        if len(areas) > 1:
+            print(f"⚠️  '{reference}' covers {len(areas)} areas - loading the first one ({areas[0]})")
+        sheet, area = _split_sheet_reference(areas[0].strip())
+        bounds = _parse_area(area)
+        if bounds is None:
+            if is_name:
+                raise ValueError(f"Named range '{reference}' does not refer to a cell range ({address})")
+            raise ValueError(f"Unknown named range '{reference}': it is not a defined name in this workbook "
+                             f"nor a cell range such as A1:D20 or Sheet1!A1:D20")
+        sheet = sheet or default_sheet or self.sheet_names[0]
+        if sheet not in self.sheet_names:
+            raise ValueError(f"Range '{reference}' refers to unknown sheet '{sheet}'")
+        return sheet, bounds
+
+    def read_range(self, sheet_name: str, bounds: Tuple[int, int, Optional[int], Optional[int]]) -> pd.DataFrame:
+        """Read only the cells inside bounds; the first row of the area is the header"""
+        min_row, min_col, max_row, max_col = bounds
+        if self.is_xls:
+            sheet = self.workbook.sheet_by_name(sheet_name)
+            last_row = min(max_row or sheet.nrows, sheet.nrows)
+            last_col = min(max_col or sheet.ncols, sheet.ncols)
+            rows = (tuple(sheet.row_values(r, min_col - 1, last_col)) for r in range(min_row - 1, last_row))
+        else:
+            # Read-only iteration stops at max_row, so rows below the range are never parsed
+            rows = self.workbook[sheet_name].iter_rows(min_row=min_row, max_row=max_row, min_col=min_col,
+                                                       max_col=max_col, values_only=True)
+
+        header = next(rows, None)
+        if header is None:
+            return pd.DataFrame()
+        columns = _header_names(header)
+        return pd.DataFrame.from_records(list(rows), columns=columns).infer_objects()
+
+    def parse(self, sheet_name=0, **kwargs) -> pd.DataFrame:
+        """Convert a sheet of the open workbook to a DataFrame (same options as pd.read_excel)"""
+        return self.excel_file.parse(sheet_name=sheet_name, **kwargs)
+
+    def iter_chunks(self, sheet_name: str, chunksize: int) -> Iterator[pd.DataFrame]:
+        """Yield a sheet as DataFrames of at most chunksize rows, reading rows lazily from the XML"""
+        if self.is_xls:
+            # The .xls format caps sheets at 65,536 rows, so the whole sheet is loaded and sliced
+            df = self.parse(sheet_name)
+            for start in range(0, len(df), chunksize):
+                yield df.iloc[start:start + chunksize].copy()
+            return
+
+        rows = self.workbook[sheet_name].iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        columns = _header_names(header)
+        width = len(columns)
+
+        batch = []
+        for row in rows:
+            if len(row) != width:
+                row = (row + (None,) * width)[:width]
+            batch.append(row)
+            if len(batch) == chunksize:
+                yield pd.DataFrame.from_records(batch, columns=columns)
+                batch = []
+        if batch:
+            yield pd.DataFrame.from_records(batch, columns=columns)
+
+    def close(self):
+        if self._workbook is not None:
+            if self.is_xls:
+                self._workbook.release_resources()
+            else:
+                self._workbook.close()
+        self._workbook = None
+        self._excel_file = None
+        self._dimensions = {}
+        self._probe = None
+
+    def __enter__(self) -> 'ExcelSession':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,87 @@
+"""
+JSON Stream
+Incremental scanner for a JSON object arriving in pieces (a streamed model
+response), handing out the elements of one top-level array as each completes
+"""
+
+import json
+from typing import Dict, Any, List, Optional
+
+
+class JSONStreamExtractor:
+    """Scans streamed text once, from the first '{' to the brace that closes it.
+
+    Text before the object (prose, code fences) and after it is ignored, as the
+    previous whole-response regex did. Only the characters fed since the last call are scanned.
+    """
+
+    def __init__(self, array_key: str):
+        self.array_key = array_key
+        self.text = ''
+        self._start = None  # Offset of the object's opening brace
+        self._end = None  # Offset just past its closing brace
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._last_string = None  # Last string closed at the top level: the next ':' makes it the key
+        self._key = None
+        self._in_array = False
+        self._element_start = None
+
+    def feed(self, piece: str) -> List[Dict[str, Any]]:
+        """Add the next piece of text; returns the array's objects completed within it"""
+        completed = []
+        position = len(self.text)
+        self.text += piece
+        if self._end is not None:
+            return completed
+        text = self.text
+        for i in range(position, len(text)):
+            ch = text[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == '\\':
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._depth == 1:
+                        self._last_string = json.loads(text[self._string_start:i + 1])
+                continue
+            if self._depth == 0:
+                if ch == '{':
+                    self._depth = 1
+                    self._start = i
+                continue
+            if ch == '"':
+                self._in_string = True
+                self._string_start = i
+            elif ch == ':' and self._depth == 1:
+                self._key = self._last_string
+            elif ch == '{' or ch == '[':
+                self._depth += 1
+                if ch == '[' and self._depth == 2 and self._key == self.array_key:
+                    self._in_array = True
+                elif ch == '{' and self._in_array and self._depth == 3:
+                    self._element_start = i
+            elif ch == '}' or ch == ']':
+                self._depth -= 1
+                if self._depth == 2 and self._element_start is not None:
+                    try:
+                        completed.append(json.loads(text[self._element_start:i + 1]))
+                    except ValueError:
+                        pass  # A malformed element is left for the final parse to reject
+                    self._element_start = None
+                elif self._depth == 1:
+                    self._in_array = False
+                elif self._depth == 0:
+                    self._end = i + 1
+                    break
+        return completed
+
+    def document(self) -> Optional[Dict[str, Any]]:
+        """The whole object once its closing brace has arrived, else None"""
+        if self._end is None:
+            return None
+        return json.loads(self.text[self._start:self._end])
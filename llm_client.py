@@ -0,0 +1,65 @@
+"""
+LLM Client
+One pooled OpenAI client per process instead of one per generator: a sync client
+for blocking calls, and async clients driven from a background event loop so
+concurrent insight requests multiplex over the same keep-alive connections
+"""
+
+import asyncio
+import os
+import threading
+import weakref
+from typing import Dict, Any, Coroutine, Tuple
+
+import openai
+
+DEFAULT_AI_CONCURRENCY = int(os.getenv('INSIGHTDECK_AI_CONCURRENCY', '8'))
+
+_lock = threading.Lock()
+# Keyed by process id as well, so a forked worker builds its own pool instead of sharing the parent's sockets
+_sync_clients: Dict[Tuple[int, str], openai.OpenAI] = {}
+# An async client's connections belong to the event loop that opened them
+_async_clients: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, openai.AsyncOpenAI]]' = \
+    weakref.WeakKeyDictionary()
+_background_loops: Dict[int, asyncio.AbstractEventLoop] = {}
+
+
+def shared_client(api_key: str) -> openai.OpenAI:
+    """The process's sync client for this API key; its connection pool is shared by every caller"""
+    key = (os.getpid(), api_key)
+    with _lock:
+        client = _sync_clients.get(key)
+        if client is None:
+            client = _sync_clients[key] = openai.OpenAI(api_key=api_key)
+        return client
+
+
+def shared_async_client(api_key: str) -> openai.AsyncOpenAI:
+    """The async client for this API key on the running event loop"""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        clients = _async_clients.setdefault(loop, {})
+        client = clients.get(api_key)
+        if client is None:
+            client = clients[api_key] = openai.AsyncOpenAI(api_key=api_key)
+        return client
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    """The process's event loop thread, started on first use"""
+    with _lock:
+        loop = _background_loops.get(os.getpid())
+        if loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name='llm-client-loop', daemon=True).start()
+            _background_loops[os.getpid()] = loop
+        return loop
+
+
+def run_async(coroutine: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine on the shared background loop from synchronous code and wait for its result.
+
+    Every caller uses the same loop, so concurrent callers (e.g. web request threads) share
+    one async client and its keep-alive connections. Not for use from a coroutine on that loop.
+    """
+    return asyncio.run_coroutine_threadsafe(coroutine, _background_loop()).result()
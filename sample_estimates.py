@@ -0,0 +1,131 @@
+"""
+Sample Estimates
+Confidence intervals for statistics computed on a uniform row sample, so a
+preview analysis can say how far its numbers may be from the full-data values.
+Every interval narrows with the finite-population correction as the sample
+approaches the whole file
+"""
+
+import math
+from statistics import NormalDist
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_CONFIDENCE = 0.95
+QUANTILES = [0.25, 0.5, 0.75]
+
+
+def _z_value(confidence: float) -> float:
+    return NormalDist().inv_cdf(0.5 + confidence / 2)
+
+
+def _interval(estimate: float, low: float, high: float) -> Dict[str, float]:
+    return {"estimate": float(estimate), "low": float(low), "high": float(high)}
+
+
+def finite_population_correction(sample_rows: int, population_rows: Optional[int]) -> float:
+    """Shrink factor for standard errors when the sample is a large share of the population"""
+    if not population_rows or population_rows <= 1:
+        return 1.0
+    if sample_rows >= population_rows:
+        return 0.0  # The sample is the whole population
+    return math.sqrt((population_rows - sample_rows) / (population_rows - 1))
+
+
+def mean_interval(values: np.ndarray, z: float, fpc: float = 1.0) -> Optional[Dict[str, float]]:
+    """Normal-approximation interval for the mean"""
+    n = len(values)
+    if n < 2:
+        return None
+    mean = values.mean()
+    margin = z * values.std(ddof=1) / math.sqrt(n) * fpc
+    return _interval(mean, mean - margin, mean + margin)
+
+
+def quantile_interval(sorted_values: np.ndarray, q: float, z: float, fpc: float = 1.0) -> Optional[Dict[str, float]]:
+    """Distribution-free interval for a quantile from binomial order-statistic ranks"""
+    n = len(sorted_values)
+    if n < 2:
+        return None
+    margin = z * math.sqrt(n * q * (1 - q)) * fpc
+    low_rank = max(int(math.floor(n * q - margin)), 0)
+    high_rank = min(int(math.ceil(n * q + margin)), n - 1)
+    return _interval(np.quantile(sorted_values, q), sorted_values[low_rank], sorted_values[high_rank])
+
+
+def wilson_interval(count: int, n: int, z: float, fpc: float = 1.0) -> Optional[Dict[str, float]]:
+    """Wilson score interval for a share, reported in percent"""
+    if n == 0:
+        return None
+    z = z * fpc  # The corrected standard error is the uncorrected one times fpc, so z scales with it
+    share = count / n
+    denominator = 1 + z ** 2 / n
+    center = (share + z ** 2 / (2 * n)) / denominator
+    margin = z * math.sqrt(share * (1 - share) / n + z ** 2 / (4 * n ** 2)) / denominator
+    return _interval(share * 100, max(center - margin, 0) * 100, min(center + margin, 1) * 100)
+
+
+def correlation_intervals(r: np.ndarray, n: np.ndarray, z: float,
+                          fpc: float = 1.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Fisher z-transform intervals for arrays of Pearson correlations and pair counts.
+
+    Returns (valid, low, high); pairs with at most 3 values or no correlation are not valid.
+    """
+    valid = (n > 3) & ~np.isnan(r)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        center = np.arctanh(np.clip(r, -1.0, 1.0))  # Infinite at |r| = 1, where the interval is the point
+        margin = z * fpc / np.sqrt(np.where(valid, n - 3, 1))
+    return valid, np.tanh(center - margin), np.tanh(center + margin)
+
+
+def estimate_intervals(sample: pd.DataFrame, numeric_cols: List[str], categorical_cols: List[str],
+                       population_rows: Optional[int] = None, confidence: float = DEFAULT_CONFIDENCE,
+                       top_categories: int = 5) -> Dict[str, Any]:
+    """Estimated means, quartiles, top category shares and correlations with confidence intervals"""
+    z = _z_value(confidence)
+    sample_rows = len(sample)
+    fpc = finite_population_correction(sample_rows, population_rows)
+
+    means, quantiles = {}, {}
+    for col in numeric_cols:
+        values = sample[col].dropna().to_numpy(dtype=float)
+        values = values[np.isfinite(values)]
+        interval = mean_interval(values, z, fpc)
+        if interval is None:
+            continue
+        means[col] = interval
+        values.sort()
+        quantiles[col] = {f"{int(q * 100)}%": quantile_interval(values, q, z, fpc) for q in QUANTILES}
+
+    category_shares = {}
+    for col in categorical_cols:
+        counts = sample[col].value_counts()
+        n = int(counts.sum())
+        if n == 0:
+            continue
+        category_shares[col] = {value: wilson_interval(int(count), n, z, fpc)
+                                for value, count in counts.head(top_categories).items()}
+
+    correlations = {}
+    if len(numeric_cols) >= 2:
+        numeric = sample[numeric_cols].astype(float)
+        corr_matrix = numeric.corr()
+        present = numeric.notna().to_numpy(dtype=float)
+        pair_counts = present.T @ present  # Rows where both columns have a value
+        rows, cols = np.triu_indices(len(numeric_cols), k=1)
+        r = corr_matrix.to_numpy()[rows, cols]
+        valid, low, high = correlation_intervals(r, pair_counts[rows, cols], z, fpc)
+        for k in np.flatnonzero(valid):
+            correlations.setdefault(numeric_cols[rows[k]], {})[numeric_cols[cols[k]]] = _interval(r[k], low[k], high[k])
+
+    return {
+        "confidence_level": confidence,
+        "sample_rows": sample_rows,
+        "population_rows": population_rows,
+        "means": means,
+        "quantiles": quantiles,
+        "category_shares": category_shares,
+        "correlations": correlations
+    }
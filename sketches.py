@@ -0,0 +1,179 @@
+"""
+Categorical Sketches
+Bounded-memory, mergeable summaries for text columns too large for exact
+frequency tables: HyperLogLog distinct counts and Space-Saving heavy hitters,
+each reporting how far its answers may be from the exact values
+"""
+
+import math
+from typing import Dict, Any
+
+import numpy as np
+import pandas as pd
+
+HLL_PRECISION = 14  # 2^14 one-byte registers per column, about 0.8% standard error
+HEAVY_HITTER_CAPACITY = 1024  # Counters kept per column
+ERROR_Z = 2.0  # Standard errors in the reported distinct-count bounds (about 95%)
+
+
+def _hash_values(values: pd.Series) -> np.ndarray:
+    """64-bit hashes of a column's values (categoricals hash their categories once)"""
+    return pd.util.hash_pandas_object(values, index=False).to_numpy(dtype=np.uint64)
+
+
+class HyperLogLog:
+    """Distinct-count sketch: one register per hash bucket holding the longest leading-zero run"""
+
+    def __init__(self, precision: int = HLL_PRECISION):
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def update(self, values: pd.Series):
+        """Fold a chunk of non-null values into the registers"""
+        if len(values) == 0:
+            return
+        hashes = _hash_values(values)
+        tail_bits = 64 - self.precision
+        buckets = (hashes >> np.uint64(tail_bits)).astype(np.intp)
+        tails = hashes & np.uint64((1 << tail_bits) - 1)
+        # frexp exponent e gives floor(log2(tail)) + 1, so the leading-zero rank is tail_bits + 1 - e
+        _, exponents = np.frexp(tails.astype(np.float64))
+        ranks = (tail_bits + 1 - exponents).astype(np.uint8)
+        np.maximum.at(self.registers, buckets, ranks)
+
+    def merge(self, other: 'HyperLogLog'):
+        """Merge a sketch of a disjoint part of the data (register-wise maximum)"""
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches with different precision")
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    @property
+    def relative_error(self) -> float:
+        """Standard error of the estimate relative to the true distinct count"""
+        return 1.04 / math.sqrt(len(self.registers))
+
+    def estimate(self) -> float:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.ldexp(1.0, -self.registers.astype(np.int64)).sum()
+        zeros = int((self.registers == 0).sum())
+        if raw <= 2.5 * m and zeros:
+            return m * math.log(m / zeros)  # Linear counting is more accurate for small cardinalities
+        return raw
+
+
+class SpaceSaving:
+    """Mergeable Space-Saving summary: at most `capacity` counters, each an upper bound with its error"""
+
+    def __init__(self, capacity: int = HEAVY_HITTER_CAPACITY):
+        self.capacity = capacity
+        self.counts = pd.Series(dtype='int64')
+        self.errors = pd.Series(dtype='int64')
+        self.floor = 0  # Upper bound on the count of any value without a counter
+        self.total = 0
+
+    def update(self, values: pd.Series):
+        """Fold a chunk of non-null values in via its exact counts"""
+        if len(values) == 0:
+            return
+        counts = values.value_counts(sort=False)
+        counts = counts[counts > 0]  # Categoricals list unused categories with zero counts
+        self._combine(counts, pd.Series(0, index=counts.index, dtype='int64'), 0, len(values))
+
+    def merge(self, other: 'SpaceSaving'):
+        """Merge a summary of a disjoint part of the data"""
+        self._combine(other.counts, other.errors, other.floor, other.total)
+
+    def _combine(self, counts: pd.Series, errors: pd.Series, floor: int, total: int):
+        # Values missing from one side may still have occurred there up to that side's floor
+        values = self.counts.index.union(counts.index, sort=False)
+        combined = (self.counts.reindex(values, fill_value=self.floor)
+                    + counts.reindex(values, fill_value=floor)).astype('int64')
+        combined_errors = (self.errors.reindex(values, fill_value=self.floor)
+                           + errors.reindex(values, fill_value=floor)).astype('int64')
+        floor = self.floor + floor
+        if len(combined) > self.capacity:
+            combined = combined.sort_values(ascending=False, kind='stable')
+            floor = max(floor, int(combined.iloc[self.capacity]))
+            combined = combined.iloc[:self.capacity]
+            combined_errors = combined_errors.reindex(combined.index)
+        self.counts, self.errors, self.floor = combined, combined_errors, floor
+        self.total += total
+
+    @property
+    def exact(self) -> bool:
+        """True while every value seen still has its own exact counter"""
+        return self.floor == 0
+
+    @property
+    def max_error(self) -> int:
+        """Largest overcount of any reported frequency (at most total / capacity)"""
+        return int(self.errors.max()) if len(self.errors) else 0
+
+    def top(self, n: int = 5) -> pd.Series:
+        """Most frequent values by estimated count, most frequent first"""
+        return self.counts.sort_values(ascending=False, kind='stable').head(n)
+
+
+class CategoricalSketch:
+    """Bounded-memory stand-in for CategoricalAccumulator: approximate distinct count and top values"""
+
+    def __init__(self, capacity: int = HEAVY_HITTER_CAPACITY, precision: int = HLL_PRECISION):
+        self.count = 0
+        self.distinct = HyperLogLog(precision)
+        self.heavy_hitters = SpaceSaving(capacity)
+
+    def update(self, values: pd.Series):
+        """Fold a chunk of values (nulls are skipped) into both sketches"""
+        values = values.dropna()
+        if len(values) == 0:
+            return
+        self.count += len(values)
+        self.distinct.update(values)
+        self.heavy_hitters.update(values)
+
+    def merge(self, other: 'CategoricalSketch'):
+        self.count += other.count
+        self.distinct.merge(other.distinct)
+        self.heavy_hitters.merge(other.heavy_hitters)
+
+    def unique_count(self) -> int:
+        """Distinct values: exact while every value has a counter, otherwise the HyperLogLog estimate"""
+        if self.heavy_hitters.exact:
+            return len(self.heavy_hitters.counts)
+        return int(round(self.distinct.estimate()))
+
+    def top(self, n: int = 5) -> pd.Series:
+        return self.heavy_hitters.top(n)
+
+    def error_bounds(self, n: int = 5) -> Dict[str, Any]:
+        """Bounds on the distinct count and on each reported top-value count"""
+        top = self.top(n)
+        errors = self.heavy_hitters.errors.reindex(top.index)
+        if self.heavy_hitters.exact:
+            unique = len(self.heavy_hitters.counts)
+            unique_bounds = {"estimate": unique, "low": unique, "high": unique}
+        else:
+            estimate = self.distinct.estimate()
+            margin = ERROR_Z * self.distinct.relative_error * estimate
+            unique_bounds = {"estimate": int(round(estimate)),
+                             "low": max(int(math.floor(estimate - margin)), len(self.heavy_hitters.counts)),
+                             "high": min(int(math.ceil(estimate + margin)), self.count)}
+        return {
+            "exact": self.heavy_hitters.exact,
+            "unique_count": unique_bounds,
+            "unique_count_relative_error": 0.0 if self.heavy_hitters.exact else self.distinct.relative_error,
+            # Space-Saving counts never undercount: the true count lies in [count - error, count]
+            "top_counts": {value: {"estimate": int(count), "low": int(count - errors[value]), "high": int(count)}
+                           for value, count in top.items()},
+            "max_count_error": self.heavy_hitters.max_error
+        }
+
+
+def sketch_column(values: pd.Series, chunk_rows: int, capacity: int = HEAVY_HITTER_CAPACITY,
+                  precision: int = HLL_PRECISION) -> CategoricalSketch:
+    """Sketch an in-memory column chunk by chunk, so no hash table grows past chunk_rows entries"""
+    sketch = CategoricalSketch(capacity, precision)
+    for start in range(0, len(values), chunk_rows):
+        sketch.update(values.iloc[start:start + chunk_rows])
+    return sketch
@@ -0,0 +1,155 @@
+"""
+Statistics Kernel
+Profiles every numeric column of a DataFrame in one pass over 2-D float blocks:
+count, moments, extremes, quartiles and IQR outliers, skipping missing values,
+and caches the results so cleaning and analysis stages share them
+"""
+
+from typing import Dict, Any, List, Callable
+
+import numpy as np
+import pandas as pd
+
+QUANTILES = [0.25, 0.5, 0.75]
+DESCRIBE_KEYS = ['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max']
+BLOCK_COLUMNS = 16  # Columns converted to a float block at a time, bounding the temporary copies
+
+
+def _zero_out_fperr(values: np.ndarray) -> np.ndarray:
+    """Treat tiny moment sums as exact zeros, as pandas does"""
+    return np.where(np.abs(values) < 1e-14, 0.0, values)
+
+
+def _empty_profile(count: int) -> Dict[str, Any]:
+    profile = {key: np.nan for key in DESCRIBE_KEYS}
+    profile.update({'count': float(count), 'skewness': np.nan, 'outliers_count': 0})
+    return profile
+
+
+def _profile_block(block: np.ndarray, count: int) -> List[Dict[str, Any]]:
+    """Statistics for columns of a float block that all hold `count` non-missing values"""
+    if count == 0:
+        return [_empty_profile(0) for _ in range(block.shape[1])]
+
+    # One selection gives the extremes and quartile neighbours; NaNs sort past position count - 1
+    positions = [q * (count - 1) for q in QUANTILES]
+    kth = sorted({0, count - 1} | {int(np.floor(p)) for p in positions} | {int(np.ceil(p)) for p in positions})
+    block = np.partition(block, kth, axis=0)
+    values = block[:count]  # Missing values were pushed below this prefix
+
+    minimum, maximum = values[0], values[count - 1]
+    quartiles = []
+    for position in positions:  # Linear interpolation, matching Series.quantile
+        low, high = int(np.floor(position)), int(np.ceil(position))
+        quartiles.append(values[low] + (values[high] - values[low]) * (position - low))
+    q1, median, q3 = quartiles
+
+    iqr = q3 - q1
+    outliers = ((values < q1 - 1.5 * iqr) | (values > q3 + 1.5 * iqr)).sum(axis=0)
+
+    mean = values.sum(axis=0) / count
+    deviations = values - mean
+    squared = deviations * deviations
+    m2 = squared.sum(axis=0)
+    squared *= deviations
+    m3 = squared.sum(axis=0)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        std = np.sqrt(m2 / (count - 1)) if count > 1 else np.full(len(m2), np.nan)
+        m2, m3 = _zero_out_fperr(m2), _zero_out_fperr(m3)
+        skew = count * (count - 1) ** 0.5 / (count - 2) * (m3 / m2 ** 1.5) if count > 2 else np.full(len(m2), np.nan)
+    if count > 2:
+        skew = np.where(m2 == 0, 0.0, skew)
+
+    return [{
+        'count': float(count),
+        'mean': float(mean[i]),
+        'std': float(std[i]),
+        'min': float(minimum[i]),
+        '25%': float(q1[i]),
+        '50%': float(median[i]),
+        '75%': float(q3[i]),
+        'max': float(maximum[i]),
+        'skewness': float(skew[i]),
+        'outliers_count': int(outliers[i])
+    } for i in range(block.shape[1])]
+
+
+def profile_numeric_columns(df: pd.DataFrame, columns: List[str],
+                            block_columns: int = BLOCK_COLUMNS) -> Dict[str, Dict[str, Any]]:
+    """describe()-style statistics plus skewness and IQR outlier counts for each numeric column"""
+    counts = df[columns].count()
+    # Columns with the same number of values share one selection over their block
+    groups: Dict[int, List[str]] = {}
+    for col in columns:
+        groups.setdefault(int(counts[col]), []).append(col)
+
+    profiles = {}
+    for count, group in groups.items():
+        for start in range(0, len(group), block_columns):
+            block_cols = group[start:start + block_columns]
+            block = df[block_cols].to_numpy(dtype=float, na_value=np.nan)
+            profiles.update(zip(block_cols, _profile_block(block, count)))
+    return {col: profiles[col] for col in columns}
+
+
+def profile_numeric_array(values: np.ndarray, columns: List[str],
+                          block_columns: int = BLOCK_COLUMNS) -> Dict[str, Dict[str, Any]]:
+    """The same profiles for the columns of a 2-D float array (rows x columns, NaN for missing)"""
+    counts = len(values) - np.isnan(values).sum(axis=0)
+    groups: Dict[int, List[int]] = {}
+    for position, count in enumerate(counts):
+        groups.setdefault(int(count), []).append(position)
+
+    profiles = {}
+    for count, positions in groups.items():
+        for start in range(0, len(positions), block_columns):
+            block_positions = positions[start:start + block_columns]
+            profiles.update(zip([columns[i] for i in block_positions],
+                                _profile_block(values[:, block_positions], count)))
+    return {col: profiles[col] for col in columns}
+
+
+def describe_stats(profiles: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
+    """The describe() subset of the profiles, keyed like DataFrame.describe().to_dict()"""
+    return {col: {key: profile[key] for key in DESCRIBE_KEYS} for col, profile in profiles.items()}
+
+
+class ColumnStatsCache:
+    """Column profiles of one frame, reused across stages until its rows change or a column is rewritten.
+
+    Row filters build a new index, so the cache is tied to the identity of the frame's index;
+    steps that rewrite values in place (such as clipping) call invalidate for those columns.
+    """
+
+    def __init__(self):
+        self._index = None
+        self._profiles: Dict[str, Dict[str, Any]] = {}
+
+    def profiles(self, df: pd.DataFrame, columns: List[str],
+                 compute: Callable[[pd.DataFrame, List[str]], Dict[str, Dict[str, Any]]] = None) -> Dict[str, Dict[str, Any]]:
+        """Profiles for the requested columns, computing only the ones not cached for this row set"""
+        if df.index is not self._index:
+            self.clear()
+            self._index = df.index
+        missing = [col for col in columns if col not in self._profiles]
+        if missing:
+            self._profiles.update((compute or profile_numeric_columns)(df, missing))
+        return {col: self._profiles[col] for col in columns}
+
+    def detach(self, df: pd.DataFrame) -> 'ColumnStatsCache':
+        """A separate cache for this frame holding the profiles already computed for it"""
+        cache = ColumnStatsCache()
+        cache._index = df.index
+        if df.index is self._index:
+            cache._profiles = dict(self._profiles)
+        return cache
+
+    def invalidate(self, columns: List[str]):
+        """Forget columns whose values were changed without changing the rows"""
+        for col in columns:
+            self._profiles.pop(col, None)
+
+    def clear(self):
+        self._index = None
+        self._profiles = {}
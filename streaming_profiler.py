@@ -0,0 +1,422 @@
+"""
+Streaming Data Profiler
+Mergeable accumulators that build the data analysis from bounded chunks,
+so peak memory depends on the chunk size instead of the file size
+"""
+
+from typing import Dict, Any, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from sketches import CategoricalSketch
+
+
+def _smallest_key_positions(keys: np.ndarray, size: int) -> np.ndarray:
+    """Positions of the `size` smallest random keys (bottom-k sampling)"""
+    if len(keys) <= size:
+        return np.arange(len(keys))
+    return np.argpartition(keys, size)[:size]
+
+
+class ReservoirSample:
+    """Uniform bounded sample of numeric values that can be merged with other samples"""
+
+    def __init__(self, size: int = 10000, seed: Optional[int] = None):
+        self.size = size
+        self.values = np.empty(0, dtype=float)
+        self.keys = np.empty(0, dtype=float)
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, values: np.ndarray):
+        """Offer a chunk of values to the sample"""
+        self._absorb(np.asarray(values, dtype=float), self._rng.random(len(values)))
+
+    def merge(self, other: 'ReservoirSample'):
+        """Merge another sample drawn from a disjoint part of the data"""
+        self._absorb(other.values, other.keys)
+
+    def _absorb(self, values: np.ndarray, keys: np.ndarray):
+        values = np.concatenate([self.values, values])
+        keys = np.concatenate([self.keys, keys])
+        keep = _smallest_key_positions(keys, self.size)
+        self.values = values[keep]
+        self.keys = keys[keep]
+
+
+class RowReservoir:
+    """Uniform bounded sample of whole rows, used to render charts in streaming mode"""
+
+    def __init__(self, size: int = 50000, seed: Optional[int] = None):
+        self.size = size
+        self.rows: Optional[pd.DataFrame] = None
+        self.keys = np.empty(0, dtype=float)
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, chunk: pd.DataFrame):
+        """Offer a chunk of rows to the sample"""
+        self._absorb(chunk, self._rng.random(len(chunk)))
+
+    def merge(self, other: 'RowReservoir'):
+        """Merge another row sample drawn from a disjoint part of the data"""
+        if other.rows is not None:
+            self._absorb(other.rows, other.keys)
+
+    def _absorb(self, rows: pd.DataFrame, keys: np.ndarray):
+        if self.rows is not None:
+            rows = pd.concat([self.rows, rows])
+            keys = np.concatenate([self.keys, keys])
+        keep = np.sort(_smallest_key_positions(keys, self.size))
+        self.rows = rows.iloc[keep]
+        self.keys = keys[keep]
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return the sampled rows as a DataFrame with a fresh index"""
+        if self.rows is None:
+            return pd.DataFrame()
+        return self.rows.reset_index(drop=True)
+
+
+class RowHashSet:
+    """64-bit hashes of every distinct row seen, for dropping duplicates across chunks (8 bytes per row).
+
+    Kept as sorted runs whose sizes at least halve down the list, like a binary counter: a new
+    chunk's hashes become a run, and runs of similar size are merged, so a lookup searches a
+    logarithmic number of runs and each hash is re-merged a logarithmic number of times.
+    """
+
+    def __init__(self):
+        self.runs: List[np.ndarray] = []
+
+    def __len__(self) -> int:
+        return sum(len(run) for run in self.runs)
+
+    def add_new(self, chunk: pd.DataFrame) -> np.ndarray:
+        """Mask of the chunk's rows not seen before (the first of equal rows counts as new); records them"""
+        hashes = pd.util.hash_pandas_object(chunk, index=False).to_numpy(dtype=np.uint64)
+        unique, first = np.unique(hashes, return_index=True)
+        fresh = np.ones(len(unique), dtype=bool)
+        for run in self.runs:
+            positions = np.minimum(np.searchsorted(run, unique), len(run) - 1)
+            fresh &= run[positions] != unique
+        mask = np.zeros(len(hashes), dtype=bool)
+        mask[first[fresh]] = True
+        self._add_run(unique[fresh])
+        return mask
+
+    def _add_run(self, hashes: np.ndarray):
+        if len(hashes) == 0:
+            return
+        self.runs.append(hashes)
+        while len(self.runs) > 1 and len(self.runs[-1]) >= len(self.runs[-2]):
+            newest = self.runs.pop()
+            # Timsort merges the two sorted runs in linear time
+            self.runs[-1] = np.sort(np.concatenate([self.runs[-1], newest]), kind='stable')
+
+
+class NumericAccumulator:
+    """Running count, central moments, extremes and quantile sample for one numeric column"""
+
+    def __init__(self, sample_size: int = 10000, seed: Optional[int] = None):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.m3 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        self.sample = ReservoirSample(sample_size, seed)
+
+    def update(self, values: np.ndarray):
+        """Fold a chunk of values (NaNs are skipped) into the running statistics"""
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+        mean = values.mean()
+        deviations = values - mean
+        self._merge_moments(len(values), mean, (deviations ** 2).sum(), (deviations ** 3).sum(),
+                            values.min(), values.max())
+        self.sample.update(values)
+
+    def merge(self, other: 'NumericAccumulator'):
+        """Merge statistics computed over a disjoint part of the data"""
+        if other.count == 0:
+            return
+        self._merge_moments(other.count, other.mean, other.m2, other.m3, other.min, other.max)
+        self.sample.merge(other.sample)
+
+    def _merge_moments(self, n_b: int, mean_b: float, m2_b: float, m3_b: float, min_b: float, max_b: float):
+        """Pairwise moment combination (Chan et al. / Pebay)"""
+        n_a = self.count
+        n = n_a + n_b
+        delta = mean_b - self.mean
+        self.m3 = (self.m3 + m3_b
+                   + delta ** 3 * n_a * n_b * (n_a - n_b) / n ** 2
+                   + 3 * delta * (n_a * m2_b - n_b * self.m2) / n)
+        self.m2 = self.m2 + m2_b + delta ** 2 * n_a * n_b / n
+        self.mean = self.mean + delta * n_b / n
+        self.count = n
+        self.min = min(self.min, min_b)
+        self.max = max(self.max, max_b)
+
+    @property
+    def is_exact_sample(self) -> bool:
+        """True while every value seen is still held in the quantile sample"""
+        return self.count <= self.sample.size
+
+    def std(self) -> float:
+        """Sample standard deviation (ddof=1, like pandas)"""
+        if self.count < 2:
+            return np.nan
+        return float(np.sqrt(max(self.m2, 0.0) / (self.count - 1)))
+
+    def skew(self) -> float:
+        """Adjusted Fisher-Pearson skewness, matching pandas Series.skew"""
+        n = self.count
+        if n < 3:
+            return np.nan
+        if self.m2 <= 1e-14 * max(1.0, self.mean ** 2) * n:
+            return 0.0
+        return float(n * (n - 1) ** 0.5 / (n - 2) * (self.m3 / self.m2 ** 1.5))
+
+    def quantiles(self, qs: List[float]) -> List[float]:
+        """Quantiles from the sample (exact while the whole column fits in it)"""
+        if len(self.sample.values) == 0:
+            return [np.nan] * len(qs)
+        return [float(v) for v in np.quantile(self.sample.values, qs)]
+
+    def outlier_count(self) -> int:
+        """IQR outlier count, estimated from the sample once the column outgrows it"""
+        values = self.sample.values
+        if len(values) == 0:
+            return 0
+        q1, q3 = np.quantile(values, [0.25, 0.75])
+        iqr = q3 - q1
+        outside = ((values < q1 - 1.5 * iqr) | (values > q3 + 1.5 * iqr)).sum()
+        if self.is_exact_sample:
+            return int(outside)
+        return int(round(outside / len(values) * self.count))
+
+
+class CategoricalAccumulator:
+    """Bounded frequency table for one text column"""
+
+    def __init__(self, max_tracked: int = 50000):
+        self.max_tracked = max_tracked
+        self.count = 0
+        self.counts = pd.Series(dtype='int64')
+        self.saturated = False
+
+    def update(self, values: pd.Series):
+        """Fold a chunk of values (nulls are skipped) into the frequency table"""
+        values = values.dropna()
+        if len(values) == 0:
+            return
+        self.count += len(values)
+        self._add_counts(values.value_counts())
+
+    def merge(self, other: 'CategoricalAccumulator'):
+        """Merge a frequency table built over a disjoint part of the data"""
+        self.count += other.count
+        self.saturated = self.saturated or other.saturated
+        self._add_counts(other.counts)
+
+    def _add_counts(self, counts: pd.Series):
+        self.counts = self.counts.add(counts, fill_value=0).astype('int64')
+        if len(self.counts) > self.max_tracked:
+            # Keep the heaviest values only; the long tail is forgotten
+            self.counts = self.counts.nlargest(self.max_tracked)
+            self.saturated = True
+
+    def unique_count(self) -> int:
+        """Distinct values seen (a lower bound once the table is saturated)"""
+        return len(self.counts)
+
+    def top(self, n: int = 5) -> pd.Series:
+        """Most frequent values, most frequent first"""
+        return self.counts.sort_values(ascending=False, kind='stable').head(n)
+
+
+class CorrelationAccumulator:
+    """Pairwise-complete co-moment sums for Pearson correlations between numeric columns"""
+
+    def __init__(self, columns: List[str]):
+        self.columns = list(columns)
+        k = len(self.columns)
+        self.shift: Optional[np.ndarray] = None
+        self.n = np.zeros((k, k))
+        self.sum_x = np.zeros((k, k))
+        self.sum_xx = np.zeros((k, k))
+        self.sum_xy = np.zeros((k, k))
+
+    def update(self, block: np.ndarray):
+        """Fold a 2-D block (rows x columns, NaN for missing) into the co-moment sums"""
+        block = np.asarray(block, dtype=float)
+        if block.size == 0:
+            return
+        if self.shift is None:
+            # Shift by the first chunk's means to keep the raw sums well conditioned
+            with np.errstate(invalid='ignore'):
+                means = np.nanmean(block, axis=0) if len(block) else np.zeros(block.shape[1])
+            self.shift = np.nan_to_num(means)
+        mask = ~np.isnan(block)
+        centered = np.where(mask, block - self.shift, 0.0)
+        present = mask.astype(float)
+        self.n += present.T @ present
+        self.sum_x += centered.T @ present
+        self.sum_xx += (centered ** 2).T @ present
+        self.sum_xy += centered.T @ centered
+
+    def merge(self, other: 'CorrelationAccumulator'):
+        """Merge co-moment sums built over a disjoint part of the data"""
+        if other.shift is None:
+            return
+        if self.shift is None:
+            self.shift = other.shift.copy()
+        # Re-base the other sums onto this accumulator's shift before adding
+        d = (other.shift - self.shift)[:, None]
+        n = other.n
+        sum_x = other.sum_x + n * d
+        sum_xx = other.sum_xx + 2 * d * other.sum_x + n * d ** 2
+        sum_xy = other.sum_xy + d * other.sum_x.T + d.T * other.sum_x + n * d * d.T
+        self.n += n
+        self.sum_x += sum_x
+        self.sum_xx += sum_xx
+        self.sum_xy += sum_xy
+
+    def matrix(self) -> np.ndarray:
+        """Pearson correlation matrix, NaN where fewer than two paired values exist"""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            n = np.where(self.n > 1, self.n, np.nan)
+            cov = self.sum_xy - self.sum_x * self.sum_x.T / n
+            var_x = self.sum_xx - self.sum_x ** 2 / n
+            var_y = var_x.T
+            corr = cov / np.sqrt(var_x * var_y)
+        corr = np.clip(corr, -1.0, 1.0)
+        np.fill_diagonal(corr, np.where(np.diag(self.n) > 1, 1.0, np.nan))
+        return corr
+
+
+class StreamingProfile:
+    """Single-pass profile of a table, built chunk by chunk with mergeable accumulators"""
+
+    def __init__(self, sample_size: int = 10000, row_sample_size: int = 50000,
+                 max_tracked_categories: int = 50000, seed: Optional[int] = None, categorical_sketch: bool = False):
+        self.sample_size = sample_size
+        self.max_tracked_categories = max_tracked_categories
+        self.categorical_sketch = categorical_sketch
+        self.seed = seed
+        self.columns: List[str] = []
+        self.dtypes: Dict[str, str] = {}
+        self.numeric_columns: List[str] = []
+        self.categorical_columns: List[str] = []
+        self.datetime_columns: List[str] = []
+        self.rows = 0
+        self.complete_rows = 0
+        self.null_counts: Dict[str, int] = {}
+        self.numeric: Dict[str, NumericAccumulator] = {}
+        self.categorical: Dict[str, Union[CategoricalAccumulator, CategoricalSketch]] = {}
+        self.correlation: Optional[CorrelationAccumulator] = None
+        self.head_rows: List[Dict[str, Any]] = []
+        self.row_sample = RowReservoir(row_sample_size, seed)
+
+    def _categorical_accumulator(self) -> Union[CategoricalAccumulator, CategoricalSketch]:
+        """Exact bounded frequency table, or a distinct-count / heavy-hitter sketch in sketch mode"""
+        if self.categorical_sketch:
+            return CategoricalSketch()
+        return CategoricalAccumulator(self.max_tracked_categories)
+
+    def _register_columns(self, chunk: pd.DataFrame):
+        self.columns = chunk.columns.tolist()
+        self.dtypes = chunk.dtypes.astype(str).to_dict()
+        self.numeric_columns = chunk.select_dtypes(include=[np.number]).columns.tolist()
+        self.categorical_columns = chunk.select_dtypes(include=['object', 'string']).columns.tolist()
+        self.datetime_columns = chunk.select_dtypes(include=['datetime']).columns.tolist()
+        self.null_counts = {col: 0 for col in self.columns}
+        self.numeric = {col: NumericAccumulator(self.sample_size, self.seed) for col in self.numeric_columns}
+        self.categorical = {col: self._categorical_accumulator() for col in self.categorical_columns}
+        if len(self.numeric_columns) >= 2:
+            self.correlation = CorrelationAccumulator(self.numeric_columns)
+
+    def update(self, chunk: pd.DataFrame):
+        """Fold one cleaned chunk into every accumulator"""
+        if not self.columns:
+            self._register_columns(chunk)
+        chunk = chunk[self.columns]
+        if chunk.empty:
+            return
+
+        nulls = chunk.isnull()
+        for col, count in nulls.sum().items():
+            self.null_counts[col] += int(count)
+        self.complete_rows += int((~nulls.any(axis=1)).sum())
+        self.rows += len(chunk)
+
+        for col, acc in self.numeric.items():
+            acc.update(chunk[col].to_numpy(dtype=float, na_value=np.nan))
+        for col, acc in self.categorical.items():
+            acc.update(chunk[col])
+        if self.correlation is not None:
+            self.correlation.update(chunk[self.numeric_columns].to_numpy(dtype=float, na_value=np.nan))
+
+        if len(self.head_rows) < 3:
+            self.head_rows.extend(chunk.head(3 - len(self.head_rows)).to_dict('records'))
+        self.row_sample.update(chunk)
+
+    def merge(self, other: 'StreamingProfile'):
+        """Merge a profile built over a disjoint set of rows with the same columns"""
+        if not other.columns:
+            return
+        if not self.columns:
+            self.columns = list(other.columns)
+            self.dtypes = dict(other.dtypes)
+            self.numeric_columns = list(other.numeric_columns)
+            self.categorical_columns = list(other.categorical_columns)
+            self.datetime_columns = list(other.datetime_columns)
+            self.null_counts = {col: 0 for col in self.columns}
+            self.numeric = {col: NumericAccumulator(self.sample_size, self.seed) for col in self.numeric_columns}
+            self.categorical = {col: self._categorical_accumulator() for col in self.categorical_columns}
+            if len(self.numeric_columns) >= 2:
+                self.correlation = CorrelationAccumulator(self.numeric_columns)
+        if other.columns != self.columns:
+            raise ValueError("Cannot merge profiles with different columns")
+
+        self.rows += other.rows
+        self.complete_rows += other.complete_rows
+        for col, count in other.null_counts.items():
+            self.null_counts[col] += count
+        for col, acc in other.numeric.items():
+            self.numeric[col].merge(acc)
+        for col, acc in other.categorical.items():
+            self.categorical[col].merge(acc)
+        if self.correlation is not None and other.correlation is not None:
+            self.correlation.merge(other.correlation)
+        if len(self.head_rows) < 3:
+            self.head_rows.extend(other.head_rows[:3 - len(self.head_rows)])
+        self.row_sample.merge(other.row_sample)
+
+    def non_empty_columns(self) -> List[str]:
+        """Columns that hold at least one value (all-null columns are dropped, as in batch cleaning)"""
+        return [col for col in self.columns if self.null_counts.get(col, 0) < self.rows]
+
+    def numeric_summary(self, col: str) -> Dict[str, Any]:
+        """describe()-style statistics for one numeric column"""
+        acc = self.numeric[col]
+        q1, median, q3 = acc.quantiles([0.25, 0.5, 0.75])
+        return {
+            'count': float(acc.count),
+            'mean': acc.mean if acc.count else np.nan,
+            'std': acc.std(),
+            'min': acc.min if acc.count else np.nan,
+            '25%': q1,
+            '50%': median,
+            '75%': q3,
+            'max': acc.max if acc.count else np.nan,
+        }
+
+    def correlation_frame(self) -> Optional[pd.DataFrame]:
+        """Correlation matrix as a labelled DataFrame (None with fewer than two numeric columns)"""
+        if self.correlation is None:
+            return None
+        cols = self.correlation.columns
+        return pd.DataFrame(self.correlation.matrix(), index=cols, columns=cols)
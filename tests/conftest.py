@@ -0,0 +1,13 @@
+"""
+Test Configuration
+Puts the repository on the import path and gives the caches a private
+directory and the generator a placeholder API key before any module reads them
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ['INSIGHTDECK_CACHE_DIR'] = tempfile.mkdtemp(prefix='insightdeck-tests-')
+os.environ.setdefault('OPENAI_API_KEY', 'test-key-not-used')
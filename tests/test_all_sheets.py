@@ -0,0 +1,60 @@
+"""
+All-Sheets Tests
+Worker processes analyze each sheet with the options and caches of the
+generator that started them
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from advanced_ppt_generator import CSVPPTGenerator
+from disk_cache import FrameCache
+
+
+@pytest.fixture
+def workbook_path(tmp_path) -> str:
+    rng = np.random.default_rng(0)
+    path = tmp_path / 'regions.xlsx'
+    with pd.ExcelWriter(path) as writer:
+        for sheet in ['North', 'South']:
+            pd.DataFrame({
+                'store': rng.choice(['a', 'b', 'c', 'd'], 60),
+                'revenue': rng.normal(1000, 100, 60).round(2),
+                'visits': rng.integers(10, 100, 60)
+            }).to_excel(writer, sheet_name=sheet, index=False)
+    return str(path)
+
+
+def _cached_frames(cache: FrameCache):
+    return [name for name in os.listdir(cache.cache_dir) if name.endswith(cache.suffix)]
+
+
+def test_workers_use_the_parent_settings(workbook_path, tmp_path):
+    generator = CSVPPTGenerator()
+    generator.categorical_sketch = True
+    generator.frame_cache = FrameCache(cache_dir=str(tmp_path / 'cache'))
+    if not generator.frame_cache.enabled:
+        pytest.skip("the frame cache needs pyarrow")
+
+    results = generator.analyze_all_sheets(workbook_path, max_workers=2)
+
+    assert list(results) == ['North', 'South']
+    for analysis, _ in results.values():
+        assert 'error_bounds' in analysis['categorical_insights']['store']  # Sketched, not counted exactly
+    assert len(_cached_frames(generator.frame_cache)) == 2  # Written to the parent's cache directory
+
+
+def test_workers_leave_a_disabled_cache_alone(workbook_path, tmp_path):
+    generator = CSVPPTGenerator()
+    generator.frame_cache = FrameCache(cache_dir=str(tmp_path / 'cache'))
+    generator.frame_cache.enabled = False
+
+    results = generator.analyze_all_sheets(workbook_path, max_workers=2)
+
+    assert len(results) == 2
+    for analysis, _ in results.values():
+        assert 'error_bounds' not in analysis['categorical_insights']['store']
+    assert _cached_frames(generator.frame_cache) == []
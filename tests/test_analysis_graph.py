@@ -0,0 +1,67 @@
+"""
+Analysis Graph Tests
+The lazily built analysis reads like the eagerly built one, with the
+correlations still usable as a nested {column: {column: r}} dict
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from advanced_ppt_generator import CSVPPTGenerator
+from disk_cache import AnalysisStore
+
+
+@pytest.fixture
+def csv_path(tmp_path) -> str:
+    rng = np.random.default_rng(0)
+    price = rng.uniform(40, 60, 300).round(2)  # Bounded, so full-mode capping leaves the rows as streamed
+    pd.DataFrame({
+        'price': price,
+        'units': (200 - 2 * price + rng.uniform(-5, 5, 300)).round(),
+        'discount': rng.uniform(0, 0.3, 300).round(3),
+        'region': rng.choice(['north', 'south', 'east'], 300)
+    }).to_csv(tmp_path / 'orders.csv', index=False)
+    return str(tmp_path / 'orders.csv')
+
+
+def _as_frame(correlations) -> pd.DataFrame:
+    """Correlations read only through the dict interface"""
+    return pd.DataFrame({col: dict(correlations[col]) for col in correlations})
+
+
+def test_lazy_and_eager_correlations_compare_equal_as_dicts(csv_path):
+    lazy = CSVPPTGenerator().load_and_analyze_data(csv_path, analysis_mode='full')
+    eager = CSVPPTGenerator().load_and_analyze_data(csv_path, analysis_mode='stream')
+
+    assert list(lazy['correlations']) == list(eager['correlations']) == ['price', 'units', 'discount']
+    assert isinstance(lazy['correlations']['price'], dict)
+    pd.testing.assert_frame_equal(_as_frame(lazy['correlations']), _as_frame(eager['correlations']), atol=1e-12)
+    expected = pd.read_csv(csv_path)[['price', 'units', 'discount']].corr()
+    pd.testing.assert_frame_equal(_as_frame(lazy['correlations']), expected, atol=1e-12)
+    assert lazy['strong_correlations'] == eager['strong_correlations']
+    assert lazy['strong_correlation_count'] == eager['strong_correlation_count'] == 1
+
+
+def test_table_without_correlations_has_an_empty_mapping():
+    df = pd.DataFrame({'amount': np.arange(10.0), 'label': list('abcdefghij')})
+    analysis = CSVPPTGenerator()._perform_data_analysis(df, 'single.csv', {}, evaluate_summary=False)
+
+    assert analysis['correlations'] == {}
+    assert not analysis['correlations']
+    assert analysis['correlations'].get('amount', {}) == {}
+    assert analysis['strong_correlations'] == []
+    assert analysis['strong_correlation_count'] == 0
+
+
+def test_stored_correlations_read_back_through_the_dict_interface(csv_path, tmp_path):
+    analysis = CSVPPTGenerator().load_and_analyze_data(csv_path, analysis_mode='full')
+    store = AnalysisStore(cache_dir=str(tmp_path / 'cache'))
+    if not store.enabled:
+        pytest.skip("the analysis store needs pyarrow")
+
+    assert store.put('orders', analysis)
+    restored = store.get('orders')
+
+    assert restored['correlations'] == analysis['correlations'].to_dict()
+    assert restored['strong_correlations'] == analysis['strong_correlations']
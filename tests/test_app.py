@@ -0,0 +1,55 @@
+"""
+Dashboard Tests
+File info for CSV uploads reports the cleaned data the deck is built from,
+and falls back to the raw file when cleaning rejects it
+"""
+
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import app as dashboard
+from advanced_ppt_generator import CSVPPTGenerator
+
+
+@pytest.fixture
+def messy_csv(tmp_path) -> str:
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        'order_id': np.arange(40),
+        'region': rng.choice(['north', 'south'], 40),
+        'amount': rng.normal(100, 10, 40).round(2),
+        'empty': [None] * 40
+    })
+    df = pd.concat([df, df.head(5)])  # Duplicate rows are removed by cleaning
+    path = tmp_path / 'orders.csv'
+    df.to_csv(path, index=False)
+    return str(path)
+
+
+def test_csv_info_reports_cleaned_counts(messy_csv):
+    info = dashboard.get_file_info(messy_csv)
+    cleaned = CSVPPTGenerator().load_cleaned_frame(messy_csv)
+    assert info['cleaned'] is True
+    assert (info['rows'], info['columns']) == cleaned.shape
+    assert info['column_names'] == cleaned.columns.tolist()
+    assert info['rows'] < len(pd.read_csv(messy_csv))
+
+
+def test_csv_info_falls_back_to_raw_file(tmp_path):
+    path = tmp_path / 'tiny.csv'
+    path.write_text("a,b\n1,2\n3,4\n")  # Below the cleaning minimum of 5 rows
+    info = dashboard.get_file_info(str(path))
+    assert info == {'type': 'csv', 'rows': 2, 'columns': 2, 'column_names': ['a', 'b'], 'cleaned': False}
+
+
+def test_upload_page_labels_cleaned_counts(messy_csv, tmp_path, monkeypatch):
+    monkeypatch.setattr(dashboard, 'UPLOAD_FOLDER', str(tmp_path / 'uploads'))
+    (tmp_path / 'uploads').mkdir()
+    with open(messy_csv, 'rb') as f:
+        data = {'file': (io.BytesIO(f.read()), 'orders.csv')}
+    response = dashboard.app.test_client().post('/upload', data=data, content_type='multipart/form-data')
+    assert response.status_code == 200
+    assert b'Rows (after cleaning)' in response.data
@@ -0,0 +1,54 @@
+"""
+Cleaning Tests
+Row rules drop rows in one pass and extreme values are capped on the rows
+that remain, with both recorded in the cleaning report
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from advanced_ppt_generator import CSVPPTGenerator
+
+# Writing through a view of the unfiltered rows would leave the caller's frame or the result half-updated
+pytestmark = pytest.mark.filterwarnings('error::pandas.errors.SettingWithCopyWarning')
+
+
+@pytest.fixture
+def frame() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        'code': [f"item{i}" for i in range(40)],
+        'amount': rng.normal(100, 5, 40).round(2),
+        'ratio': rng.uniform(0, 1, 40),
+        'flat': np.full(40, 7.0)
+    })
+    df.loc[3, 'code'] = '0123456789abcdef0123456789abcdef'  # Hash-like placeholder ID
+    df.loc[8, 'ratio'] = np.inf
+    df.loc[20, 'amount'] = 10_000.0
+    return df
+
+
+def test_extreme_values_are_capped_on_the_filtered_rows(frame):
+    generator = CSVPPTGenerator()
+    kept = frame.drop(index=[3, 8])['amount']
+    upper = kept.mean() + 3 * kept.std()
+
+    cleaned = generator._clean_data_for_perfect_ppt(frame)
+
+    assert len(cleaned) == 38
+    assert cleaned.loc[20, 'amount'] == pytest.approx(upper)
+    pd.testing.assert_series_equal(cleaned['amount'].drop(index=20), kept.drop(index=20))
+    pd.testing.assert_series_equal(cleaned['flat'], frame['flat'].drop(index=[3, 8]))
+    assert generator.cleaning_report == {
+        'rows_before': 40,
+        'rows_dropped': 2,
+        'rows_dropped_by_rule': {'hash_like_ids': 1, 'infinite_values': 1, 'future_dates': 0},
+        'capped_values': {'amount': 1}
+    }
+
+
+def test_capping_leaves_the_input_frame_untouched(frame):
+    original = frame.copy()
+    CSVPPTGenerator()._clean_data_for_perfect_ppt(frame)
+    pd.testing.assert_frame_equal(frame, original)
@@ -0,0 +1,51 @@
+"""
+Column Analysis Tests
+Worker-pool profiles must equal the in-process ones, including for categorical
+columns, whose Arrow dictionary encoding is read back from shared memory
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from column_analysis import ColumnWorkerPool, summarize_text_column
+from stats_kernel import profile_numeric_array
+
+pytest.importorskip('pyarrow')
+
+
+@pytest.fixture(scope='module')
+def frame() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    rows = 2000
+    data = {f"metric_{i}": rng.lognormal(0, 1, rows) for i in range(8)}
+    data['metric_0'][::7] = np.nan
+    data['region'] = pd.Categorical(rng.choice(['north', 'south', 'east', 'west'], rows))
+    data['segment'] = pd.Categorical(rng.choice(['a', 'b', 'c'], rows), categories=['a', 'b', 'c', 'unused'])
+    data['product'] = pd.array(rng.choice([f"product {i}" for i in range(50)], rows), dtype='string')
+    data['notes'] = rng.choice(['x', 'y', None], rows)
+    return pd.DataFrame(data)
+
+
+def test_numeric_profiles_match_in_process(frame):
+    columns = [col for col in frame.columns if col.startswith('metric_')]
+    expected = profile_numeric_array(frame[columns].to_numpy(dtype=float), columns)
+    with ColumnWorkerPool(2) as pool:
+        profiles = pool.profile_numeric(frame, columns)
+    assert list(profiles) == columns
+    for col in columns:
+        assert profiles[col].keys() == expected[col].keys()
+        for key, value in expected[col].items():
+            assert profiles[col][key] == pytest.approx(value, nan_ok=True), (col, key)
+
+
+def test_text_summaries_match_in_process(frame):
+    columns = ['region', 'segment', 'product', 'notes']
+    with ColumnWorkerPool(2) as pool:
+        summaries = pool.summarize_text(frame, columns)
+    assert list(summaries) == columns
+    for col in columns:
+        expected = summarize_text_column(frame[col])
+        assert summaries[col].count == expected.count
+        assert summaries[col].unique_count() == expected.unique_count()
+        assert summaries[col].top().to_dict() == expected.top().to_dict()
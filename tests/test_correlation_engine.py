@@ -0,0 +1,55 @@
+"""
+Correlation Engine Tests
+Block correlations match DataFrame.corr, and every strong pair is kept and
+counted; only the data summary shortens the list
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from advanced_ppt_generator import CSVPPTGenerator
+from correlation_engine import correlation_matrix
+
+
+@pytest.fixture
+def frame() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    latent = rng.normal(size=300)
+    columns = {f"linked{i}": latent + rng.normal(scale=0.2, size=300) for i in range(12)}  # 66 strong pairs
+    columns.update({f"noise{i}": rng.normal(size=300) for i in range(8)})
+    df = pd.DataFrame(columns)
+    df.iloc[::7, 3] = np.nan
+    return df
+
+
+def test_block_correlations_match_pandas(frame):
+    matrix = correlation_matrix(frame, frame.columns.tolist(), block_columns=6)
+    np.testing.assert_allclose(matrix.values, frame.corr().to_numpy(), atol=1e-12)
+
+
+def test_every_strong_pair_is_kept(frame):
+    matrix = correlation_matrix(frame, frame.columns.tolist())
+    corr = frame.corr()
+    expected = {(a, b) for i, a in enumerate(corr.columns) for b in corr.columns[i + 1:] if abs(corr.loc[a, b]) > 0.7}
+
+    pairs = matrix.strong_pairs()
+
+    assert len(expected) > 50
+    assert {(pair['var1'], pair['var2']) for pair in pairs} == expected
+    assert matrix.strong_pair_count() == len(pairs)
+    strengths = [abs(pair['correlation']) for pair in pairs]
+    assert strengths == sorted(strengths, reverse=True)
+    assert matrix.strong_pairs(top_k=5) == pairs[:5]
+
+
+def test_summary_lists_the_strongest_pairs_of_all(frame):
+    generator = CSVPPTGenerator()
+    analysis = generator._perform_data_analysis(frame, 'wide.csv', {}, evaluate_summary=False)
+    summary = generator._build_comprehensive_data_summary(analysis)
+
+    pairs = analysis['strong_correlations']
+    assert len(pairs) == analysis['strong_correlation_count'] > generator.SUMMARY_CORRELATIONS
+    assert f"strongest {generator.SUMMARY_CORRELATIONS} of {len(pairs)}" in summary
+    assert all(f"{pair['var1']} ↔ {pair['var2']}" in summary for pair in pairs[:generator.SUMMARY_CORRELATIONS])
+    assert f"{pairs[-1]['var1']} ↔ {pairs[-1]['var2']}" not in summary
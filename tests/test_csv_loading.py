@@ -0,0 +1,55 @@
+"""
+CSV Loading Tests
+A byte the sampled windows did not see, invalid in the detected encoding,
+makes both reader engines re-read the file as latin1
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from advanced_ppt_generator import CSVPPTGenerator
+from csv_detection import SAMPLE_BYTES, detect_csv_format
+
+
+@pytest.fixture
+def late_latin1_csv(tmp_path) -> str:
+    rng = np.random.default_rng(0)
+    n = 30_000
+    path = tmp_path / 'cities.csv'
+    pd.DataFrame({
+        'city': rng.choice(['Paris', 'Lyon', 'Nice'], n),
+        'sales': rng.normal(100, 5, n).round(2),
+        'qty': rng.integers(0, 9, n)
+    }).to_csv(path, index=False)
+    raw = bytearray(path.read_bytes())
+    # Between the head and middle windows the detector samples
+    position = raw.index(b'Lyon', SAMPLE_BYTES + 1024)
+    assert position < len(raw) // 2 - 1024
+    raw[position + 1:position + 2] = b'\xe9'  # 'Léon' in latin1, invalid UTF-8
+    path.write_bytes(bytes(raw))
+    return str(path)
+
+
+@pytest.mark.parametrize('engine', ['pandas', 'pyarrow'])
+def test_late_invalid_byte_falls_back_to_latin1(late_latin1_csv, engine, capsys):
+    if engine == 'pyarrow':
+        pytest.importorskip('pyarrow')
+    assert detect_csv_format(late_latin1_csv)['encoding'] == 'utf-8'
+    generator = CSVPPTGenerator()
+    generator.frame_cache.enabled = False
+
+    df = generator.load_cleaned_frame(late_latin1_csv, engine)
+
+    assert 're-reading with latin1' in capsys.readouterr().out
+    assert (df['city'] == 'Léon').sum() == 1
+    assert df['city'].nunique() == 4
+    assert pd.api.types.is_float_dtype(df['sales']) and pd.api.types.is_integer_dtype(df['qty'])
+
+
+def test_engines_agree_after_the_fallback(late_latin1_csv):
+    pytest.importorskip('pyarrow')
+    generator = CSVPPTGenerator()
+    generator.frame_cache.enabled = False
+    frames = [generator.load_cleaned_frame(late_latin1_csv, engine) for engine in ['pandas', 'pyarrow']]
+    pd.testing.assert_frame_equal(frames[0], frames[1], check_dtype=False, check_categorical=False)
@@ -0,0 +1,161 @@
+"""
+Disk Cache Tests
+Cached frames come back writable and the least recently used entries go
+first; stored analysis state and analyses read back as they were saved, and
+incremental runs fold appended rows into the saved state
+"""
+
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from advanced_ppt_generator import CSVPPTGenerator
+from analysis_graph import LazyAnalysis, PartialAnalysis
+from disk_cache import AnalysisStore, FrameCache, ProfileStore
+
+pytest.importorskip('pyarrow')
+
+
+@pytest.fixture
+def frame() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        'amount': rng.normal(100, 10, 1000),
+        'units': rng.integers(0, 50, 1000),
+        'region': pd.Categorical(rng.choice(['north', 'south'], 1000)),
+        'note': rng.choice(['ok', None], 1000)
+    }, index=pd.RangeIndex(10, 1010))
+
+
+def test_cached_frame_round_trips_and_is_writable(frame, tmp_path):
+    cache = FrameCache(cache_dir=str(tmp_path))
+    assert cache.put('orders', frame)
+
+    cached = cache.get('orders')
+
+    pd.testing.assert_frame_equal(cached, frame)
+    cached.loc[10, 'amount'] = -1.0
+    cached['units'] += 1
+    cached['amount'].to_numpy()[1] = -2.0
+    assert cached.loc[11, 'amount'] == -2.0
+    pd.testing.assert_frame_equal(cache.get('orders'), frame)  # The entry on disk is unchanged
+
+
+def test_frame_cache_evicts_the_least_recently_used(frame, tmp_path):
+    cache = FrameCache(cache_dir=str(tmp_path))
+    cache.put('first', frame)
+    cache.put('second', frame)
+    now = time.time()
+    os.utime(cache.path_for('first'), (now - 30, now - 30))
+    os.utime(cache.path_for('second'), (now - 20, now - 20))
+    cache.max_bytes = int(os.path.getsize(cache.path_for('first')) * 2.5)
+
+    assert cache.get('first') is not None  # A hit makes it the most recently used
+    cache.put('third', frame)
+
+    assert cache.lookup('second') is None
+    assert cache.lookup('first') is not None and cache.lookup('third') is not None
+
+
+def _same_state(a, b, path='state'):
+    """Deep equality of analysis state, field by field"""
+    a = a.item() if isinstance(a, np.generic) else a
+    b = b.item() if isinstance(b, np.generic) else b
+    assert type(a) is type(b), path
+    if isinstance(a, np.random.Generator):
+        assert a.bit_generator.state == b.bit_generator.state, path
+    elif isinstance(a, pd.DataFrame):
+        pd.testing.assert_frame_equal(a, b)
+    elif isinstance(a, pd.Series):
+        pd.testing.assert_series_equal(a, b)
+    elif isinstance(a, np.ndarray):
+        assert a.dtype == b.dtype and np.array_equal(a, b, equal_nan=a.dtype.kind == 'f'), path
+    elif isinstance(a, dict):
+        assert list(a) == list(b), path
+        for key in a:
+            _same_state(a[key], b[key], f"{path}.{key}")
+    elif isinstance(a, list):
+        assert len(a) == len(b), path
+        for i, (x, y) in enumerate(zip(a, b)):
+            _same_state(x, y, f"{path}[{i}]")
+    elif hasattr(a, '__dict__'):
+        _same_state(vars(a), vars(b), path)
+    elif isinstance(a, float) and np.isnan(a):
+        assert np.isnan(b), path
+    else:
+        assert a == b or (a is pd.NaT and b is pd.NaT), (path, a, b)
+
+
+def _orders(n: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'order_id': rng.integers(0, 400, n),  # Few distinct rows, so many repeat across runs
+        'region': rng.choice(['north', 'south', None], n),
+        'amount': rng.integers(1, 5, n).astype(float)
+    })
+
+
+@pytest.mark.parametrize('sketch', [False, True])
+def test_profile_state_round_trips(tmp_path, sketch):
+    path = str(tmp_path / 'orders.csv')
+    _orders(5000, 1).to_csv(path, index=False)
+    generator = CSVPPTGenerator()
+    generator.categorical_sketch = sketch
+    state = generator._build_csv_state(path, 1500)
+    store = ProfileStore(cache_dir=str(tmp_path / 'cache'))
+
+    assert store.put('orders', state)
+    restored = store.get('orders')
+    _same_state(state, restored)
+
+    # The restored state keeps folding chunks exactly as the original does
+    chunk = _orders(300, 2)
+    generator._fold_chunks(state['profile'], [chunk.copy()], state['plan'])
+    generator._fold_chunks(restored['profile'], [chunk.copy()], restored['plan'])
+    _same_state(state, restored)
+
+
+def test_partial_analysis_round_trips(tmp_path):
+    analysis = LazyAnalysis({'file_name': 'orders.csv', 'shape': (3, 2), 'when': pd.Timestamp('2024-05-01')})
+    analysis.define('total', lambda a: np.int64(42))
+    analysis.define('unread', lambda a: 1 / 0)
+    analysis['total']  # Computed, so stored; 'unread' stays pending
+    store = AnalysisStore(cache_dir=str(tmp_path))
+
+    assert store.put('orders', analysis)
+    restored = store.get('orders')
+
+    assert isinstance(restored, PartialAnalysis)
+    assert dict(restored) == {'file_name': 'orders.csv', 'shape': (3, 2), 'when': pd.Timestamp('2024-05-01'),
+                              'total': 42}
+    assert store.get('missing') is None
+
+
+def test_incremental_run_folds_appended_rows_and_drops_duplicates(tmp_path):
+    path = str(tmp_path / 'orders.csv')
+    _orders(3000, 1).to_csv(path, index=False)
+
+    def run(mode):
+        generator = CSVPPTGenerator()
+        generator.profile_store = ProfileStore(cache_dir=str(tmp_path / 'cache'))
+        generator.frame_cache.enabled = generator.analysis_store.enabled = False
+        return generator.load_and_analyze_data(path, analysis_mode=mode)
+
+    first = run('incremental')
+    appended = _orders(1000, 2)
+    appended.iloc[:200] = pd.read_csv(path).iloc[:200].to_numpy()  # Rows the first run already counted
+    appended.to_csv(path, mode='a', header=False, index=False)
+    incremental = run('incremental')
+    stream = run('stream')  # Profiles the whole file in one pass
+
+    assert incremental['shape'] == stream['shape']
+    assert incremental['source_metadata']['rows_added'] == incremental['shape'][0] - first['shape'][0]
+    assert incremental['source_metadata']['rows_added'] < 800
+    assert incremental['missing_values'] == stream['missing_values']
+    assert incremental['categorical_insights'] == stream['categorical_insights']
+    for col, insight in stream['numeric_insights'].items():
+        for stat, value in insight.items():
+            assert incremental['numeric_insights'][col][stat] == pytest.approx(value, rel=1e-12), (col, stat)
@@ -0,0 +1,86 @@
+"""
+Excel Reader Tests
+Defined names and A1 references resolve to the sheet and cell bounds they
+cover, a reference that is neither is rejected, and range reads load only
+the cells inside the area
+"""
+
+import pytest
+from openpyxl import Workbook
+from openpyxl.workbook.defined_name import DefinedName
+
+from advanced_ppt_generator import CSVPPTGenerator
+from excel_reader import ExcelSession
+
+
+@pytest.fixture
+def workbook_path(tmp_path) -> str:
+    workbook = Workbook()
+    sales = workbook.active
+    sales.title = 'Sales'
+    sales.append(['region', 'amount'])
+    for i in range(10):
+        sales.append([f"r{i % 3}", i * 10])
+    costs = workbook.create_sheet('Cost Centres')
+    costs.append(['centre', 'cost'])
+    for i in range(6):
+        costs.append([f"c{i}", i + 0.5])
+    workbook.defined_names['SalesTable'] = DefinedName('SalesTable', attr_text='Sales!$A$1:$B$11')
+    workbook.defined_names['CostTable'] = DefinedName('CostTable', attr_text="'Cost Centres'!$A$1:$B$4")
+    path = tmp_path / 'book.xlsx'
+    workbook.save(path)
+    return str(path)
+
+
+def test_defined_name_resolves_to_its_bounds(workbook_path):
+    with ExcelSession(workbook_path) as session:
+        assert session.resolve_range('SalesTable') == ('Sales', (1, 1, 11, 2))
+        assert session.resolve_range('salestable') == ('Sales', (1, 1, 11, 2))  # Names are case-insensitive
+
+
+def test_defined_name_on_another_sheet_overrides_the_default_sheet(workbook_path):
+    with ExcelSession(workbook_path) as session:
+        assert session.resolve_range('CostTable', default_sheet='Sales') == ('Cost Centres', (1, 1, 4, 2))
+
+
+def test_a1_references_resolve_against_the_default_sheet(workbook_path):
+    with ExcelSession(workbook_path) as session:
+        assert session.resolve_range('B2:B5', default_sheet='Cost Centres') == ('Cost Centres', (2, 2, 5, 2))
+        assert session.resolve_range("'Cost Centres'!A:B") == ('Cost Centres', (1, 1, None, 2))
+        assert session.resolve_range('2:4') == ('Sales', (2, 1, 4, None))
+
+
+@pytest.mark.parametrize('reference', ['Sales', 'Totals', 'A1:C', 'XFE1'])
+def test_unknown_name_is_rejected(workbook_path, reference):
+    with ExcelSession(workbook_path) as session:
+        with pytest.raises(ValueError, match='Unknown named range'):
+            session.resolve_range(reference)
+
+
+def test_range_read_returns_only_the_cells_in_the_area(workbook_path):
+    with ExcelSession(workbook_path) as session:
+        df = session.read_range(*session.resolve_range('CostTable'))
+        assert df.columns.tolist() == ['centre', 'cost']
+        assert df.to_dict('list') == {'centre': ['c0', 'c1', 'c2'], 'cost': [0.5, 1.5, 2.5]}
+
+        amounts = session.read_range(*session.resolve_range('B1:B4', default_sheet='Sales'))
+        assert amounts.to_dict('list') == {'amount': [0, 10, 20]}
+
+
+def test_open_ended_ranges_stop_at_the_sheet_data(workbook_path):
+    with ExcelSession(workbook_path) as session:
+        whole_columns = session.read_range(*session.resolve_range("'Cost Centres'!A:B"))
+        assert len(whole_columns) == 6
+        rows = session.read_range(*session.resolve_range('Sales!5:7'))
+        assert rows.shape == (2, 2)
+        assert rows.columns.tolist() == ['r0', '30']  # The area's first row is its header
+        assert rows['30'].tolist() == [40, 50]
+
+
+def test_generator_loads_a_named_range(workbook_path):
+    generator = CSVPPTGenerator()
+    generator.frame_cache.enabled = False
+    with ExcelSession(workbook_path) as session:
+        df = generator._read_excel_sheet(session, named_range='SalesTable')
+    assert df.shape == (10, 2)
+    assert df['amount'].sum() == 450
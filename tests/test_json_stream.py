@@ -0,0 +1,70 @@
+"""
+JSON Stream Tests
+Array elements come out as soon as each one closes, however the response
+text is split into pieces
+"""
+
+import json
+
+import pytest
+
+from json_stream import JSONStreamExtractor
+
+RESPONSE = 'Here is the deck:\n```json\n' + json.dumps({
+    "title": "Sales {draft}",
+    "notes": "quote \" and brace } inside a string",
+    "slides": [{"title": "Overview", "recommended_charts": [{"type": "nested"}]}],
+    "recommended_charts": [
+        {"type": "bar", "x_column": "region", "y_column": "sales", "title": "Sales by region"},
+        {"type": "pie", "x_column": "region", "title": "Share \\ of {sales}", "options": {"labels": [1, 2]}},
+        {"type": "line", "x_column": "month", "y_column": "sales", "title": "Trend"}
+    ],
+    "key_insights": ["first", "second"]
+}, indent=2) + '\n```\nLet me know if you need more.'
+
+EXPECTED = json.loads(RESPONSE[RESPONSE.index('{'):RESPONSE.rindex('}') + 1])
+
+
+def _stream(pieces):
+    extractor = JSONStreamExtractor('recommended_charts')
+    elements = []
+    for piece in pieces:
+        elements.extend(extractor.feed(piece))
+    return extractor, elements
+
+
+@pytest.mark.parametrize('size', [1, 2, 7, 64, len(RESPONSE)])
+def test_elements_are_extracted_from_split_pieces(size):
+    pieces = [RESPONSE[start:start + size] for start in range(0, len(RESPONSE), size)]
+    extractor, elements = _stream(pieces)
+
+    assert elements == EXPECTED['recommended_charts']
+    assert extractor.document() == EXPECTED
+    assert extractor.text == RESPONSE
+
+
+def test_each_element_arrives_with_its_closing_brace():
+    extractor = JSONStreamExtractor('recommended_charts')
+    positions = [i for i, ch in enumerate(RESPONSE) for _ in extractor.feed(ch)]
+
+    assert len(positions) == len(EXPECTED['recommended_charts'])
+    assert all(RESPONSE[i] == '}' for i in positions)
+    assert positions[-1] < RESPONSE.index('"key_insights"')  # Before the rest of the object has arrived
+
+
+def test_document_is_none_until_the_object_closes():
+    extractor = JSONStreamExtractor('recommended_charts')
+    cut = RESPONSE.rindex('}')
+    extractor.feed(RESPONSE[:cut])
+    assert extractor.document() is None
+    extractor.feed(RESPONSE[cut:])
+    assert extractor.document() == EXPECTED
+    assert extractor.feed('{"recommended_charts": [{"late": true}]}') == []  # Text after the object is ignored
+
+
+def test_malformed_element_is_skipped_for_the_final_parse_to_reject():
+    extractor = JSONStreamExtractor('recommended_charts')
+    elements = extractor.feed('{"recommended_charts": [{"type": "bar",}, {"type": "pie"}]}')
+    assert elements == [{"type": "pie"}]
+    with pytest.raises(ValueError):
+        extractor.document()
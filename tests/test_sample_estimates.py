@@ -0,0 +1,99 @@
+"""
+Sample Estimate Tests
+Confidence intervals narrow with the finite-population correction, correlation
+intervals follow the Fisher transform, and an exact run replaces a preview
+"""
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from advanced_ppt_generator import CSVPPTGenerator
+from sample_estimates import estimate_intervals
+
+
+@pytest.fixture
+def sample() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    x = rng.normal(0, 1, 200)
+    return pd.DataFrame({
+        'x': x,
+        'y': x * 0.6 + rng.normal(0, 1, 200),
+        'z': rng.normal(5, 2, 200),
+        'group': rng.choice(['a', 'b', 'c'], 200)
+    })
+
+
+def _widths(estimates):
+    """Width of every interval, keyed by its path in the estimates"""
+    widths = {}
+    for col, interval in estimates['means'].items():
+        widths[('means', col)] = interval['high'] - interval['low']
+    for col, by_quantile in estimates['quantiles'].items():
+        for q, interval in by_quantile.items():
+            widths[('quantiles', col, q)] = interval['high'] - interval['low']
+    for col, shares in estimates['category_shares'].items():
+        for value, interval in shares.items():
+            widths[('category_shares', col, value)] = interval['high'] - interval['low']
+    for col1, row in estimates['correlations'].items():
+        for col2, interval in row.items():
+            widths[('correlations', col1, col2)] = interval['high'] - interval['low']
+    return widths
+
+
+def test_every_interval_narrows_with_the_population_correction(sample):
+    numeric, categorical = ['x', 'y', 'z'], ['group']
+    infinite = _widths(estimate_intervals(sample, numeric, categorical, None))
+    finite = _widths(estimate_intervals(sample, numeric, categorical, 250))
+    whole = _widths(estimate_intervals(sample, numeric, categorical, len(sample)))
+
+    assert {key[0] for key in infinite} == {'means', 'quantiles', 'category_shares', 'correlations'}
+    assert infinite.keys() == finite.keys() == whole.keys()
+    for key, width in infinite.items():
+        assert finite[key] < width, key
+        assert whole[key] == pytest.approx(0, abs=1e-9), key
+
+
+def test_correlation_intervals_match_the_fisher_transform(sample):
+    sample.loc[:9, 'z'] = np.nan  # Pairs with z have fewer complete rows
+    population = 1000
+    estimates = estimate_intervals(sample, ['x', 'y', 'z'], [], population)
+    fpc = math.sqrt((population - len(sample)) / (population - 1))
+    z = 1.959964
+    for col1, col2 in [('x', 'y'), ('x', 'z'), ('y', 'z')]:
+        pair = sample[[col1, col2]].dropna()
+        r = pair[col1].corr(pair[col2])
+        margin = z * fpc / math.sqrt(len(pair) - 3)
+        interval = estimates['correlations'][col1][col2]
+        assert interval['estimate'] == pytest.approx(r)
+        assert interval['low'] == pytest.approx(math.tanh(math.atanh(r) - margin), abs=1e-5)
+        assert interval['high'] == pytest.approx(math.tanh(math.atanh(r) + margin), abs=1e-5)
+    assert 'x' not in estimates['correlations'].get('y', {})  # Upper triangle only
+
+
+def test_exact_run_replaces_the_preview(tmp_path):
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame({
+        'amount': rng.normal(100, 15, 400).round(2),
+        'units': rng.integers(1, 20, 400),
+        'region': rng.choice(['north', 'south', 'east'], 400)
+    })
+    path = str(tmp_path / 'sales.csv')
+    df.to_csv(path, index=False)
+
+    generator = CSVPPTGenerator()
+    preview = generator.load_and_analyze_data(path, analysis_mode='preview', sample_size=50)
+    assert preview['source_metadata']['sample_rows'] == 50
+    assert 'estimates' in preview
+
+    exact = generator.load_and_analyze_data(path, analysis_mode='full')
+    replaced = generator.replace_preview_analysis(preview, exact)
+
+    assert replaced is preview
+    assert generator.data_analysis is preview
+    assert 'estimates' not in preview
+    assert preview['source_metadata']['analysis_mode'] == 'full'
+    assert preview['shape'] == df.shape
+    assert preview['summary_stats'] == exact['summary_stats']
@@ -0,0 +1,100 @@
+"""
+Sketch Tests
+HyperLogLog distinct counts and Space-Saving heavy hitters stay within the
+error bounds they report, whether built in one pass or merged from parts
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sketches import CategoricalSketch, HyperLogLog, SpaceSaving, sketch_column
+
+
+@pytest.fixture
+def zipf_values() -> pd.Series:
+    rng = np.random.default_rng(0)
+    return pd.Series([f"v{i}" for i in rng.zipf(1.3, 200_000) % 50_000])
+
+
+@pytest.mark.parametrize('distinct', [50, 5_000, 300_000])
+def test_hyperloglog_estimate_is_within_its_error(distinct):
+    values = pd.Series(np.arange(distinct)).astype(str)
+    sketch = HyperLogLog()
+    sketch.update(values)
+    # Four standard errors: a miss is far rarer than one run in ten thousand
+    assert abs(sketch.estimate() - distinct) <= 4 * sketch.relative_error * distinct
+
+
+def test_hyperloglog_merge_equals_one_sketch_of_the_union():
+    values = pd.Series(np.arange(100_000)).astype(str)
+    whole, left, right = HyperLogLog(), HyperLogLog(), HyperLogLog()
+    whole.update(values)
+    left.update(values.iloc[:60_000])
+    right.update(values.iloc[40_000:])  # Overlapping parts count shared values once
+    left.merge(right)
+    np.testing.assert_array_equal(left.registers, whole.registers)
+    with pytest.raises(ValueError):
+        left.merge(HyperLogLog(precision=10))
+
+
+def _check_space_saving(summary: SpaceSaving, values: pd.Series):
+    exact = values.value_counts()
+    assert summary.total == len(values)
+    assert len(summary.counts) <= summary.capacity
+    for value, count in summary.counts.items():
+        # Never undercounts, and overcounts by at most the recorded error
+        assert count - summary.errors[value] <= exact[value] <= count
+    assert summary.max_error <= len(values) / summary.capacity
+    untracked = exact.drop(summary.counts.index, errors='ignore')
+    assert untracked.max() <= summary.floor
+
+
+def test_space_saving_counts_stay_within_their_errors(zipf_values):
+    summary = SpaceSaving(capacity=200)
+    for start in range(0, len(zipf_values), 10_000):
+        summary.update(zipf_values.iloc[start:start + 10_000])
+    assert not summary.exact
+    _check_space_saving(summary, zipf_values)
+    assert summary.top(5).index.tolist() == zipf_values.value_counts().head(5).index.tolist()
+
+
+def test_merged_space_saving_counts_stay_within_their_errors(zipf_values):
+    parts = []
+    for start in range(0, len(zipf_values), 50_000):
+        part = SpaceSaving(capacity=200)
+        part.update(zipf_values.iloc[start:start + 50_000])
+        parts.append(part)
+    merged = parts[0]
+    for part in parts[1:]:
+        merged.merge(part)
+    _check_space_saving(merged, zipf_values)
+
+
+def test_space_saving_is_exact_below_capacity():
+    values = pd.Series(list('aabbbcdddd'))
+    summary = SpaceSaving(capacity=10)
+    summary.update(values.iloc[:4])
+    summary.update(values.iloc[4:])
+    assert summary.exact and summary.max_error == 0
+    assert summary.top(2).to_dict() == {'d': 4, 'b': 3}
+
+
+def test_categorical_sketch_bounds_contain_the_exact_values(zipf_values):
+    sketch = sketch_column(zipf_values, chunk_rows=20_000, capacity=300)
+    bounds = sketch.error_bounds(5)
+    exact = zipf_values.value_counts()
+
+    assert not bounds['exact']
+    assert bounds['unique_count']['low'] <= zipf_values.nunique() <= bounds['unique_count']['high']
+    for value, count in bounds['top_counts'].items():
+        assert count['low'] <= exact[value] <= count['high']
+
+
+def test_categorical_sketch_is_exact_for_few_values():
+    values = pd.Series(['x', 'y', None, 'x', 'z'] * 20)
+    sketch = CategoricalSketch()
+    sketch.update(values)
+    assert sketch.count == 80
+    assert sketch.unique_count() == 3
+    assert sketch.error_bounds()['unique_count'] == {'estimate': 3, 'low': 3, 'high': 3}
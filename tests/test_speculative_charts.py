@@ -0,0 +1,75 @@
+"""
+Speculative Chart Tests
+Smart default charts drawn while the AI request is in flight are reused for
+recommendations of the same type and columns, and redrawn when retitled
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from advanced_ppt_generator import CSVPPTGenerator
+
+
+@pytest.fixture
+def generator(monkeypatch):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        'region': rng.choice(['north', 'south', 'east'], 60),
+        'revenue': rng.normal(1000, 50, 60),
+        'visits': rng.integers(10, 100, 60)
+    })
+    generator = CSVPPTGenerator()
+    generator.speculative_charts = True
+    generator.drawn = []
+
+    def draw(config):
+        generator.drawn.append((config['chart_type'], config['x_column'], config['y_column'], config['title']))
+        return f"{config['chart_type']}-{config['title']}.png"
+
+    monkeypatch.setattr(generator, 'create_chart_from_data', draw)
+    generator.analysis = generator._perform_data_analysis(df, 'sales.csv', {}, evaluate_summary=False)
+    return generator
+
+
+def _answer(generator, recommended, monkeypatch):
+    """Have the AI answer with these recommended charts, streamed one by one when stream_ai is on"""
+    structure = {'slides': [], 'recommended_charts': recommended}
+
+    def streaming(analysis, on_chart):
+        for rec in recommended:
+            on_chart(rec)
+        return structure
+
+    monkeypatch.setattr(generator, 'generate_insights_with_ai', lambda analysis: structure)
+    monkeypatch.setattr(generator, 'generate_insights_streaming', streaming)
+
+
+@pytest.mark.parametrize('stream_ai', [False, True])
+def test_speculative_render_is_reused(generator, monkeypatch, stream_ai):
+    generator.stream_ai = stream_ai
+    smart = generator._get_smart_chart_recommendations(generator.analysis)
+    kept, retitled = smart[0], dict(smart[1], title='Share of revenue by region')
+    new = {'type': 'scatter', 'x_column': 'visits', 'y_column': 'revenue', 'title': 'Visits and revenue'}
+    _answer(generator, [kept, retitled, new], monkeypatch)
+
+    structure, images = generator._generate_insights_and_charts(generator.analysis)
+
+    kept_key = (kept['type'], kept['x_column'], kept['y_column'])
+    retitled_key = (retitled['type'], retitled['x_column'], retitled['y_column'])
+    assert generator.drawn.count(kept_key + (kept['title'],)) == 1  # Drawn speculatively, reused
+    assert images[kept_key] == f"{kept['type']}-{kept['title']}.png"
+    assert generator.drawn.count(retitled_key + (retitled['title'],)) == 1  # Redrawn once under the AI's title
+    assert images[retitled_key] == f"{retitled['type']}-{retitled['title']}.png"
+    assert images[('scatter', 'visits', 'revenue')] == 'scatter-Visits and revenue.png'
+    assert set(images) == {kept_key, retitled_key, ('scatter', 'visits', 'revenue')}
+
+
+def test_fallback_structure_reuses_every_speculative_render(generator, monkeypatch):
+    smart = generator._get_smart_chart_recommendations(generator.analysis)
+    _answer(generator, smart, monkeypatch)
+
+    _, images = generator._generate_insights_and_charts(generator.analysis)
+
+    assert len(generator.drawn) == len(smart)
+    assert len(images) == len(smart)
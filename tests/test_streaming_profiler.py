@@ -0,0 +1,142 @@
+"""
+Streaming Profiler Tests
+Accumulators built over separate chunks and merged agree with statistics
+computed over all rows at once
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from streaming_profiler import (CorrelationAccumulator, NumericAccumulator, ReservoirSample, RowHashSet,
+                                RowReservoir, StreamingProfile)
+
+
+def _chunks(values, sizes):
+    bounds = np.cumsum([0] + sizes)
+    return [values[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])]
+
+
+@pytest.fixture
+def values() -> np.ndarray:
+    rng = np.random.default_rng(0)
+    values = np.concatenate([rng.lognormal(3, 1, 4000), rng.normal(-50, 2, 1000)])  # Skewed, two scales
+    values[rng.choice(len(values), 200, replace=False)] = np.nan
+    return values
+
+
+def test_merged_moments_match_the_whole_column(values):
+    merged = NumericAccumulator()
+    for chunk in _chunks(values, [1, 2, 997, 1500, 2500]):
+        part = NumericAccumulator()
+        part.update(chunk)
+        merged.merge(part)
+    merged.merge(NumericAccumulator())  # An empty part changes nothing
+
+    column = pd.Series(values)
+    assert merged.count == column.count()
+    assert merged.mean == pytest.approx(column.mean(), rel=1e-12)
+    assert merged.std() == pytest.approx(column.std(), rel=1e-10)
+    assert merged.skew() == pytest.approx(column.skew(), rel=1e-9)
+    assert (merged.min, merged.max) == (column.min(), column.max())
+
+
+def test_updates_and_merges_agree(values):
+    updated, merged = NumericAccumulator(), NumericAccumulator()
+    for chunk in _chunks(values, [1000] * 5):
+        updated.update(chunk)
+        part = NumericAccumulator()
+        part.update(chunk)
+        merged.merge(part)
+    assert merged.mean == pytest.approx(updated.mean, rel=1e-12)
+    assert merged.m2 == pytest.approx(updated.m2, rel=1e-10)
+    assert merged.m3 == pytest.approx(updated.m3, rel=1e-9)
+
+
+def test_merged_reservoirs_keep_the_smallest_keys_of_both():
+    rng = np.random.default_rng(1)
+    left, right = ReservoirSample(100, seed=1), ReservoirSample(100, seed=2)
+    left.update(rng.normal(size=1000))
+    right.update(rng.normal(size=300))
+    keys = np.concatenate([left.keys, right.keys])
+    values = np.concatenate([left.values, right.values])
+
+    left.merge(right)
+
+    smallest = np.argsort(keys)[:100]
+    assert len(left.values) == 100
+    assert sorted(left.keys) == sorted(keys[smallest])
+    assert sorted(left.values) == sorted(values[smallest])
+
+
+def test_small_reservoir_keeps_every_value():
+    sample = ReservoirSample(100, seed=0)
+    sample.update(np.arange(40.0))
+    other = ReservoirSample(100, seed=1)
+    other.update(np.arange(40.0, 70.0))
+    sample.merge(other)
+    assert sorted(sample.values) == list(np.arange(70.0))
+
+
+def test_row_reservoir_merge_is_bounded_and_draws_from_both():
+    left, right = RowReservoir(50, seed=0), RowReservoir(50, seed=1)
+    left.update(pd.DataFrame({'part': ['left'] * 500, 'n': np.arange(500)}))
+    right.update(pd.DataFrame({'part': ['right'] * 500, 'n': np.arange(500)}))
+    left.merge(right)
+    frame = left.to_frame()
+    assert len(frame) == 50
+    assert set(frame['part']) == {'left', 'right'}
+    assert frame.index.tolist() == list(range(50))
+
+
+def test_merged_co_moments_match_pairwise_complete_correlations():
+    rng = np.random.default_rng(2)
+    x = rng.normal(1000, 10, 3000)
+    df = pd.DataFrame({'x': x, 'y': 0.5 * x + rng.normal(0, 5, 3000), 'z': rng.uniform(-1, 1, 3000)})
+    df = df.mask(rng.random(df.shape) < 0.1)
+    columns = df.columns.tolist()
+
+    merged = CorrelationAccumulator(columns)
+    for chunk in _chunks(df.to_numpy(), [10, 990, 2000]):
+        part = CorrelationAccumulator(columns)
+        part.update(chunk)
+        merged.merge(part)  # Each part is shifted by its own means and re-based on merging
+
+    np.testing.assert_allclose(merged.matrix(), df.corr().to_numpy(), atol=1e-10)
+
+
+def test_merged_profiles_match_one_profile_over_every_chunk():
+    rng = np.random.default_rng(3)
+    df = pd.DataFrame({
+        'amount': rng.normal(100, 20, 2000),
+        'units': rng.integers(0, 50, 2000).astype(float),
+        'region': rng.choice(['north', 'south', 'east', None], 2000)
+    })
+    df.loc[rng.choice(2000, 100, replace=False), 'amount'] = np.nan
+    whole = StreamingProfile(seed=0)
+    merged = StreamingProfile(seed=0)
+    for chunk in _chunks(df, [700, 600, 700]):
+        whole.update(chunk)
+        part = StreamingProfile(seed=0)
+        part.update(chunk)
+        merged.merge(part)
+
+    assert (merged.rows, merged.complete_rows, merged.null_counts) == (whole.rows, whole.complete_rows, whole.null_counts)
+    for col in ['amount', 'units']:
+        for stat, value in whole.numeric_summary(col).items():
+            assert merged.numeric_summary(col)[stat] == pytest.approx(value, rel=1e-10), (col, stat)
+    pd.testing.assert_series_equal(merged.categorical['region'].top(), whole.categorical['region'].top())
+    pd.testing.assert_frame_equal(merged.correlation_frame(), whole.correlation_frame(), atol=1e-12)
+
+
+def test_row_hash_set_drops_duplicates_within_and_across_chunks():
+    seen = RowHashSet()
+    first = pd.DataFrame({'id': [1, 2, 2, 3], 'label': ['a', 'b', 'b', 'c']})
+    second = pd.DataFrame({'id': [3, 4, 1, 4], 'label': ['c', 'd', 'x', 'd']})
+    assert seen.add_new(first).tolist() == [True, True, False, True]
+    assert seen.add_new(second).tolist() == [False, True, True, False]
+    assert len(seen) == 5
+    for n in range(20):  # Many small runs still find every earlier row
+        seen.add_new(pd.DataFrame({'id': [100 + n], 'label': ['n']}))
+    assert not seen.add_new(first).any()
+    assert len(seen.runs) <= 5